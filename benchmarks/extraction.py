@@ -0,0 +1,210 @@
+"""
+extraction.py – speed, memory and preview acceptance of each article extractor.
+
+Runs every extractor over a stored corpus of publisher HTML pages and reports,
+per extractor and per domain, the median time, peak traced memory and the
+share of pages whose preview passes ``collect_rfps._validate_preview_text``.
+
+Candidates are the HTML extractors of ``extract_preview`` (trafilatura,
+readability) and the regex path of ``collect_rfps`` (first meaningful
+``<p>``, falling back to the visible text).  Jina renders pages remotely, so
+it cannot be measured offline; it stays last in every learned order.
+
+``--write-order`` turns the results into ``data/extractor_order.json``: per
+domain with at least ``--min-pages`` pages, extract_preview's extractors
+sorted by expected cost per accepted preview (median time / acceptance), so
+each page tries the cheapest extractor that works for its domain first.
+
+A corpus is a directory of ``<domain>/<page>.html`` files or a replay archive
+(``benchmarks/replay.py``), whose HTML responses are used.
+
+    python benchmarks/extraction.py --corpus /tmp/synth.json.gz
+    python benchmarks/extraction.py --corpus corpus/ --write-order --report /tmp/extraction.json
+"""
+
+import argparse
+import base64
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+import collect_rfps  # noqa: E402
+import extract_preview  # noqa: E402
+
+# name, url, html
+Page = tuple[str, str, str]
+
+
+def _regex_text(html: str) -> str:
+    return collect_rfps._extract_first_meaningful_paragraph(html) or collect_rfps._extract_visible_text(html)
+
+
+EXTRACTORS: dict[str, Callable[[str], str]] = {**extract_preview.HTML_EXTRACTORS, "regex": _regex_text}
+
+
+def load_corpus(path: str) -> list[Page]:
+    """HTML pages from a ``<domain>/<page>.html`` directory or a replay archive."""
+    pages: list[Page] = []
+    if os.path.isdir(path):
+        for dirpath, _, filenames in sorted(os.walk(path)):
+            for filename in sorted(filenames):
+                if not filename.endswith((".html", ".htm")):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                relative = os.path.relpath(full_path, path).replace(os.sep, "/")
+                with open(full_path, "r", encoding="utf-8", errors="replace") as fh:
+                    pages.append((relative, f"https://{relative}", fh.read()))
+        return pages
+
+    from replay import Archive
+
+    for key, record in sorted(Archive.load(path).responses.items()):
+        method, _, url = key.partition(" ")
+        headers = {key.lower(): value for key, value in record.get("headers", {}).items()}
+        content_type = str(headers.get("content-type", ""))
+        if method != "GET" or int(record.get("status", 0)) != 200 or "html" not in content_type.lower():
+            continue
+        html = base64.b64decode(record.get("body", "")).decode("utf-8", errors="replace")
+        pages.append((url, url, html))
+    return pages
+
+
+def measure_page(name: str, html: str) -> dict:
+    """Time one extractor on one page, then trace its peak memory in a second, untimed pass."""
+    extractor = EXTRACTORS[name]
+    started = time.perf_counter()
+    try:
+        text = extractor(html)
+    except Exception:  # noqa: BLE001
+        text = ""
+    elapsed = time.perf_counter() - started
+    preview = extract_preview.preview_from_text(text)
+    accepted = bool(preview and collect_rfps._validate_preview_text(preview))
+
+    tracemalloc.start()
+    try:
+        extractor(html)
+    except Exception:  # noqa: BLE001
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_bytes": peak, "accepted": accepted}
+
+
+def _summarise(samples: list[dict]) -> dict:
+    return {
+        "pages": len(samples),
+        "median_ms": round(statistics.median(s["seconds"] for s in samples) * 1000, 3),
+        "peak_kb": round(statistics.median(s["peak_bytes"] for s in samples) / 1024, 1),
+        "acceptance": round(sum(s["accepted"] for s in samples) / len(samples), 3),
+    }
+
+
+def run_benchmark(pages: list[Page], names: list[str]) -> dict:
+    """Per-extractor results overall and per domain."""
+    samples: dict[str, dict[str, list[dict]]] = {name: {} for name in names}
+    for _, url, html in pages:
+        domain = extract_preview._domain(url)
+        for name in names:
+            samples[name].setdefault(domain, []).append(measure_page(name, html))
+    results: dict[str, dict] = {}
+    for name, by_domain in samples.items():
+        everything = [sample for domain_samples in by_domain.values() for sample in domain_samples]
+        if not everything:
+            continue
+        results[name] = {
+            "overall": _summarise(everything),
+            "domains": {domain: _summarise(domain_samples) for domain, domain_samples in sorted(by_domain.items())},
+        }
+    return results
+
+
+def _ranked(stats: dict[str, dict]) -> list[str]:
+    """Extractor names by expected cost per accepted preview; never-accepting ones last."""
+
+    def cost(name: str) -> tuple[bool, float]:
+        entry = stats[name]
+        if not entry["acceptance"]:
+            return (True, entry["median_ms"])
+        return (False, entry["median_ms"] / entry["acceptance"])
+
+    return sorted(stats, key=cost)
+
+
+def learn_order(results: dict, min_pages: int = 3) -> dict:
+    """``extractor_order.json`` payload: cheapest working extractor first, per domain and overall."""
+    usable = [name for name in extract_preview.DEFAULT_ORDER if name in results]
+    default = _ranked({name: results[name]["overall"] for name in usable})
+    domains: dict[str, list[str]] = {}
+    all_domains = sorted({domain for name in usable for domain in results[name]["domains"]})
+    for domain in all_domains:
+        stats = {name: results[name]["domains"][domain] for name in usable if domain in results[name]["domains"]}
+        if not stats or min(entry["pages"] for entry in stats.values()) < min_pages:
+            continue
+        order = list(extract_preview._complete_order(_ranked(stats)))
+        if order != list(extract_preview._complete_order(default)):
+            domains[domain] = order
+    return {"version": 1, "default": list(extract_preview._complete_order(default)), "domains": domains}
+
+
+def _print_results(results: dict) -> None:
+    print(f"{'extractor':12} {'domain':28} {'pages':>5} {'median ms':>10} {'peak KB':>9} {'accepted':>9}")
+    for name, result in results.items():
+        rows = [("(all)", result["overall"])] + list(result["domains"].items())
+        for domain, stats in rows:
+            print(
+                f"{name:12} {domain[:28]:28} {stats['pages']:>5} {stats['median_ms']:>10.2f}"
+                f" {stats['peak_kb']:>9.1f} {stats['acceptance']:>9.0%}"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", action="append", required=True, help="HTML directory or replay archive")
+    parser.add_argument("--only", default=",".join(EXTRACTORS), help="comma-separated extractor names")
+    parser.add_argument("--min-pages", type=int, default=3, help="pages a domain needs for its own order")
+    parser.add_argument(
+        "--write-order",
+        nargs="?",
+        const=extract_preview.EXTRACTOR_ORDER_PATH,
+        default="",
+        help="write the learned per-domain order (default path: data/extractor_order.json)",
+    )
+    parser.add_argument("--report", default="", help="write the full results as JSON")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXTRACTORS]
+    if unknown:
+        parser.error(f"unknown extractor(s): {', '.join(unknown)}; choose from {', '.join(EXTRACTORS)}")
+
+    pages = [page for path in args.corpus for page in load_corpus(path)]
+    if not pages:
+        print("no HTML pages found in the corpus")
+        return 1
+    results = run_benchmark(pages, names)
+    _print_results(results)
+
+    order = learn_order(results, args.min_pages)
+    print(f"default order: {', '.join(order['default'])}; {len(order['domains'])} domain override(s)")
+    if args.write_order:
+        os.makedirs(os.path.dirname(os.path.abspath(args.write_order)), exist_ok=True)
+        with open(args.write_order, "w", encoding="utf-8") as fh:
+            json.dump(order, fh, indent=2, sort_keys=True)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as fh:
+            json.dump({"pages": len(pages), "results": results, "order": order}, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
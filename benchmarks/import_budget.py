@@ -0,0 +1,82 @@
+"""
+import_budget.py – start-up cost of the collector scripts, checked against a budget.
+
+Each module is imported in a fresh interpreter several times and the median
+wall time is compared with ``BUDGET_MS``.  The heavy third-party stack
+(feedparser, requests, yaml, dateutil, trafilatura, readability, bs4, lxml)
+must not be loaded by the import itself; it is pulled in lazily on first use.
+
+    python benchmarks/import_budget.py            # report, exit 1 on a breach
+    python benchmarks/import_budget.py --runs 9
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+
+# Median import time per module, in milliseconds, with headroom for slower CI runners.
+BUDGET_MS = {
+    "collect_rfps": 150,
+    "build_pdf_publications": 80,
+    "build_bd_opps": 80,
+    "build_exec_brief_snappy": 60,
+}
+HEAVY_MODULES = ("feedparser", "requests", "yaml", "dateutil", "trafilatura", "readability", "bs4", "lxml")
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {scripts!r})
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"ms": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    """Median import time of ``module`` over ``runs`` fresh interpreters.
+
+    One extra leading run warms the bytecode cache and is discarded.
+    """
+    samples: list[float] = []
+    heavy: list[str] = []
+    probe = _PROBE.format(scripts=SCRIPTS_DIR, module=module, heavy=HEAVY_MODULES)
+    for _ in range(runs + 1):
+        completed = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT_DIR,
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        samples.append(float(result["ms"]))
+        heavy = result["heavy"]
+    return {"median_ms": round(statistics.median(samples[1:]), 1), "heavy": heavy}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module, budget in BUDGET_MS.items():
+        result = measure(module, max(1, args.runs))
+        over_budget = result["median_ms"] > budget
+        status = "FAIL" if over_budget or result["heavy"] else "ok"
+        failures += status == "FAIL"
+        heavy = f"  eager: {', '.join(result['heavy'])}" if result["heavy"] else ""
+        print(f"{status:4} {module:26} {result['median_ms']:7.1f} ms  (budget {budget} ms){heavy}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
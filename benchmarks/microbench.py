@@ -0,0 +1,337 @@
+"""
+microbench.py – timings for the collector's CPU hot paths on synthetic corpora.
+
+Each benchmark runs one function from ``collect_rfps`` over a deterministic
+corpus of 1k, 10k or 100k feed entries.  Inputs are built outside the timed
+region, memo caches are cleared before every repetition so each timing is a
+cold run, and the median of ``--repeat`` runs is reported.  A size whose
+estimate (scaled linearly from the previous size) exceeds ``--budget-s`` is
+recorded as skipped rather than left to run for hours.
+
+Results can be saved as a JSON baseline and later compared against: any
+benchmark whose median grows by more than ``--threshold`` (and by more than
+``--min-delta-ms``, to ignore noise on tiny timings) is flagged and the
+command exits 1.
+
+    python benchmarks/microbench.py --save /tmp/before.json
+    python benchmarks/microbench.py --compare /tmp/before.json --threshold 0.15
+    python benchmarks/microbench.py --sizes 1000,10000,100000 --only deduplicate,score_and_rank
+"""
+
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+import collect_rfps  # noqa: E402
+from feed_entry import FeedEntry  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+NOW = datetime(2026, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+_SUBJECTS = ("PDVSA", "Chevron", "Venezuela's central bank", "The agriculture ministry", "Caracas officials",
+             "Health authorities", "The finance ministry", "Port operators", "Teachers' unions", "Mining firms",
+             "El Gobierno de Venezuela", "La Asamblea Nacional")
+_ACTIONS = ("announces", "delays", "expands", "reviews", "suspends", "approves", "tenders", "renegotiates",
+            "launches", "audits", "anuncia", "aprueba")
+_OBJECTS = ("oil export licences", "fertilizer imports", "a bond restructuring", "hospital water upgrades",
+            "a gold mining concession", "food distribution contracts", "an exchange rate band",
+            "vocational training grants", "Orinoco gas projects", "a procurement portal for RFPs",
+            "un plan de inversión eléctrica", "nuevas sanciones petroleras")
+_DOMAINS = ("reuters.com", "apnews.com", "efectococuyo.com", "elpitazo.net", "talcualdigital.com",
+            "bancaynegocios.com", "reliefweb.int", "worldbank.org", "iadb.org", "caracaschronicles.com",
+            "news.google.com", "bloomberg.com")
+_FIGURES = ("$120 million", "15%", "2.4 billion bolívares", "800,000 barrels per day", "US$35m", "3.1% of GDP")
+_PREVIEWS = (
+    "Venezuela's oil output rose to {fig} in May, according to OPEC secondary sources. "
+    "The increase follows new licences granted to foreign partners.",
+    "By Staff Writer | Caracas (Reuters) - Officials said {fig} would be allocated. Read more at the site...",
+    "La producción petrolera de Venezuela alcanzó {fig} en mayo, según fuentes secundarias de la OPEP. "
+    "El aumento sigue a nuevas licencias otorgadas a socios extranjeros.",
+    "Subscribe to our newsletter to keep reading this story and many more.",
+    "Google News: top stories about Venezuela",
+)
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def make_entries(n: int, seed: int = 7) -> list[FeedEntry]:
+    """``n`` feed entries shaped like ``fetch_feed`` output; about a tenth are near-duplicates."""
+    rnd = random.Random(seed)
+    entries: list[FeedEntry] = []
+    for idx in range(n):
+        if entries and rnd.random() < 0.1:
+            original = entries[rnd.randrange(len(entries))]
+            title = f"{original['title']} - update"
+        else:
+            title = f"Venezuela: {rnd.choice(_SUBJECTS)} {rnd.choice(_ACTIONS)} {rnd.choice(_OBJECTS)} #{idx}"
+        domain = rnd.choice(_DOMAINS)
+        figure = rnd.choice(_FIGURES)
+        summary = (
+            f"{title}. Officials in Caracas said the measure, worth {figure}, affects oil, agriculture "
+            f"and health programmes in Venezuela. Analysts expect sanctions relief to shape investment."
+        )
+        slug = f"story-{idx}-{rnd.randrange(10**6)}"
+        entries.append(
+            FeedEntry(
+                title=title,
+                link=f"https://{domain}/{NOW:%Y/%m}/{slug}",
+                summary=summary,
+                content="",
+                snippet="",
+                publisher_url=f"https://{domain}",
+                publisher=domain.split(".")[0].title(),
+                author="",
+                guid=slug,
+                categories=[],
+                published=NOW - timedelta(hours=rnd.randint(0, 24 * 14)),
+                source_url=f"https://{domain}/rss",
+                source_domain=domain,
+            )
+        )
+    return entries
+
+
+def make_texts(n: int, seed: int = 7) -> list[str]:
+    """Preview-like texts: clean English and Spanish, bylines, boilerplate and paywall stubs."""
+    rnd = random.Random(seed)
+    return [rnd.choice(_PREVIEWS).format(fig=rnd.choice(_FIGURES)) + f" Ref {idx}." for idx in range(n)]
+
+
+def make_items(entries: list[dict], cfg: dict) -> tuple[list[dict], dict[str, dict]]:
+    """Normalised latest.json items and per-sector synthesis, as ``run`` hands to ``_build_highlights``."""
+    items: list[dict] = []
+    for idx, entry in enumerate(entries):
+        collect_rfps._annotate_intelligence(entry)
+        text = str(entry.get("summary", ""))
+        item = {
+            "id": f"item-{idx}",
+            "title": str(entry.get("title", "")),
+            "url": str(entry.get("link", "")),
+            "publisher": str(entry.get("publisher", "")),
+            "publishedAt": entry["published"].strftime("%Y-%m-%d"),
+            "sector": collect_rfps.detect_sector_label(entry, cfg),
+            "snippet": text[:280],
+            "event_types": list(entry.get("event_types", [])),
+            "sentiment": str(entry.get("sentiment", "Neutral")),
+            "materiality": int(entry.get("materiality", 1) or 1),
+            "risk_score": int(entry.get("risk_score", 0) or 0),
+            "entities": list(entry.get("entities", [])),
+            "metrics": {"numbers": collect_rfps._extract_numbers(text)},
+        }
+        item["insight2"] = collect_rfps._generate_insight2(item, text)
+        items.append(item)
+    by_sector: dict[str, list[dict]] = {}
+    for item in items:
+        by_sector.setdefault(item["sector"], []).append(item)
+    synth = {sector: collect_rfps._build_sector_synth(sector, group[:12]) for sector, group in by_sector.items()}
+    return items, synth
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+# name -> setup(n, cfg) returning the zero-argument callable to time.
+BENCHMARKS: dict[str, Callable[[int, dict], Callable[[], object]]] = {}
+
+
+def benchmark(func: Callable[[int, dict], Callable[[], object]]) -> Callable[[int, dict], Callable[[], object]]:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+@functools.lru_cache(maxsize=None)
+def _filtered(n: int) -> tuple:
+    cfg = collect_rfps.load_config(os.path.join(ROOT_DIR, "config.yml"))
+    return tuple(collect_rfps.filter_entries(make_entries(n), cfg, NOW))
+
+
+@benchmark
+def filter_entries(n: int, cfg: dict) -> Callable[[], object]:
+    entries = make_entries(n)
+    return lambda: collect_rfps.filter_entries(entries, cfg, NOW)
+
+
+@benchmark
+def deduplicate(n: int, cfg: dict) -> Callable[[], object]:
+    entries = list(_filtered(n))
+    return lambda: collect_rfps.deduplicate(entries, cfg=cfg)
+
+
+@benchmark
+def score_and_rank(n: int, cfg: dict) -> Callable[[], object]:
+    entries = list(_filtered(n))
+    return lambda: collect_rfps.score_and_rank(entries, cfg, NOW)
+
+
+@benchmark
+def select_diverse_top_entries(n: int, cfg: dict) -> Callable[[], object]:
+    ranked = collect_rfps.score_and_rank(list(_filtered(n)), cfg, NOW)
+    max_results = int(cfg.get("max_results", 40))
+    return lambda: collect_rfps.select_diverse_top_entries(ranked, cfg, max_results)
+
+
+@benchmark
+def annotate_intelligence(n: int, cfg: dict) -> Callable[[], object]:
+    entries = make_entries(n)
+
+    def run() -> None:
+        for entry in entries:
+            collect_rfps._annotate_intelligence(entry)
+
+    return run
+
+
+@benchmark
+def extract_numbers(n: int, cfg: dict) -> Callable[[], object]:
+    texts = [str(entry["summary"]) for entry in make_entries(n)]
+    return lambda: [collect_rfps._extract_numbers(text) for text in texts]
+
+
+@benchmark
+def validate_preview_text(n: int, cfg: dict) -> Callable[[], object]:
+    texts = make_texts(n)
+    return lambda: [collect_rfps._validate_preview_text(text) for text in texts]
+
+
+@benchmark
+def build_highlights(n: int, cfg: dict) -> Callable[[], object]:
+    items, synth = make_items(make_entries(n), cfg)
+    return lambda: collect_rfps._build_highlights(items, synth)
+
+
+@benchmark
+def detect_content_language(n: int, cfg: dict) -> Callable[[], object]:
+    texts = make_texts(n)
+    titles = [str(entry["title"]) for entry in make_entries(n)]
+    return lambda: [collect_rfps._detect_content_language(text, title) for text, title in zip(texts, titles)]
+
+
+def clear_caches() -> None:
+    """Empty every ``functools`` memo in the collector modules so a repetition starts cold."""
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", "") or ""
+        if not path.startswith(SCRIPTS_DIR):
+            continue
+        for value in list(vars(module).values()):
+            cache_clear = getattr(value, "cache_clear", None)
+            if callable(cache_clear) and hasattr(value, "cache_info"):
+                cache_clear()
+
+
+def measure(name: str, n: int, cfg: dict, repeat: int) -> dict:
+    call = BENCHMARKS[name](n, cfg)
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        clear_caches()
+        gc.collect()
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return {
+        "median_s": round(statistics.median(samples), 6),
+        "min_s": round(min(samples), 6),
+        "runs": len(samples),
+    }
+
+
+def run_suite(sizes: list[int], names: list[str], repeat: int, budget_s: float = 0.0) -> dict:
+    """Run ``names`` at every size; with ``budget_s``, skip a size whose linear estimate from the last exceeds it."""
+    cfg = collect_rfps.load_config(os.path.join(ROOT_DIR, "config.yml"))
+    results: dict[str, dict[str, dict]] = {}
+    for name in names:
+        previous: tuple[int, float] | None = None
+        for n in sorted(sizes):
+            if budget_s and previous is not None:
+                estimate = previous[1] * n / previous[0] * max(1, repeat)
+                if estimate > budget_s:
+                    results.setdefault(name, {})[str(n)] = {"skipped": f"estimated {estimate:.0f}s > budget {budget_s:.0f}s"}
+                    print(f"{name:28} {n:>7}  skipped (estimated {estimate:.0f}s)")
+                    continue
+            result = measure(name, n, cfg, repeat)
+            results.setdefault(name, {})[str(n)] = result
+            previous = (n, result["median_s"])
+            print(f"{name:28} {n:>7}  median {result['median_s'] * 1000:10.2f} ms  min {result['min_s'] * 1000:10.2f} ms")
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta_s: float = 0.001) -> list[str]:
+    """Describe every benchmark whose median regressed past ``threshold`` relative to ``baseline``."""
+    regressions: list[str] = []
+    for name, sizes in current.get("results", {}).items():
+        for size, result in sizes.items():
+            before = baseline.get("results", {}).get(name, {}).get(size)
+            if not before or "median_s" not in before or "median_s" not in result:
+                continue
+            old, new = float(before["median_s"]), float(result["median_s"])
+            if new - old > min_delta_s and new > old * (1 + threshold):
+                regressions.append(f"{name} @ {size}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _csv(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=lambda v: [int(x) for x in _csv(v)], default=list(DEFAULT_SIZES))
+    parser.add_argument("--only", type=_csv, default=list(BENCHMARKS), help="comma-separated benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", default="", help="write results as a JSON baseline")
+    parser.add_argument("--compare", default="", help="baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    parser.add_argument(
+        "--budget-s", type=float, default=300.0, help="skip sizes estimated to take longer than this (0 disables)"
+    )
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.only if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}; choose from {', '.join(BENCHMARKS)}")
+
+    baseline: dict = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    current = run_suite(args.sizes, args.only, args.repeat, args.budget_s)
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2, sort_keys=True)
+    if not args.compare:
+        return 0
+    regressions = compare(baseline, current, args.threshold, args.min_delta_ms / 1000)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
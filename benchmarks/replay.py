@@ -0,0 +1,650 @@
+"""
+replay.py – offline record/replay harness for end-to-end collector benchmarks.
+
+Every HTTP call the collectors make goes through ``requests`` (feeds are
+fetched with ``requests`` and handed to ``feedparser`` while the harness is
+active).  ``record`` captures the responses of a live run into a gzip JSON
+archive.  ``run`` starts a local stand-in server that serves the archive
+and routes all traffic to it, with configurable latency, jitter and
+injected failures, then runs the targets against a throwaway workspace.
+
+``--scale N`` multiplies the feed list: copy ``k`` of a feed is the same
+recording with ``replay_copy=k`` added to every item link and `` · k`` to
+every item title, so downstream stages see N times the entries (the
+near-duplicate titles also exercise dedupe).  Feed dates are shifted by
+the time elapsed since recording so entries stay inside the age window.
+``synth`` builds a deterministic archive without network access.
+
+    python benchmarks/replay.py synth --archive /tmp/synth.json.gz
+    python benchmarks/replay.py record --archive /tmp/live.json.gz
+    python benchmarks/replay.py run --archive /tmp/synth.json.gz --scale 10 --latency-ms 40 --failure-rate 0.02
+"""
+
+import argparse
+import base64
+import contextlib
+import email.utils
+import gzip
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from xml.sax.saxutils import escape as xml_escape
+from xml.sax.saxutils import unescape as xml_unescape
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+import feedparser  # noqa: E402
+import requests  # noqa: E402
+from requests.adapters import HTTPAdapter  # noqa: E402
+
+from date_utils import parse_datetime  # noqa: E402
+
+ARCHIVE_VERSION = 1
+COPY_PARAM = "replay_copy"
+TARGETS = ("collect_rfps", "build_pdf_publications", "build_bd_opps")
+# Response headers worth replaying; bodies are stored decoded, so no content-encoding.
+KEPT_HEADERS = ("content-type", "location", "last-modified", "etag", "content-disposition")
+
+_FEED_DATE_RE = re.compile(
+    r"(<(pubDate|published|updated|dc:date|lastBuildDate)>)\s*([^<]+?)\s*(</\2>)",
+    re.IGNORECASE,
+)
+_FEED_LINK_RE = re.compile(r"(<(link|guid)\b[^>]*>)\s*(https?://[^<\s]+)\s*(</\2>)", re.IGNORECASE)
+_ATOM_LINK_RE = re.compile(r'(<link\b[^>]*\bhref=")(https?://[^"]+)(")', re.IGNORECASE)
+_ITEM_TITLE_RE = re.compile(r"(<(item|entry)\b[^>]*>.*?<title\b[^>]*>)(.*?)(</title>)", re.IGNORECASE | re.DOTALL)
+
+
+# ---------------------------------------------------------------------------
+# Archive
+# ---------------------------------------------------------------------------
+
+def with_copy(url: str, copy: int) -> str:
+    """``url`` tagged as scale copy ``copy``; copy 0 is the original."""
+    if not copy:
+        return url
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True) + [(COPY_PARAM, str(copy))]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def split_copy(url: str) -> tuple[str, int]:
+    """Inverse of ``with_copy``: the recorded URL and the copy index."""
+    if COPY_PARAM not in url:
+        return url, 0
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    copy = 0
+    kept = []
+    for key, value in query:
+        if key == COPY_PARAM and value.isdigit():
+            copy = int(value)
+        else:
+            kept.append((key, value))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(kept), parts.fragment)), copy
+
+
+class Archive:
+    """Recorded responses keyed by ``"METHOD url"``."""
+
+    def __init__(self, recorded_at: str = "", responses: dict[str, dict] | None = None) -> None:
+        self.recorded_at = recorded_at or datetime.now(timezone.utc).isoformat()
+        self.responses: dict[str, dict] = responses or {}
+
+    @classmethod
+    def load(cls, path: str) -> "Archive":
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        if payload.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"unsupported archive version in {path}")
+        return cls(payload.get("recorded_at", ""), payload.get("responses", {}))
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        payload = {"version": ARCHIVE_VERSION, "recorded_at": self.recorded_at, "responses": self.responses}
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            json.dump(payload, fh, sort_keys=True)
+
+    def add(self, method: str, url: str, status: int, final_url: str, headers: dict, body: bytes) -> None:
+        self.responses[f"{method.upper()} {url}"] = {
+            "status": int(status),
+            "url": final_url or url,
+            "headers": {key: str(value) for key, value in headers.items() if key.lower() in KEPT_HEADERS},
+            "body": base64.b64encode(body or b"").decode("ascii"),
+        }
+
+    def lookup(self, method: str, url: str) -> tuple[dict | None, int]:
+        """Record for ``method url`` (HEAD falls back to GET) and the scale copy it was asked for."""
+        base, copy = split_copy(url)
+        for key in (f"{method.upper()} {base}", f"GET {base}"):
+            record = self.responses.get(key)
+            if record is not None:
+                return record, copy
+        return None, copy
+
+    def shift(self, now: datetime | None = None) -> timedelta:
+        recorded = parse_datetime(self.recorded_at)
+        if recorded is None:
+            return timedelta(0)
+        return (now or datetime.now(timezone.utc)) - recorded
+
+
+def is_feed(headers: dict, body: bytes) -> bool:
+    content_type = str(headers.get("content-type", "") or headers.get("Content-Type", "")).lower()
+    if any(kind in content_type for kind in ("rss", "atom", "xml")):
+        return True
+    head = body[:200].lstrip().lower()
+    return head.startswith((b"<?xml", b"<rss", b"<feed"))
+
+
+def rewrite_feed(body: bytes, copy: int = 0, shift: timedelta = timedelta(0)) -> bytes:
+    """Tag item links and titles for scale copy ``copy`` and move dates forward by ``shift``."""
+    text = body.decode("utf-8", errors="replace")
+    if shift:
+        def _shift(match: re.Match) -> str:
+            parsed = parse_datetime(match.group(3))
+            if parsed is None:
+                return match.group(0)
+            moved = parsed + shift
+            value = email.utils.format_datetime(moved) if "," in match.group(3) else moved.isoformat()
+            return f"{match.group(1)}{value}{match.group(4)}"
+
+        text = _FEED_DATE_RE.sub(_shift, text)
+    if copy:
+        def _tag(url: str) -> str:
+            return xml_escape(with_copy(xml_unescape(url), copy), {'"': "&quot;"})
+
+        text = _FEED_LINK_RE.sub(lambda m: f"{m.group(1)}{_tag(m.group(3))}{m.group(4)}", text)
+        text = _ATOM_LINK_RE.sub(lambda m: f"{m.group(1)}{_tag(m.group(2))}{m.group(3)}", text)
+        text = _ITEM_TITLE_RE.sub(lambda m: f"{m.group(1)}{m.group(3)} · {copy}{m.group(4)}", text)
+    return text.encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Stand-in server
+# ---------------------------------------------------------------------------
+
+def _fraction(*parts: object) -> float:
+    """Deterministic value in [0, 1) for the given parts."""
+    return zlib.crc32("|".join(str(part) for part in parts).encode("utf-8")) / 2**32
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients drop keep-alive connections and injected failures close them on purpose.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandInServer:
+    """Serves an ``Archive`` on localhost with latency, jitter and injected failures.
+
+    Failures are a deterministic function of ``seed`` and the request, so a
+    given URL fails the same way on every run: half of them as ``503``
+    responses, half as connections closed without a response.
+    """
+
+    def __init__(
+        self,
+        archive: Archive,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+        shift: timedelta = timedelta(0),
+    ) -> None:
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.shift = shift
+        self.stats = {"requests": 0, "misses": 0, "failures": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += n
+
+    def start(self) -> "StandInServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                server._serve(self, send_body=True)
+
+            def do_HEAD(self) -> None:  # noqa: N802
+                server._serve(self, send_body=False)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002
+                return
+
+        self._httpd = _QuietHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _serve(self, handler: BaseHTTPRequestHandler, send_body: bool) -> None:
+        url = handler.headers.get("X-Replay-URL", "")
+        method = handler.headers.get("X-Replay-Method", handler.command)
+        self._count("requests")
+        delay = self.latency_ms + self.jitter_ms * _fraction(self.seed, "jitter", method, url)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if self.failure_rate and _fraction(self.seed, "fail", method, url) < self.failure_rate:
+            self._count("failures")
+            if _fraction(self.seed, "mode", url) < 0.5:
+                handler.close_connection = True
+                return
+            self._send(handler, 503, {"content-type": "text/plain"}, b"injected failure", url, send_body)
+            return
+
+        record, copy = self.archive.lookup(method, url)
+        if record is None:
+            self._count("misses")
+            self._send(handler, 404, {"content-type": "text/plain"}, b"not in archive", url, send_body)
+            return
+
+        body = base64.b64decode(record.get("body", ""))
+        headers = dict(record.get("headers", {}))
+        if is_feed(headers, body) and (copy or self.shift):
+            body = rewrite_feed(body, copy, self.shift)
+        final_url = with_copy(str(record.get("url") or url), copy)
+        self._send(handler, int(record.get("status", 200)), headers, body, final_url, send_body)
+
+    def _send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        headers: dict,
+        body: bytes,
+        final_url: str,
+        send_body: bool,
+    ) -> None:
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("X-Replay-Final-URL", final_url)
+        handler.end_headers()
+        if send_body:
+            handler.wfile.write(body)
+            self._count("bytes", len(body))
+
+
+# ---------------------------------------------------------------------------
+# Routing and recording
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def _feeds_through_requests() -> Iterator[None]:
+    """Make ``feedparser.parse(url)`` fetch with ``requests`` so feeds are recorded and replayed too."""
+    original_parse = feedparser.parse
+
+    def parse(source, *args, request_headers=None, **kwargs):
+        if not (isinstance(source, str) and source.startswith(("http://", "https://"))):
+            return original_parse(source, *args, request_headers=request_headers, **kwargs)
+        try:
+            response = requests.get(source, headers=request_headers or {}, timeout=30)
+        except requests.RequestException as exc:
+            result = original_parse(b"")
+            result["bozo"] = 1
+            result["bozo_exception"] = exc
+            return result
+        result = original_parse(response.content, response_headers=dict(response.headers))
+        result["href"] = response.url
+        result["status"] = response.status_code
+        return result
+
+    feedparser.parse = parse
+    try:
+        yield
+    finally:
+        feedparser.parse = original_parse
+
+
+@contextlib.contextmanager
+def routed_to(server: StandInServer) -> Iterator[None]:
+    """Send every ``requests`` call to ``server`` instead of the network."""
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        original_url = request.url
+        request.headers["X-Replay-URL"] = original_url
+        request.headers["X-Replay-Method"] = request.method
+        request.url = f"{server.base_url}/replay"
+        kwargs["proxies"] = {}
+        try:
+            response = original_send(adapter, request, **kwargs)
+        finally:
+            request.url = original_url
+        response.url = response.headers.get("X-Replay-Final-URL", original_url)
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        with _feeds_through_requests():
+            yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+@contextlib.contextmanager
+def recording(archive: Archive) -> Iterator[None]:
+    """Capture every ``requests`` response (each redirect hop separately) into ``archive``."""
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        response = original_send(adapter, request, **kwargs)
+        body = b"" if request.method == "HEAD" else response.content
+        archive.add(request.method, request.url, response.status_code, response.url, dict(response.headers), body)
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        with _feeds_through_requests():
+            yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+# ---------------------------------------------------------------------------
+# Synthetic archive
+# ---------------------------------------------------------------------------
+
+_SUBJECTS = ("PDVSA", "Chevron", "Venezuela's central bank", "The agriculture ministry", "Caracas officials",
+             "Health authorities", "The finance ministry", "Port operators", "Teachers' unions", "Mining firms")
+_ACTIONS = ("announce", "delay", "expand", "review", "suspend", "approve", "tender", "renegotiate", "launch", "audit")
+_OBJECTS = ("oil export licences", "fertilizer imports", "a bond restructuring", "hospital water upgrades",
+            "a gold mining concession", "food distribution contracts", "an exchange rate band",
+            "vocational training grants", "Orinoco gas projects", "a procurement portal for RFPs")
+_PUBLISHERS = ("reuters.com", "apnews.com", "efectococuyo.com", "elpitazo.net", "talcualdigital.com",
+               "bancaynegocios.com", "reliefweb.int", "worldbank.org", "iadb.org", "caracaschronicles.com")
+_PDF_PUBLISHERS = frozenset({"reliefweb.int", "worldbank.org", "iadb.org"})
+
+
+def _article_html(title: str, summary: str, published: datetime, pdf_url: str) -> bytes:
+    paragraphs = "".join(
+        f"<p>{summary} Paragraph {n} adds context on sanctions, inflation and investment in Venezuela.</p>"
+        for n in range(1, 6)
+    )
+    pdf_link = f'<p><a href="{pdf_url}">Download the full report (PDF)</a></p>' if pdf_url else ""
+    return (
+        "<!doctype html><html><head>"
+        f"<title>{title}</title>"
+        f'<meta property="og:description" content="{summary}">'
+        f'<meta property="article:published_time" content="{published.isoformat()}">'
+        f'<script type="application/ld+json">{{"datePublished": "{published.isoformat()}"}}</script>'
+        f"</head><body><article><h1>{title}</h1>{paragraphs}{pdf_link}</article></body></html>"
+    ).encode("utf-8")
+
+
+def synthesize(feed_urls: list[str], items_per_feed: int = 20, seed: int = 1, now: datetime | None = None) -> Archive:
+    """Deterministic archive of RSS feeds, article pages, Jina text and report PDFs for ``feed_urls``."""
+    now = now or datetime.now(timezone.utc)
+    archive = Archive(recorded_at=now.isoformat())
+    rnd = random.Random(seed)
+    for feed_index, feed_url in enumerate(feed_urls):
+        items = []
+        for item_index in range(items_per_feed):
+            title = f"Venezuela: {rnd.choice(_SUBJECTS)} {rnd.choice(_ACTIONS)} {rnd.choice(_OBJECTS)}"
+            title = f"{title} ({feed_index}-{item_index})"
+            publisher = rnd.choice(_PUBLISHERS)
+            slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+            link = f"https://{publisher}/news/{now:%Y/%m}/{slug}"
+            published = now - timedelta(hours=rnd.randint(1, 24 * 12))
+            summary = f"{title}. Officials said the measure affects Venezuela's economy and investors this quarter."
+            pdf_url = f"https://{publisher}/files/{slug}.pdf" if publisher in _PDF_PUBLISHERS else ""
+            items.append(
+                "<item>"
+                f"<title>{title}</title><link>{link}</link><guid>{link}</guid>"
+                f"<pubDate>{email.utils.format_datetime(published)}</pubDate>"
+                f"<description>{summary}</description>"
+                f'<source url="https://{publisher}/">{publisher}</source>'
+                "</item>"
+            )
+            html_headers = {"content-type": "text/html; charset=utf-8"}
+            archive.add("GET", link, 200, link, html_headers, _article_html(title, summary, published, pdf_url))
+            archive.add("HEAD", link, 200, link, html_headers, b"")
+            # Both Jina URL forms in use: collect_rfps strips the scheme, extract_preview keeps it.
+            for jina_url in (f"https://r.jina.ai/http://{link.replace('https://', '')}", f"https://r.jina.ai/{link}"):
+                jina_body = f"{title}\n\n{summary}".encode("utf-8")
+                archive.add("GET", jina_url, 200, jina_url, {"content-type": "text/plain"}, jina_body)
+            if pdf_url:
+                pdf_body = b"%PDF-1.4\n" + summary.encode("utf-8") + b"\n%%EOF\n"
+                archive.add("GET", pdf_url, 200, pdf_url, {"content-type": "application/pdf"}, pdf_body)
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Synthetic feed {feed_index}</title><link>{feed_url}</link>"
+            + "".join(items)
+            + "</channel></rss>"
+        ).encode("utf-8")
+        archive.add("GET", feed_url, 200, feed_url, {"content-type": "application/rss+xml"}, body)
+    return archive
+
+
+# ---------------------------------------------------------------------------
+# Workspace and targets
+# ---------------------------------------------------------------------------
+
+def scale_feed_lines(lines: list[str], scale: int) -> list[str]:
+    """Repeat every feed line ``scale`` times, tagging copies 1..scale-1."""
+    scaled: list[str] = []
+    for raw in lines:
+        line = raw.rstrip("\n")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            scaled.append(line)
+            continue
+        name, sep, url = stripped.rpartition(" - ") if " - http" in stripped else ("", "", stripped)
+        scaled.append(line)
+        for copy in range(1, max(1, scale)):
+            tagged = with_copy(url, copy)
+            scaled.append(f"{name} (copy {copy}){sep}{tagged}" if sep else tagged)
+    return scaled
+
+
+def all_feed_urls(feeds_path: str = os.path.join(ROOT_DIR, "feeds.txt")) -> list[str]:
+    """Every feed the three targets fetch: feeds.txt plus the builders' own lists."""
+    import build_bd_opps
+    import build_pdf_publications
+    import collect_rfps
+
+    urls = collect_rfps.load_feeds(feeds_path)
+    urls += build_pdf_publications.load_feed_urls(feeds_path)
+    urls += build_bd_opps._bd_feed_urls(feeds_path)
+    return list(dict.fromkeys(urls))
+
+
+def prepare_workspace(path: str, scale: int = 1, warm: bool = False) -> str:
+    """Lay out config, scaled feeds and seed data in ``path`` so targets never touch the repo."""
+    os.makedirs(os.path.join(path, "docs", "data"), exist_ok=True)
+    os.makedirs(os.path.join(path, "data"), exist_ok=True)
+    shutil.copy(os.path.join(ROOT_DIR, "config.yml"), os.path.join(path, "config.yml"))
+    with open(os.path.join(ROOT_DIR, "feeds.txt"), "r", encoding="utf-8") as fh:
+        lines = fh.readlines()
+    with open(os.path.join(path, "feeds.txt"), "w", encoding="utf-8") as fh:
+        fh.write("\n".join(scale_feed_lines(lines, scale)) + "\n")
+    latest = os.path.join(ROOT_DIR, "docs", "data", "latest.json")
+    if os.path.exists(latest):
+        shutil.copy(latest, os.path.join(path, "docs", "data", "latest.json"))
+    if warm:
+        for name in os.listdir(os.path.join(ROOT_DIR, "data")):
+            if name.endswith(".json"):
+                shutil.copy(os.path.join(ROOT_DIR, "data", name), os.path.join(path, "data", name))
+    return path
+
+
+@contextlib.contextmanager
+def _chdir(path: str) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_target(name: str, workspace: str) -> float:
+    """Run one target against ``workspace`` and return its wall time in seconds."""
+    started = time.perf_counter()
+    if name == "collect_rfps":
+        import collect_rfps
+        from unittest import mock
+
+        docs_dir = os.path.join(workspace, "docs")
+        data_dir = os.path.join(workspace, "data")
+        with (
+            mock.patch.object(collect_rfps, "DOCS_DIR", docs_dir),
+            mock.patch.object(collect_rfps, "DATA_DIR", data_dir),
+            mock.patch.object(collect_rfps, "OUTPUT_PATH", os.path.join(docs_dir, "index.md")),
+            mock.patch.object(collect_rfps, "METADATA_PATH", os.path.join(data_dir, "last_run.json")),
+        ):
+            collect_rfps.run(
+                config_path=os.path.join(workspace, "config.yml"),
+                feeds_path=os.path.join(workspace, "feeds.txt"),
+            )
+    elif name == "build_pdf_publications":
+        import build_pdf_publications
+
+        with _chdir(workspace):
+            build_pdf_publications.main()
+    elif name == "build_bd_opps":
+        import build_bd_opps
+
+        with _chdir(workspace):
+            build_bd_opps.main()
+    else:
+        raise ValueError(f"unknown target {name!r}")
+    return time.perf_counter() - started
+
+
+def _stage_summary(workspace: str, limit: int = 6) -> list[str]:
+    path = os.path.join(workspace, "data", "last_run.json")
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as fh:
+        stages = (json.load(fh).get("timings", {}) or {}).get("stages", {})
+    ranked = sorted(stages.items(), key=lambda item: item[1].get("self_s", 0), reverse=True)[:limit]
+    return [f"    {name:18} self {stage.get('self_s', 0):7.3f}s  calls {stage.get('calls', 0)}" for name, stage in ranked]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _targets(value: str) -> list[str]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TARGETS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown target(s): {', '.join(unknown)}")
+    return names
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    synth = sub.add_parser("synth", help="build a deterministic archive without network access")
+    synth.add_argument("--archive", required=True)
+    synth.add_argument("--items", type=int, default=20, help="items per feed")
+    synth.add_argument("--seed", type=int, default=1)
+
+    record = sub.add_parser("record", help="run the targets live and capture every response")
+    record.add_argument("--archive", required=True)
+    record.add_argument("--targets", type=_targets, default=list(TARGETS))
+
+    replay = sub.add_parser("run", help="run the targets against the stand-in server")
+    replay.add_argument("--archive", required=True)
+    replay.add_argument("--targets", type=_targets, default=list(TARGETS))
+    replay.add_argument("--scale", type=int, default=1, help="feed volume multiplier (e.g. 10, 100)")
+    replay.add_argument("--latency-ms", type=float, default=0.0)
+    replay.add_argument("--jitter-ms", type=float, default=0.0)
+    replay.add_argument("--failure-rate", type=float, default=0.0)
+    replay.add_argument("--seed", type=int, default=0)
+    replay.add_argument("--no-shift-dates", action="store_true", help="serve feed dates as recorded")
+    replay.add_argument("--warm", action="store_true", help="start from the repo's data/ caches")
+    replay.add_argument("--workspace", default="", help="keep outputs here instead of a temp dir")
+    replay.add_argument("--report", default="", help="write a JSON report to this path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "synth":
+        archive = synthesize(all_feed_urls(), items_per_feed=args.items, seed=args.seed)
+        archive.save(args.archive)
+        print(f"wrote {len(archive.responses)} responses to {args.archive}")
+        return 0
+
+    if args.command == "record":
+        archive = Archive()
+        with tempfile.TemporaryDirectory() as workspace:
+            prepare_workspace(workspace)
+            with recording(archive):
+                for name in args.targets:
+                    print(f"{name:24} {run_target(name, workspace):8.2f}s (live)")
+        archive.save(args.archive)
+        print(f"wrote {len(archive.responses)} responses to {args.archive}")
+        return 0
+
+    archive = Archive.load(args.archive)
+    shift = timedelta(0) if args.no_shift_dates else archive.shift()
+    server = StandInServer(archive, args.latency_ms, args.jitter_ms, args.failure_rate, args.seed, shift)
+    report: dict = {"scale": args.scale, "latency_ms": args.latency_ms, "failure_rate": args.failure_rate, "targets": {}}
+    with contextlib.ExitStack() as stack:
+        workspace = args.workspace or stack.enter_context(tempfile.TemporaryDirectory())
+        prepare_workspace(workspace, scale=args.scale, warm=args.warm)
+        stack.enter_context(server)
+        stack.enter_context(routed_to(server))
+        for name in args.targets:
+            seconds = run_target(name, workspace)
+            report["targets"][name] = round(seconds, 3)
+            print(f"{name:24} {seconds:8.2f}s")
+            if name == "collect_rfps":
+                print("\n".join(_stage_summary(workspace)))
+    report["server"] = dict(server.stats)
+    print("server: " + ", ".join(f"{key} {value}" for key, value in server.stats.items()))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,40 @@ import datetime
 import json
 import os
 import re
-from email.utils import parsedate_to_datetime
-from urllib.parse import urlparse
 
-import feedparser
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+feedparser = lazy_import("feedparser")
+
+try:
+    from date_utils import parse_date
+except ImportError:
+    from scripts.date_utils import parse_date
+
+try:
+    from text_core import split_sentences as _split_sentences
+except ImportError:
+    from scripts.text_core import split_sentences as _split_sentences
+
+try:
+    import opp_store
+except ImportError:
+    from scripts import opp_store
+
+try:
+    from url_analysis import parse_url
+except ImportError:
+    from scripts.url_analysis import parse_url
 
 LATEST_JSON = "docs/data/latest.json"
 FEEDS_PATH = "feeds.txt"
 OUT_JSON = "docs/data/bd_opps.json"
+# Scored opportunities and rejected items carried between runs; see opp_store.py.
+STORE_PATH = "data/bd_opps_store.json"
+REJECTED_TTL_DAYS = 14
 
 BD_FEED_URLS = [
     "https://news.google.com/rss/search?q=Venezuela+rfp+OR+request+for+proposal+OR+tender+OR+procurement",
@@ -199,10 +225,7 @@ def guess_org(item: dict) -> str:
     publisher = norm(item.get("publisher") or "")
     if publisher:
         return publisher
-    try:
-        return urlparse(item.get("url", "")).netloc
-    except Exception:
-        return ""
+    return parse_url(item.get("url", "")).netloc
 
 
 def score_opp(text: str) -> int:
@@ -236,37 +259,19 @@ def _entry_date_iso(entry: dict) -> str:
     value = norm(entry.get("published") or entry.get("updated") or "")
     if not value:
         return ""
-    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%a, %d %b %Y %H:%M:%S %z"):
-        try:
-            dt = datetime.datetime.strptime(value, fmt)
-            return dt.date().isoformat()
-        except ValueError:
-            continue
-    try:
-        dt = parsedate_to_datetime(value)
-        return dt.date().isoformat()
-    except Exception:
-        return ""
+    parsed = parse_date(value, None, strict=True)
+    return parsed.isoformat() if parsed else ""
 
 
 def _parse_iso_date(value: str) -> datetime.date:
     text = norm(value)
     if not text:
         return datetime.date.min
-    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S"):
-        try:
-            return datetime.datetime.strptime(text, fmt).date()
-        except ValueError:
-            continue
-    try:
-        return parsedate_to_datetime(text).date()
-    except Exception:
-        return datetime.date.min
+    return parse_date(text, datetime.date.min, strict=True)
 
 
 def split_sentences(value: str):
-    parts = re.split(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ])", value.strip())
-    return [part.strip() for part in parts if part.strip()]
+    return _split_sentences(value.strip())
 
 
 def make_summary(item: dict, hay: str) -> str:
@@ -410,7 +415,7 @@ def _extract_feed_items(urls: list[str]) -> list[dict]:
             if isinstance(source, dict):
                 publisher = norm(source.get("title", ""))
             if not publisher:
-                publisher = feed_title or norm(urlparse(url).netloc)
+                publisher = feed_title or parse_url(url).netloc
 
             items.append(
                 {
@@ -430,100 +435,156 @@ def _extract_feed_items(urls: list[str]) -> list[dict]:
     return items
 
 
-def main() -> None:
+def _item_haystack(item: dict) -> str:
+    insight2 = item.get("insight2") if isinstance(item.get("insight2"), dict) else {}
+    return " ".join([
+        norm(item.get("title")),
+        norm(item.get("preview")),
+        norm(insight2.get("s1")),
+        norm(insight2.get("s2")),
+        norm(item.get("description")),
+        norm(item.get("snippet")),
+        " ".join(item.get("tags") or []),
+        " ".join(item.get("categories") or []),
+    ])
+
+
+# Item fields _evaluate_item reads beyond the haystack (make_summary/guess_org included).
+EVALUATED_FIELDS = (
+    "id", "url", "title", "sector", "publisher", "publishedAt", "dateISO",
+    "preview", "insight", "description", "snippet",
+)
+
+
+def _item_fingerprint(item: dict, hay: str) -> str:
+    """Fingerprint of everything _evaluate_item looks at, so any change re-judges the item."""
+    fields = [hay] + [item.get(name) for name in EVALUATED_FIELDS]
+    return opp_store.fingerprint(json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def _evaluate_item(item: dict, hay: str) -> dict | None:
+    """The opportunity built from ``item``, or ``None`` when it is not one.
+
+    Applies every check that does not depend on today's date, so the verdict
+    can be stored and reused while the item's text is unchanged.
+    """
+    title = norm(item.get("title"))
+    url = norm(item.get("url"))
+
+    if not hay or len(hay) < 60:
+        return None
+    if not _looks_venezuela_focused(hay):
+        return None
+
+    title_url_text = f"{title} {url}"
+    if not contains_any(title_url_text, TITLE_URL_OPP_TERMS):
+        return None
+
+    if not contains_any(hay, OPP_TERMS):
+        return None
+
+    deadline = extract_deadline(hay)
+    amount = extract_amount(hay)
+    if not (deadline or amount or contains_any(hay, ACTION_TERMS)):
+        return None
+
+    score = score_opp(hay)
+    if contains_any(hay, EXCLUDE_TERMS) and score < 5:
+        return None
+    if score < 3:
+        return None
+
+    published_raw = str(item.get("publishedAt") or item.get("dateISO") or "")
+    published_date = _parse_iso_date(published_raw)
+    if published_date == datetime.date.min:
+        return None
+
+    return {
+        "id": item.get("id"),
+        "title": item.get("title"),
+        "url": item.get("url"),
+        "sector": item.get("sector"),
+        "publisher": item.get("publisher") or "",
+        "publishedAt": published_date.isoformat(),
+        "deadline": deadline,
+        "amount": amount,
+        "score": score,
+        "summary": make_summary(item, hay),
+    }
+
+
+def _opp_rank(opp: dict) -> tuple:
+    return (
+        _parse_iso_date(str(opp.get("publishedAt", "") or "")),
+        int(opp.get("score", 0)),
+        0 if norm(opp.get("deadline", "")) else 1,
+        str(opp.get("deadline", "")),
+    )
+
+
+def main(latest: dict | None = None) -> dict:
+    """Build bd_opps.json from ``latest`` (read from disk when not given) and the BD feeds; return it."""
     items: list[dict] = []
-    if os.path.exists(LATEST_JSON):
+    if latest is None and os.path.exists(LATEST_JSON):
         with open(LATEST_JSON, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        items.extend(_items_from_latest(data))
+            latest = json.load(fh)
+    if latest is not None:
+        items.extend(_items_from_latest(latest))
 
     feed_urls = _bd_feed_urls(FEEDS_PATH)
     items.extend(_extract_feed_items(feed_urls))
 
-    opportunities = []
     today = datetime.datetime.now(datetime.timezone.utc).date()
+    today_iso = today.isoformat()
     recent_cutoff = today - datetime.timedelta(days=60)
     fallback_cutoff = today - datetime.timedelta(days=90)
     seen: set[str] = set()
+    # Store keys of this run's opportunities, in item order (the tie order of the ranking).
+    run_order: dict[str, int] = {}
 
-    for item in items:
-        title = norm(item.get("title"))
-        url = norm(item.get("url"))
-        hay = " ".join([
-            title,
-            norm(item.get("preview")),
-            norm(item.get("insight2", {}).get("s1") if isinstance(item.get("insight2"), dict) else ""),
-            norm(item.get("insight2", {}).get("s2") if isinstance(item.get("insight2"), dict) else ""),
-            norm(item.get("description")),
-            norm(item.get("snippet")),
-            " ".join(item.get("tags") or []),
-            " ".join(item.get("categories") or []),
-        ])
-
-        if not hay or len(hay) < 60:
-            continue
-        if not _looks_venezuela_focused(hay):
-            continue
-
-        title_url_text = f"{title} {url}"
-        if not contains_any(title_url_text, TITLE_URL_OPP_TERMS):
-            continue
+    store = opp_store.OpportunityStore.load(STORE_PATH)
+    store.expire(today_iso)
+    store.prune_published_before(fallback_cutoff.isoformat())
+    store.prune_rejected((today - datetime.timedelta(days=REJECTED_TTL_DAYS)).isoformat())
 
-        if not contains_any(hay, OPP_TERMS):
-            continue
-
-        deadline = extract_deadline(hay)
-        amount = extract_amount(hay)
-        if not (deadline or amount or contains_any(hay, ACTION_TERMS)):
-            continue
-
-        score = score_opp(hay)
-        if contains_any(hay, EXCLUDE_TERMS) and score < 5:
-            continue
-        if score < 3:
-            continue
-        if is_expired_deadline(deadline, today):
+    for item in items:
+        # Only accepted items claim their key, so a later copy can still pass.
+        dedupe_key = f"{norm(item.get('url', '')).lower()}|{norm(item.get('title', '')).lower()}"
+        if dedupe_key in seen:
             continue
 
-        published_raw = str(item.get("publishedAt") or item.get("dateISO") or "")
-        published_date = _parse_iso_date(published_raw)
-        if published_date == datetime.date.min:
-            continue
-        if published_date < fallback_cutoff:
+        hay = _item_haystack(item)
+        key = opp_store.item_key(norm(item.get("url", "")), norm(item.get("title", "")))
+        digest = _item_fingerprint(item, hay)
+        if store.known(key, digest, today_iso):
+            record = store.opportunities.get(key)
+            if record is not None and record.get("fingerprint") == digest:
+                seen.add(dedupe_key)
+                run_order[key] = len(run_order)
             continue
 
-        dedupe_key = f"{norm(item.get('url', '')).lower()}|{norm(item.get('title', '')).lower()}"
-        if dedupe_key in seen:
+        opportunity = _evaluate_item(item, hay)
+        # Expired or out-of-window items will not come back, so they are rejected for good.
+        if (
+            opportunity is None
+            or is_expired_deadline(opportunity["deadline"], today)
+            or _parse_iso_date(opportunity["publishedAt"]) < fallback_cutoff
+        ):
+            store.reject(key, digest, today_iso)
             continue
         seen.add(dedupe_key)
-
-        opportunities.append({
-            "id": item.get("id"),
-            "title": item.get("title"),
-            "url": item.get("url"),
-            "sector": item.get("sector"),
-            "publisher": item.get("publisher") or "",
-            "publishedAt": published_date.isoformat(),
-            "deadline": deadline,
-            "amount": amount,
-            "score": score,
-            "summary": make_summary(item, hay),
-        })
-
-    opportunities.sort(
-        key=lambda opp: (
-            _parse_iso_date(str(opp.get("publishedAt", "") or "")),
-            int(opp.get("score", 0)),
-            0 if norm(opp.get("deadline", "")) else 1,
-            str(opp.get("deadline", "")),
-        ),
-        reverse=True,
+        run_order[key] = len(run_order)
+        deadline_date = _parse_deadline_date(opportunity["deadline"])
+        store.put(key, digest, opportunity, deadline_date.isoformat() if deadline_date else "", today_iso)
+
+    store.save(STORE_PATH)
+    # Stored opportunities missing from this run's items stay cached but are not published.
+    opportunities = sorted(
+        store.published_since(fallback_cutoff.isoformat(), run_order), key=_opp_rank, reverse=True
+    )
+    recent_opportunities = sorted(
+        store.published_since(recent_cutoff.isoformat(), run_order), key=_opp_rank, reverse=True
     )
-
-    recent_opportunities = [
-        opp for opp in opportunities
-        if _parse_iso_date(str(opp.get("publishedAt", "") or "")) >= recent_cutoff
-    ]
     if recent_opportunities:
         top_opportunities = recent_opportunities[:5]
         window_days = 60
@@ -544,6 +605,7 @@ def main() -> None:
     os.makedirs(os.path.dirname(OUT_JSON), exist_ok=True)
     with open(OUT_JSON, "w", encoding="utf-8") as fh:
         json.dump(output, fh, ensure_ascii=False, indent=2)
+    return output
 
 
 if __name__ == "__main__":
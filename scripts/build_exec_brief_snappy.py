@@ -2,6 +2,19 @@ import datetime
 import json
 import os
 import re
+from functools import lru_cache
+
+try:
+    from lang_detect import detect_language
+except ImportError:
+    from scripts.lang_detect import detect_language
+
+try:
+    from text_core import SENTENCE_BOUNDARY_WITH_DIGITS_RE, collapse_whitespace, compile_markers, has_marker
+    from text_core import split_sentences as _split_sentences
+except ImportError:
+    from scripts.text_core import SENTENCE_BOUNDARY_WITH_DIGITS_RE, collapse_whitespace, compile_markers, has_marker
+    from scripts.text_core import split_sentences as _split_sentences
 
 LATEST_JSON = "docs/data/latest.json"
 PDF_JSON = "docs/data/pdf_publications_2026.json"
@@ -66,11 +79,15 @@ NOISE_PATTERNS = [
     r"\*\s*\[[^\]]+\]\([^\)]+\)",
     r"=+",
 ]
+NOISE_RES = [re.compile(pattern, flags=re.IGNORECASE) for pattern in NOISE_PATTERNS]
 
-SPANISH_MARKERS = [
-    " de ", " la ", " el ", " en ", " para ", " con ", " una ", " un ", " y ",
-    " transicion ", " venezuela ", " gobierno ", " politica ", " economica ",
-]
+NOISY_TOKENS = compile_markers(
+    [
+        "january", "february", "march", "april", "published time", "markdown content",
+        "the publication reports movement", "(...)", "afternoon wire", "newsletter",
+        "findings are drawn from open-access material", "url source",
+    ]
+)
 
 ENGLISH_EVENT = {
     "sanctions": "Authorities and counterparties signaled a meaningful shift in sanctions-related operating conditions",
@@ -92,42 +109,40 @@ SECTOR_REPHRASE = {
 
 
 def norm(text):
-    return re.sub(r"\s+", " ", str(text or "")).strip()
+    return collapse_whitespace(str(text or ""))
+
+
+@lru_cache(maxsize=4096)
+def _clean_normalized(value):
+    out = value.replace("—", "-")
+    for pattern in NOISE_RES:
+        out = pattern.sub("", out)
+    return collapse_whitespace(out).strip(" .;:-")
 
 
 def clean_text(text):
-    out = norm(text).replace("—", "-")
-    for pattern in NOISE_PATTERNS:
-        out = re.sub(pattern, "", out, flags=re.IGNORECASE)
-    out = re.sub(r"\s+", " ", out).strip(" .;:-")
-    return out
+    # Titles and summaries are cleaned several times per item; memoise on the normalised text.
+    return _clean_normalized(norm(text))
 
 
 def is_noisy_text(text):
     low = (text or "").lower()
-    noisy_tokens = [
-        "january", "february", "march", "april", "published time", "markdown content",
-        "the publication reports movement", "(...)", "afternoon wire", "newsletter",
-        "findings are drawn from open-access material", "url source",
-    ]
-    if any(token in low for token in noisy_tokens):
+    if has_marker(NOISY_TOKENS, low):
         return True
     if len(text or "") < 45:
         return True
     return False
 
 
-def is_likely_non_english(text):
-    value = f" {clean_text(text).lower()} "
-    if re.search(r"[áéíóúñ]", value):
-        return True
-    marker_hits = sum(1 for marker in SPANISH_MARKERS if marker in value)
-    return marker_hits >= 3
+def is_likely_non_english(text, language=""):
+    # Items from latest.json already carry the collector's verdict; reuse it.
+    if language:
+        return language != "en"
+    return detect_language(clean_text(text)) != "en"
 
 
 def split_sentences(text):
-    parts = re.split(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ0-9])", clean_text(text))
-    return [part.strip() for part in parts if part.strip()]
+    return _split_sentences(clean_text(text), SENTENCE_BOUNDARY_WITH_DIGITS_RE)
 
 
 def get_list(item, key):
@@ -271,7 +286,7 @@ def build_sentence(item, theme):
     core_text = choose_best_sentence(substance(item) or title)
     if (is_noisy_text(core_text) or len(core_text) < 60) and len(title) >= 30:
         core_text = title
-    if is_noisy_text(core_text) or is_likely_non_english(core_text) or looks_like_title_fragment(core_text):
+    if is_noisy_text(core_text) or is_likely_non_english(core_text, item.get("language") or "") or looks_like_title_fragment(core_text):
         sector = smooth_sector_phrase(item.get("sector") or "")
         date_str = clean_text(item.get("sourcePublishedAt") or item.get("publishedAt") or item.get("dateISO") or "")
         base = ENGLISH_EVENT.get(theme, "A material development was reported with direct implications for near-term operating conditions")
@@ -369,12 +384,15 @@ def build_rows(items, pdfs, max_rows=6):
     return rows[:max_rows]
 
 
-def main():
-    with open(LATEST_JSON, "r", encoding="utf-8") as handle:
-        latest = json.load(handle)
+def main(latest=None, pdfs=None):
+    # Callers that already hold latest.json or the PDF publications pass them in.
+    if latest is None:
+        with open(LATEST_JSON, "r", encoding="utf-8") as handle:
+            latest = json.load(handle)
 
     items = flatten_items(latest)
-    pdfs = load_pdfs()
+    if pdfs is None:
+        pdfs = load_pdfs()
     rows = build_rows(items, pdfs, max_rows=6)
 
     output = {
@@ -386,6 +404,7 @@ def main():
     os.makedirs(os.path.dirname(OUT_JSON), exist_ok=True)
     with open(OUT_JSON, "w", encoding="utf-8") as handle:
         json.dump(output, handle, ensure_ascii=False, indent=2)
+    return output
 
 
 if __name__ == "__main__":
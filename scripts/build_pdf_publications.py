@@ -2,12 +2,41 @@ import datetime
 import json
 import os
 import re
-import time as _time
-from urllib.parse import parse_qs, unquote, urljoin, urlparse
-
-import feedparser
-import requests
-from dateutil import parser as dateutil_parser
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import closing
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Callable, Iterator
+from urllib.parse import parse_qs, unquote, urljoin
+
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+feedparser = lazy_import("feedparser")
+requests = lazy_import("requests")
+
+try:
+    from http_fetch import DEFAULT_MAX_BYTES, stream_text
+except ImportError:
+    from scripts.http_fetch import DEFAULT_MAX_BYTES, stream_text
+
+try:
+    from date_utils import entry_datetime
+except ImportError:
+    from scripts.date_utils import entry_datetime
+
+try:
+    from text_core import split_sentences as _split_sentences
+except ImportError:
+    from scripts.text_core import split_sentences as _split_sentences
+
+try:
+    from url_analysis import parse_url
+except ImportError:
+    from scripts.url_analysis import parse_url
 
 LATEST_JSON = "docs/data/latest.json"
 FEEDS_TXT = "feeds.txt"
@@ -18,6 +47,20 @@ TARGET_YEARS = set(range(YEAR_MIN, YEAR_MAX + 1))
 OUT_JSON_RECENT = "docs/data/pdf_publications_recent.json"
 OUT_JSON_2025 = "docs/data/pdf_publications_2025.json"
 OUT_JSON_2025_2026 = "docs/data/pdf_publications_2025_2026.json"
+# Publications written; the year-specific lists are filtered from these.
+RECENT_LIMIT = 7
+
+# Landing pages stop downloading once this many PDF anchors were found.
+PDF_LINK_LIMIT = 25
+# Candidates are verified from their first bytes rather than a HEAD content-type,
+# which many institutional servers get wrong.  Verdicts are kept between runs.
+PDF_PROBE_BYTES = 1024
+PDF_VERIFY_CACHE_PATH = "data/pdf_verify_cache.json"
+PDF_VERIFY_TTL_SECONDS = 30 * 86400
+PDF_VERIFY_NEGATIVE_TTL_SECONDS = 3 * 86400
+# Items whose landing pages are fetched at once, and PDF candidates probed at once across them.
+DISCOVERY_WORKERS = 8
+PROBE_WORKERS = 16
 
 UA = "Mozilla/5.0 (compatible; MarketEdgeVZLAnews/1.0; +https://marketedgeglobal.github.io/VZLAnews/)"
 
@@ -148,6 +191,8 @@ PUBLICATION_FEED_URLS = [
     "https://www.bing.com/news/search?q=Venezuela+environment+sustainability+report+pdf&format=rss",
 ]
 
+_PDF_VERIFY_CACHE: dict[str, dict] = {}
+
 VZ_KEYS = [
     "venezuela",
     "venezuelan",
@@ -165,10 +210,7 @@ def norm(value: str) -> str:
 
 
 def domain_of(url: str) -> str:
-    try:
-        return urlparse(url).netloc.lower()
-    except Exception:
-        return ""
+    return parse_url(url).netloc
 
 
 def allowed_domain(url: str) -> bool:
@@ -296,13 +338,12 @@ def is_pdf_url(url: str) -> bool:
 def unwrap_search_redirect(url: str) -> str:
     if not url:
         return ""
-    try:
-        parsed = urlparse(url)
-    except Exception:
+    parsed = parse_url(url)
+    if not parsed.ok:
         return url
 
-    domain = (parsed.netloc or "").lower()
-    query = parse_qs(parsed.query or "")
+    domain = parsed.netloc
+    query = parse_qs(parsed.query)
 
     if "bing.com" in domain and parsed.path.startswith("/news/apiclick"):
         target = (query.get("url") or [""])[0]
@@ -336,53 +377,280 @@ def resolve_final_url(url: str) -> str:
     return url
 
 
-def head_is_pdf(url: str) -> tuple[bool, str]:
+def _load_pdf_verify_cache(path: str = PDF_VERIFY_CACHE_PATH) -> None:
+    global _PDF_VERIFY_CACHE
+    _PDF_VERIFY_CACHE = {}
+    if not os.path.exists(path):
+        return
     try:
-        response = requests.head(url, allow_redirects=True, timeout=15, headers={"User-Agent": UA})
-        content_type = (response.headers.get("content-type") or "").lower()
-        content_disp = (response.headers.get("content-disposition") or "").lower()
-        is_pdf = ("application/pdf" in content_type) or (".pdf" in content_disp)
-        return (is_pdf, response.url or url)
-    except requests.RequestException:
-        return False, url
+        with open(path, "r", encoding="utf-8") as fh:
+            loaded = json.load(fh)
+        if isinstance(loaded, dict):
+            _PDF_VERIFY_CACHE = loaded
+    except (json.JSONDecodeError, OSError):
+        _PDF_VERIFY_CACHE = {}
+
+
+def _verdict_fresh(record: dict, now_ts: int) -> bool:
+    ttl = PDF_VERIFY_TTL_SECONDS if record.get("is_pdf") else PDF_VERIFY_NEGATIVE_TTL_SECONDS
+    return now_ts - int(record.get("checked_at", 0) or 0) <= ttl
 
 
-def extract_pdf_links_from_page(url: str) -> list[str]:
-    links: list[str] = []
+def _save_pdf_verify_cache(path: str = PDF_VERIFY_CACHE_PATH) -> None:
+    now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+    fresh = {
+        url: record
+        for url, record in sorted(_PDF_VERIFY_CACHE.items())
+        if isinstance(record, dict) and _verdict_fresh(record, now_ts)
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
     try:
-        response = requests.get(url, allow_redirects=True, timeout=15, headers={"User-Agent": UA})
-    except requests.RequestException:
-        return links
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(fresh, fh, indent=2)
+    except OSError:
+        pass
 
-    content_type = (response.headers.get("content-type") or "").lower()
-    if "text/html" not in content_type:
-        return links
 
-    html = response.text or ""
-    hrefs = re.findall(r'href=["\']([^"\']+)["\']', html, flags=re.IGNORECASE)
-    for href in hrefs:
-        href = (href or "").strip()
-        if not href:
-            continue
-        full = urljoin(response.url or url, href)
-        if ".pdf" not in full.lower():
-            continue
-        links.append(full)
+def _year_from_pdf_head(head: bytes) -> int | None:
+    # Document info /CreationDate (D:YYYY...) or XMP xmp:CreateDate, when they sit in the first bytes.
+    match = re.search(rb"/CreationDate\s*\(D:(\d{4})", head) or re.search(
+        rb"<xmp:CreateDate>(\d{4})|xmp:CreateDate=[\"'](\d{4})", head
+    )
+    if not match:
+        return None
+    year = int(next(group for group in match.groups() if group))
+    return year if 1990 <= year <= YEAR_MAX + 1 else None
+
+
+def probe_pdf(url: str) -> dict | None:
+    """Fetch the first ``PDF_PROBE_BYTES`` of ``url`` and check the ``%PDF-`` signature.
+
+    Returns a cache record ``{is_pdf, final_url, size, year, checked_at}``;
+    ``size`` comes from ``Content-Range`` (or ``Content-Length`` when the server
+    ignores the range).  Any status other than 200/206 (rate limits, server
+    errors, 403, 416) gives no verdict and returns ``None``.
+    ``requests.RequestException`` propagates.
+    """
+    response = requests.get(
+        url,
+        allow_redirects=True,
+        timeout=15,
+        headers={"User-Agent": UA, "Range": f"bytes=0-{PDF_PROBE_BYTES - 1}"},
+        stream=True,
+    )
+    try:
+        if response.status_code not in (200, 206):
+            return None
+        final_url = str(response.url or url)
+        head = b""
+        for chunk in response.iter_content(chunk_size=PDF_PROBE_BYTES):
+            head += chunk
+            if len(head) >= PDF_PROBE_BYTES:
+                break
+        head = head[:PDF_PROBE_BYTES]
+        total = (response.headers.get("content-range") or "").rpartition("/")[2]
+        if not total.isdigit() and response.status_code == 200:
+            total = response.headers.get("content-length") or ""
+    finally:
+        response.close()
+
+    # The signature may follow a little leading junk, which PDF readers tolerate.
+    is_pdf = b"%PDF-" in head
+    return {
+        "is_pdf": is_pdf,
+        "final_url": final_url,
+        "size": int(total) if total.isdigit() else None,
+        "year": _year_from_pdf_head(head) if is_pdf else None,
+        "checked_at": int(datetime.datetime.now(datetime.timezone.utc).timestamp()),
+    }
 
-    deduped: list[str] = []
+
+def _verdict(record: dict, url: str) -> tuple[bool, str, int | None]:
+    year = record.get("year")
+    return bool(record.get("is_pdf")), str(record.get("final_url") or url), year if isinstance(year, int) else None
+
+
+def verify_pdf(url: str) -> tuple[bool, str, int | None]:
+    """Return ``(is_pdf, final_url, year)``, probing only URLs without a fresh cached verdict.
+
+    ``year`` is the one found in the PDF's header or XMP metadata, if any.
+    """
+    now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+    cached = _PDF_VERIFY_CACHE.get(url)
+    if isinstance(cached, dict) and _verdict_fresh(cached, now_ts):
+        return _verdict(cached, url)
+    try:
+        record = probe_pdf(url)
+    except requests.RequestException:
+        record = None
+    if record is None:
+        # Network failures and error statuses are not verdicts; try again next run.
+        return False, url, None
+    _PDF_VERIFY_CACHE[url] = record
+    return _verdict(record, url)
+
+
+_PAGE_CHROME_TAGS = frozenset({"nav", "header", "footer", "aside"})
+_DOWNLOAD_HINT_RE = re.compile(
+    r"\b(?:download|full (?:report|text|document)|read the report|pdf|descargar|informe completo|documento completo)\b",
+    re.IGNORECASE,
+)
+_TOKEN_RE = re.compile(r"[^\W_]{4,}")
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall((text or "").lower()))
+
+
+def _title_overlap(title_tokens: set[str], text: str) -> float:
+    if not title_tokens:
+        return 0.0
+    return len(title_tokens & _tokens(text)) / len(title_tokens)
+
+
+class _PdfLinkParser(HTMLParser):
+    """Collect PDF-looking anchors in document order, noting where the title appears.
+
+    Only anchors whose ``href`` (or ``type``) looks like a PDF are kept, with
+    the ``href`` as written.  ``done`` turns True once ``limit`` anchors have
+    been seen so the caller can stop downloading.
+    """
+
+    def __init__(self, title_tokens: set[str], limit: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title_tokens = title_tokens
+        self.limit = limit
+        # (href, anchor text, position, inside nav/header/footer/aside)
+        self.anchors: list[tuple[str, str, int, bool]] = []
+        self.title_position: int | None = None
+        self._position = 0
+        self._chrome_depth = 0
+        self._heading_parts: list[str] | None = None
+        self._anchor: tuple[str, list[str], int, bool] | None = None
+
+    @property
+    def done(self) -> bool:
+        return len(self.anchors) >= self.limit
+
+    def _close_anchor(self) -> None:
+        if self._anchor is None:
+            return
+        href, parts, position, in_chrome = self._anchor
+        self.anchors.append((href, " ".join("".join(parts).split()), position, in_chrome))
+        self._anchor = None
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._close_anchor()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        self._position += 1
+        if tag in _PAGE_CHROME_TAGS:
+            self._chrome_depth += 1
+        elif tag in ("h1", "h2", "h3") and self.title_position is None:
+            self._heading_parts = []
+        elif tag == "a":
+            self._close_anchor()
+            values = {key.lower(): (value or "") for key, value in attrs}
+            href = values.get("href", "").strip()
+            if href and (".pdf" in href.lower() or "pdf" in values.get("type", "").lower()):
+                label = values.get("title", "") or values.get("aria-label", "")
+                self._anchor = (href, [label, " "], self._position, self._chrome_depth > 0)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.done:
+            return
+        if tag in _PAGE_CHROME_TAGS:
+            self._chrome_depth = max(0, self._chrome_depth - 1)
+        elif tag in ("h1", "h2", "h3") and self._heading_parts is not None:
+            if _title_overlap(self.title_tokens, "".join(self._heading_parts)) >= 0.6:
+                self.title_position = self._position
+            self._heading_parts = None
+        elif tag == "a":
+            self._close_anchor()
+
+    def handle_data(self, data: str) -> None:
+        if self._heading_parts is not None:
+            self._heading_parts.append(data)
+        if self._anchor is not None:
+            self._anchor[1].append(data)
+
+
+def rank_pdf_links(
+    anchors: list[tuple[str, str, int, bool]], title_tokens: set[str], title_position: int | None
+) -> list[str]:
+    """Order PDF anchors best first, deduplicated; ties keep document order.
+
+    An anchor scores for sharing words with the title (its text, ``title``
+    attribute or file name), for download-style wording, and for sitting
+    close to the heading that carries the title.  Links in navigation,
+    header, footer or sidebar chrome score lower.
+    """
+    scored: list[tuple[float, str]] = []
     seen: set[str] = set()
-    for link in links:
-        key = link.split("#", 1)[0]
+    for url, text, position, in_chrome in anchors:
+        key = url.split("#", 1)[0]
         if key in seen:
             continue
         seen.add(key)
-        deduped.append(link)
-    return deduped
+        filename = unquote(parse_url(url).path.rsplit("/", 1)[-1]).replace("-", " ").replace("_", " ")
+        score = 3.0 * _title_overlap(title_tokens, f"{text} {filename}")
+        if _DOWNLOAD_HINT_RE.search(text):
+            score += 1.0
+        if title_position is not None:
+            score += 1.0 / (1.0 + abs(position - title_position) / 20.0)
+        if in_chrome:
+            score -= 2.0
+        scored.append((score, url))
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [url for _, url in scored]
+
+
+def extract_pdf_links_from_page(url: str, title: str = "") -> list[str]:
+    """PDF links on the landing page at ``url``, best match for ``title`` first.
+
+    The page is parsed as it streams in and the download stops after
+    ``DEFAULT_MAX_BYTES`` or once ``PDF_LINK_LIMIT`` PDF anchors were found.
+    """
+    title_tokens = _tokens(title)
+    parser = _PdfLinkParser(title_tokens, PDF_LINK_LIMIT)
+    fed = 0
+
+    def feed(text: str) -> bool:
+        nonlocal fed
+        parser.feed(text[fed:])
+        fed = len(text)
+        return parser.done
+
+    try:
+        final_url, html = stream_text(
+            url,
+            timeout=15,
+            headers={"User-Agent": UA},
+            max_bytes=DEFAULT_MAX_BYTES,
+            content_types=("text/html",),
+            allow_missing_content_type=False,
+            stop=feed,
+        )
+    except requests.RequestException:
+        return []
+    try:
+        feed(html)
+        parser.close()
+    except Exception:  # noqa: BLE001
+        pass
+
+    base_url = final_url or url
+    anchors = [(urljoin(base_url, href), text, position, in_chrome) for href, text, position, in_chrome in parser.anchors]
+    return rank_pdf_links(anchors, title_tokens, parser.title_position)
 
 
 def split_sentences(text: str) -> list[str]:
-    parts = re.split(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ])", (text or "").strip())
-    return [part.strip() for part in parts if part.strip()]
+    return _split_sentences((text or "").strip())
 
 
 def load_feed_urls(path: str = FEEDS_TXT) -> list[str]:
@@ -415,25 +683,7 @@ def load_feed_urls(path: str = FEEDS_TXT) -> list[str]:
 
 
 def _parse_entry_datetime(entry) -> datetime.datetime | None:
-    for attr in ("published_parsed", "updated_parsed"):
-        val = entry.get(attr)
-        if val:
-            try:
-                ts = _time.mktime(val)
-                return datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc)
-            except (OverflowError, OSError):
-                pass
-    for attr in ("published", "updated"):
-        val = entry.get(attr)
-        if val:
-            try:
-                dt = dateutil_parser.parse(str(val))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=datetime.timezone.utc)
-                return dt
-            except (ValueError, OverflowError):
-                pass
-    return None
+    return entry_datetime(entry)
 
 
 def _extract_best_link(entry) -> str:
@@ -623,7 +873,7 @@ def _merge_items(primary: list[dict], secondary: list[dict]) -> list[dict]:
     return merged
 
 
-def _write_output(path: str, publications: list[dict], year_range: list[int], year_label: str) -> None:
+def _write_output(path: str, publications: list[dict], year_range: list[int], year_label: str) -> dict:
     output = {
         "asOf": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         "yearRange": year_range,
@@ -637,136 +887,242 @@ def _write_output(path: str, publications: list[dict], year_range: list[int], ye
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as fh:
         json.dump(output, fh, ensure_ascii=False, indent=2)
+    return output
 
 
-def main() -> None:
-    with open(LATEST_JSON, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
+def _probe_candidate(candidate: str, resolve: Callable[[str], str]) -> tuple[str, int | None]:
+    """``(pdf_url, year)`` for a confirmed ``candidate``, or ``("", None)`` when it is not one."""
+    resolved_candidate = resolve(candidate)
+    if not resolved_candidate or not allowed_domain(resolved_candidate):
+        return "", None
+    if is_pdf_url(resolved_candidate):
+        return resolved_candidate, None
+    ok, resolved, year = verify_pdf(resolved_candidate)
+    return (resolved, year) if ok else ("", None)
 
-    latest_items = _items_from_latest(data)
-    feed_items = _items_from_feeds(load_feed_urls())
-    items = _merge_items(latest_items, feed_items)
-    publications = []
-    seen: set[str] = set()
 
-    for item in items:
-        url = item.get("url") or ""
-        title = norm(item.get("title") or "")
-        if not url or not title:
-            continue
+def _first_confirmed_pdf(
+    candidates: list[str], resolve: Callable[[str], str], pool: Executor
+) -> tuple[str, int | None]:
+    """Probe ``candidates`` concurrently and return the earliest one confirmed as a PDF, with its year.
 
-        haystack = " ".join(
-            [
-                title,
-                norm(item.get("preview") or ""),
-                norm(item.get("description") or ""),
-                " ".join(item.get("tags") or []),
-                " ".join(item.get("categories") or []),
-            ]
-        )
-        relevance_haystack = " ".join([haystack, str(item.get("url") or ""), str(item.get("source_url") or "")])
-        if not vz_relevant(relevance_haystack):
-            continue
+    Results are taken in candidate order, so the choice matches a serial scan;
+    probes still queued once an earlier candidate is confirmed are cancelled.
+    """
+    futures = [pool.submit(_probe_candidate, candidate, resolve) for candidate in candidates]
+    try:
+        for future in futures:
+            chosen, year = future.result()
+            if chosen:
+                return chosen, year
+        return "", None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _admitted(item: dict) -> bool:
+    """Every check on ``item`` that needs no network access."""
+    url = item.get("url") or ""
+    title = norm(item.get("title") or "")
+    if not url or not title:
+        return False
 
-        year = infer_year(item)
-        if year not in TARGET_YEARS and not mentions_target_years(item, TARGET_YEARS):
-            continue
+    haystack = " ".join(
+        [
+            title,
+            norm(item.get("preview") or ""),
+            norm(item.get("description") or ""),
+            " ".join(item.get("tags") or []),
+            " ".join(item.get("categories") or []),
+        ]
+    )
+    relevance_haystack = " ".join([haystack, str(item.get("url") or ""), str(item.get("source_url") or "")])
+    if not vz_relevant(relevance_haystack):
+        return False
 
-        final_url = resolve_final_url(url)
-        if not final_url:
-            continue
+    year = infer_year(item)
+    if year not in TARGET_YEARS and not mentions_target_years(item, TARGET_YEARS):
+        return False
 
-        if not allowed_domain(final_url):
-            continue
+    # Necessary for the post-discovery Venezuela check whichever branch it takes,
+    # since a title mention is also a content mention.
+    return _content_mentions_venezuela(item)
 
-        landing_page_url = "" if is_pdf_url(final_url) else final_url
 
-        candidate_urls: list[str] = [final_url]
-        if not is_pdf_url(final_url):
-            candidate_urls.extend(extract_pdf_links_from_page(final_url))
+def _published_at(item: dict) -> str:
+    year = infer_year(item)
+    publication_year = year if year in TARGET_YEARS else YEAR_MAX
+    return item.get("publishedAt") or item.get("dateISO") or str(publication_year)
 
-        chosen_pdf_url = ""
-        seen_candidates: set[str] = set()
-        for candidate in candidate_urls:
-            candidate = (candidate or "").strip()
-            if not candidate:
-                continue
-            key = candidate.split("#", 1)[0]
-            if key in seen_candidates:
-                continue
-            seen_candidates.add(key)
 
-            resolved_candidate = resolve_final_url(candidate)
-            if not resolved_candidate:
-                continue
-            if not allowed_domain(resolved_candidate):
-                continue
+def admit_candidates(items: list[dict]) -> list[dict]:
+    """Items that pass the network-free checks, newest first.
 
-            if is_pdf_url(resolved_candidate):
-                chosen_pdf_url = resolved_candidate
-                break
+    Sorted by the same ``publishedAt`` key as the output (stable, so ties keep
+    their input order); discovering in this order means the first
+    publications found are the ones that will be written.
+    """
+    admitted = [item for item in items if _admitted(item)]
+    admitted.sort(key=lambda item: str(_published_at(item)), reverse=True)
+    return admitted
 
-            ok, resolved = head_is_pdf(resolved_candidate)
-            if ok:
-                chosen_pdf_url = resolved
-                break
 
-        if not chosen_pdf_url:
-            continue
+def _discover_publication(
+    item: dict, resolve: Callable[[str], str], probe_pool: Executor
+) -> tuple[str, dict | None] | None:
+    """Find an admitted ``item``'s PDF and build its publication entry.
 
-        if not landing_page_url:
-            continue
+    Returns ``None`` when no PDF was found, otherwise ``(pdf_url, publication)``
+    where ``publication`` is ``None`` if the item fails the Venezuela check; the
+    PDF URL still counts for deduplication in that case.
+    """
+    url = item.get("url") or ""
+    title = norm(item.get("title") or "")
+    year = infer_year(item)
+
+    final_url = resolve(url)
+    if not final_url:
+        return None
+
+    if not allowed_domain(final_url):
+        return None
+
+    landing_page_url = "" if is_pdf_url(final_url) else final_url
+    # Without a landing page the item is dropped whatever its PDF, so skip the probes.
+    if not landing_page_url:
+        return None
+
+    candidate_urls: list[str] = [final_url]
+    candidate_urls.extend(extract_pdf_links_from_page(final_url, title))
 
-        dedupe_key = chosen_pdf_url.split("#")[0]
-        if dedupe_key in seen:
+    unique_candidates: list[str] = []
+    seen_candidates: set[str] = set()
+    for candidate in candidate_urls:
+        candidate = (candidate or "").strip()
+        if not candidate:
             continue
-        seen.add(dedupe_key)
-
-        # For trusted institutional sources, check Venezuela anywhere in content
-        # For others, require Venezuela in title
-        temp_publisher = norm(item.get("publisher") or domain_of(landing_page_url))
-        temp_domain = domain_of(landing_page_url)
-        if _is_trusted_institutional_source(temp_publisher, temp_domain):
-            # Lenient: just check Venezuela is mentioned somewhere
-            if not _content_mentions_venezuela(item):
+        key = candidate.split("#", 1)[0]
+        if key in seen_candidates:
+            continue
+        seen_candidates.add(key)
+        unique_candidates.append(candidate)
+
+    chosen_pdf_url, pdf_year = _first_confirmed_pdf(unique_candidates, resolve, probe_pool)
+    if not chosen_pdf_url:
+        return None
+
+    # For trusted institutional sources, check Venezuela anywhere in content
+    # For others, require Venezuela in title
+    temp_publisher = norm(item.get("publisher") or domain_of(landing_page_url))
+    temp_domain = domain_of(landing_page_url)
+    if _is_trusted_institutional_source(temp_publisher, temp_domain):
+        # Lenient: just check Venezuela is mentioned somewhere
+        if not _content_mentions_venezuela(item):
+            return chosen_pdf_url, None
+    else:
+        # Strict: require Venezuela in title
+        if not _title_mentions_venezuela(title):
+            return chosen_pdf_url, None
+
+    publisher = norm(item.get("publisher") or domain_of(landing_page_url))
+    published_at = _published_at(item)
+    if year not in TARGET_YEARS:
+        # Only the year field; publishedAt stays the admission sort key.
+        year = pdf_year or year
+    publication_year = year if year in TARGET_YEARS else YEAR_MAX
+    overview = _build_four_sentence_overview(item, title)
+
+    return chosen_pdf_url, {
+        "id": item.get("id") or "",
+        "title": title,
+        "url": landing_page_url,
+        "pageUrl": landing_page_url,
+        "pdfUrl": chosen_pdf_url,
+        "publisher": publisher,
+        "publishedAt": published_at,
+        "year": publication_year,
+        "sector": item.get("sector") or "",
+        "abstract": overview,
+    }
+
+
+def _discover_in_order(
+    items: list[dict], resolve: Callable[[str], str], item_pool: Executor, probe_pool: Executor
+) -> Iterator[tuple[str, dict | None] | None]:
+    """Yield ``_discover_publication`` for each item, in order, with a bounded window in flight.
+
+    Closing the generator cancels the items not yet started.
+    """
+    queue = iter(items)
+    pending: deque[Future] = deque(
+        item_pool.submit(_discover_publication, item, resolve, probe_pool)
+        for item in islice(queue, DISCOVERY_WORKERS)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(queue, 1):
+                pending.append(item_pool.submit(_discover_publication, item, resolve, probe_pool))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def main(latest: dict | None = None, resolve_url: Callable[[str], str] | None = None) -> dict:
+    """Build the PDF publication lists and return the recent one.
+
+    ``latest`` is the collector's latest.json payload (read from disk when not
+    given); ``resolve_url`` replaces ``resolve_final_url`` so a caller can share
+    its redirect cache.
+    """
+    if latest is None:
+        with open(LATEST_JSON, "r", encoding="utf-8") as fh:
+            latest = json.load(fh)
+    data = latest
+    resolve = resolve_url or resolve_final_url
+    _load_pdf_verify_cache(PDF_VERIFY_CACHE_PATH)
+
+    latest_items = _items_from_latest(data)
+    feed_items = _items_from_feeds(load_feed_urls())
+    items = _merge_items(latest_items, feed_items)
+    publications = []
+    seen: set[str] = set()
+
+    # Candidates are discovered newest first and results come back in that
+    # order, so discovery stops as soon as the written lists are filled.
+    candidates = admit_candidates(items)
+    with (
+        ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as item_pool,
+        ThreadPoolExecutor(max_workers=PROBE_WORKERS) as probe_pool,
+        closing(_discover_in_order(candidates, resolve, item_pool, probe_pool)) as discovered,
+    ):
+        for result in discovered:
+            if result is None:
                 continue
-        else:
-            # Strict: require Venezuela in title
-            if not _title_mentions_venezuela(title):
+            chosen_pdf_url, publication = result
+            dedupe_key = chosen_pdf_url.split("#")[0]
+            if dedupe_key in seen:
                 continue
+            seen.add(dedupe_key)
+            if publication is not None:
+                publications.append(publication)
+                if len(publications) >= RECENT_LIMIT:
+                    break
 
-        publisher = norm(item.get("publisher") or domain_of(landing_page_url))
-        published_at = item.get("publishedAt") or item.get("dateISO") or ""
-        publication_year = year if year in TARGET_YEARS else YEAR_MAX
-        if not published_at:
-            published_at = str(publication_year)
-        overview = _build_four_sentence_overview(item, title)
-
-        publications.append(
-            {
-                "id": item.get("id") or "",
-                "title": title,
-                "url": landing_page_url,
-                "pageUrl": landing_page_url,
-                "pdfUrl": chosen_pdf_url,
-                "publisher": publisher,
-                "publishedAt": published_at,
-                "year": publication_year,
-                "sector": item.get("sector") or "",
-                "abstract": overview,
-            }
-        )
+    _save_pdf_verify_cache(PDF_VERIFY_CACHE_PATH)
 
     publications.sort(key=lambda publication: str(publication.get("publishedAt") or ""), reverse=True)
 
     year_range_sorted = sorted(TARGET_YEARS)
-    publications_recent = publications[:7]
+    publications_recent = publications[:RECENT_LIMIT]
     publications_2025 = [p for p in publications_recent if int(p.get("year") or 0) == 2025]
     publications_2025_2026 = [
         p for p in publications_recent if int(p.get("year") or 0) in {2025, 2026}
     ]
 
-    _write_output(
+    recent = _write_output(
         OUT_JSON_RECENT,
         publications_recent,
         year_range_sorted,
@@ -774,6 +1130,7 @@ def main() -> None:
     )
     _write_output(OUT_JSON_2025, publications_2025, [2025], "2025")
     _write_output(OUT_JSON_2025_2026, publications_2025_2026, [2025, 2026], "2025-2026")
+    return recent
 
 
 if __name__ == "__main__":
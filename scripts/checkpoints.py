@@ -0,0 +1,147 @@
+"""
+checkpoints.py – per-run stage checkpoints so a failed collector run can resume.
+
+Each run gets a directory ``<root>/<run_id>/`` holding a ``manifest.json``
+(run time, input fingerprint, completed stages) and one gzip-compressed JSON
+file per completed stage.  Feed entries and datetimes are tagged on the way
+out and rebuilt on the way in.  The directory is removed when the run
+succeeds, so any directory left behind belongs to a run that failed or was
+cancelled; ``find_resumable`` picks the newest one whose inputs still match.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+try:
+    from feed_entry import FeedEntry
+except ImportError:
+    from scripts.feed_entry import FeedEntry
+
+MANIFEST_FILENAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def fingerprint(*paths: str) -> str:
+    """Hash of the input files' contents; a checkpoint only resumes against the same inputs."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.encode("utf-8"))
+        try:
+            with open(path, "rb") as fh:
+                digest.update(fh.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()[:16]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, FeedEntry):
+        return {"__entry__": value.to_dict()}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"cannot checkpoint {type(value).__name__}")
+
+
+def _decode(obj: dict) -> Any:
+    if "__entry__" in obj and len(obj) == 1:
+        return FeedEntry(**obj["__entry__"])
+    if "__datetime__" in obj and len(obj) == 1:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def _write_json(path: str, payload: Any) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
+    os.replace(tmp_path, path)
+
+
+def start(root: str, now: datetime, inputs: str) -> str:
+    """Create the checkpoint directory for a new run and return it."""
+    run_id = f"{now.strftime('%Y%m%dT%H%M%SZ')}-{os.getpid()}"
+    run_dir = os.path.join(root, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+    _write_json(
+        os.path.join(run_dir, MANIFEST_FILENAME),
+        {"version": FORMAT_VERSION, "run_id": run_id, "now": now.isoformat(), "inputs": inputs, "completed": []},
+    )
+    return run_dir
+
+
+def manifest(run_dir: str) -> dict:
+    try:
+        with open(os.path.join(run_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as fh:
+            loaded = json.load(fh)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def save(run_dir: str, stage: str, payload: Any) -> None:
+    """Write ``stage``'s output and mark the stage completed."""
+    path = os.path.join(run_dir, f"{stage}.json.gz")
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as fh:
+        json.dump(payload, fh, default=_encode, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    meta = manifest(run_dir)
+    completed = [name for name in meta.get("completed", []) if name != stage] + [stage]
+    meta["completed"] = completed
+    _write_json(os.path.join(run_dir, MANIFEST_FILENAME), meta)
+
+
+def load(run_dir: str, stage: str) -> Any:
+    """``stage``'s checkpointed output, or ``None`` when it did not complete."""
+    if stage not in manifest(run_dir).get("completed", []):
+        return None
+    try:
+        with gzip.open(os.path.join(run_dir, f"{stage}.json.gz"), "rt", encoding="utf-8") as fh:
+            return json.load(fh, object_hook=_decode)
+    except (OSError, EOFError, json.JSONDecodeError):
+        return None
+
+
+def find_resumable(root: str, inputs: str, run_id: str = "") -> str:
+    """Directory of the run to resume: ``run_id`` if given, else the newest leftover run with matching inputs."""
+    if not os.path.isdir(root):
+        return ""
+    candidates = [run_id] if run_id else sorted(os.listdir(root), reverse=True)
+    for name in candidates:
+        run_dir = os.path.join(root, name)
+        meta = manifest(run_dir)
+        if meta.get("version") == FORMAT_VERSION and meta.get("inputs") == inputs:
+            return run_dir
+    return ""
+
+
+def remove(run_dir: str) -> None:
+    shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def collect_garbage(root: str, now: datetime, max_age_days: float) -> list[str]:
+    """Delete leftover run directories older than ``max_age_days``; return the removed run IDs."""
+    if not os.path.isdir(root):
+        return []
+    cutoff = now - timedelta(days=max_age_days)
+    removed: list[str] = []
+    for name in sorted(os.listdir(root)):
+        run_dir = os.path.join(root, name)
+        started = manifest(run_dir).get("now", "")
+        try:
+            started_at = datetime.fromisoformat(started)
+        except (TypeError, ValueError):
+            started_at = datetime.fromtimestamp(os.path.getmtime(run_dir), tz=timezone.utc)
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        if started_at < cutoff:
+            remove(run_dir)
+            removed.append(name)
+    return removed
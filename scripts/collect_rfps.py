@@ -10,34 +10,92 @@ Pipeline:
   6. Output docs/index.md + data/last_run.json
 """
 
+import argparse
 import hashlib
+import heapq
 import json
 import logging
 import os
 import re
 import sys
 import csv
+from bisect import bisect_right
+from functools import lru_cache
 from html import escape, unescape
+from html.parser import HTMLParser
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qs, unquote, urlparse
+from typing import Callable, Iterable, Iterator
 
-import time as _time
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+feedparser = lazy_import("feedparser")
+requests = lazy_import("requests")
+yaml = lazy_import("yaml")
+
+try:
+    from http_fetch import DEFAULT_MAX_BYTES, HTML_CONTENT_TYPES, TEXT_CONTENT_TYPES, stream_text
+except ImportError:
+    from scripts.http_fetch import DEFAULT_MAX_BYTES, HTML_CONTENT_TYPES, TEXT_CONTENT_TYPES, stream_text
+
+try:
+    from url_analysis import domain_in, parse_url
+except ImportError:
+    from scripts.url_analysis import domain_in, parse_url
+
+try:
+    from lang_detect import detect_language, entry_language
+except ImportError:
+    from scripts.lang_detect import detect_language, entry_language
+
+try:
+    from date_utils import entry_datetime, parse_date_iso, parse_datetime
+except ImportError:
+    from scripts.date_utils import entry_datetime, parse_date_iso, parse_datetime
+
+try:
+    from feed_entry import FeedEntry
+except ImportError:
+    from scripts.feed_entry import FeedEntry
+
+try:
+    import run_metrics
+except ImportError:
+    from scripts import run_metrics
 
-import feedparser
-import requests
-import yaml
-from bs4 import BeautifulSoup
-from dateutil import parser as dateutil_parser
+try:
+    import checkpoints
+except ImportError:
+    from scripts import checkpoints
 
 try:
-    from extract_preview import extract_preview as _extract_preview
-except Exception:  # noqa: BLE001
+    from text_core import DATELINE_RE, compile_markers, has_marker, normalize_text_block, split_sentences
+except ImportError:
+    from scripts.text_core import DATELINE_RE, compile_markers, has_marker, normalize_text_block, split_sentences
+
+
+@lru_cache(maxsize=1)
+def _preview_extractor() -> Callable[[str], dict]:
+    # extract_preview pulls in trafilatura, readability and BeautifulSoup, so it
+    # is imported on the first preview rather than with this module.
     try:
-        from scripts.extract_preview import extract_preview as _extract_preview
+        from extract_preview import extract_preview
     except Exception:  # noqa: BLE001
-        def _extract_preview(url: str) -> dict:
-            return {"preview": "", "preview_source": "none"}
+        try:
+            from scripts.extract_preview import extract_preview
+        except Exception:  # noqa: BLE001
+            def extract_preview(url: str) -> dict:
+                return {"preview": "", "preview_source": "none"}
+    return extract_preview
+
+
+def _extract_preview(url: str) -> dict:
+    return _preview_extractor()(url)
+
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -53,10 +111,35 @@ DOCS_DATA_DIR = os.path.join(DOCS_DIR, "data")
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 OUTPUT_PATH = os.path.join(DOCS_DIR, "index.md")
 METADATA_PATH = os.path.join(DATA_DIR, "last_run.json")
-REDIRECT_CACHE_PATH = os.path.join(DATA_DIR, "redirect_cache.json")
+REDIRECT_CACHE_FILENAME = "redirect_cache.json"
+REDIRECT_CACHE_PATH = os.path.join(DATA_DIR, REDIRECT_CACHE_FILENAME)
+# Per-run stage checkpoints under DATA_DIR; see checkpoints.py.
+CHECKPOINT_DIRNAME = "checkpoints"
+
+PREVIEW_STORE_FILENAME = "preview_store.json"
+PREVIEW_SOURCES = frozenset({"trafilatura", "readability", "jina", "cache", "fallback_summary"})
+DERIVED_MEMO_FILENAME = "derived_memo.json"
+# Bump when the annotation/summary/insight code changes shape so old memos are ignored.
+DERIVED_MEMO_VERSION = 3
+DERIVED_MEMO_FIELDS = (
+    "event_types",
+    "sentiment",
+    "materiality",
+    "risk_score",
+    "entities",
+    "summary_text",
+    "summary_source",
+    "tags",
+    "numbers",
+    "insight2",
+)
 
 _REDIRECT_CACHE: dict[str, dict] = {}
 _REJECTED_LINKS: list[dict] = []
+_PREVIEW_STORE: dict[str, dict] = {}
+_PREVIEW_STATS: dict[str, int] = {}
+_DERIVED_MEMO: dict[str, dict] = {}
+_DERIVED_MEMO_STATS: dict[str, int] = {}
 
 
 def _log_rejection(
@@ -111,31 +194,38 @@ def _resolve_redirects(url: str, timeout_seconds: int = 6) -> str:
     if isinstance(cached, dict):
         ts = int(cached.get("ts", 0) or 0)
         if now_ts - ts <= 604800 and cached.get("final_url"):
+            run_metrics.count("redirect_cache_hits")
             return str(cached.get("final_url", ""))
+    run_metrics.count("redirect_cache_misses")
 
     final_url = url
-    try:
-        response = requests.head(
-            url,
-            timeout=timeout_seconds,
-            headers={"User-Agent": "VZLAnews/1.0"},
-            allow_redirects=True,
-        )
-        if response.url:
-            final_url = str(response.url)
-    except requests.RequestException:
+    host = _domain(url)
+    with run_metrics.span("resolve_redirects"):
+        run_metrics.count("http_requests", host=host)
         try:
-            response = requests.get(
+            response = requests.head(
                 url,
                 timeout=timeout_seconds,
                 headers={"User-Agent": "VZLAnews/1.0"},
                 allow_redirects=True,
-                stream=True,
             )
             if response.url:
                 final_url = str(response.url)
         except requests.RequestException:
-            final_url = url
+            run_metrics.count("http_retries", host=host)
+            try:
+                response = requests.get(
+                    url,
+                    timeout=timeout_seconds,
+                    headers={"User-Agent": "VZLAnews/1.0"},
+                    allow_redirects=True,
+                    stream=True,
+                )
+                if response.url:
+                    final_url = str(response.url)
+            except requests.RequestException:
+                run_metrics.count("http_errors", host=host)
+                final_url = url
 
     _REDIRECT_CACHE[url] = {"final_url": final_url, "ts": now_ts}
     return final_url
@@ -278,8 +368,8 @@ def load_feeds(path: str = FEEDS_PATH) -> list[str]:
 # Feed fetching
 # ---------------------------------------------------------------------------
 
-def fetch_feed(url: str) -> list[dict]:
-    """Fetch a single RSS/Atom feed and return a list of normalised entry dicts."""
+def fetch_feed(url: str) -> list[FeedEntry]:
+    """Fetch a single RSS/Atom feed and return a list of normalised entries."""
     try:
         feed = feedparser.parse(url, request_headers={"User-Agent": "VZLAnews/1.0"})
         if feed.bozo and not feed.entries:
@@ -316,21 +406,21 @@ def fetch_feed(url: str) -> list[dict]:
                             categories.append(term)
             published = _parse_date(e)
             entries.append(
-                {
-                    "title": title,
-                    "link": link,
-                    "summary": summary,
-                    "content": content_value,
-                    "snippet": "",
-                    "publisher_url": publisher_url,
-                    "publisher": publisher_name,
-                    "author": str(e.get("author", "") or "").strip(),
-                    "guid": str(e.get("id", "") or e.get("guid", "") or "").strip(),
-                    "categories": categories,
-                    "published": published,
-                    "source_url": url,
-                    "source_domain": _domain(url),
-                }
+                FeedEntry(
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    content=content_value,
+                    snippet="",
+                    publisher_url=publisher_url,
+                    publisher=publisher_name,
+                    author=str(e.get("author", "") or "").strip(),
+                    guid=str(e.get("id", "") or e.get("guid", "") or "").strip(),
+                    categories=categories,
+                    published=published,
+                    source_url=url,
+                    source_domain=_domain(url),
+                )
             )
         return entries
     except Exception as exc:  # noqa: BLE001
@@ -369,20 +459,27 @@ def _extract_visible_text(html: str) -> str:
     return text
 
 
-def fetch_article_text(url: str, timeout_seconds: int = 6, max_chars: int = 6000) -> str:
+def fetch_article_text(
+    url: str,
+    timeout_seconds: int = 6,
+    max_chars: int = 6000,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> str:
     if not url:
         return ""
     try:
-        response = requests.get(
+        _, html = stream_text(
             url,
             timeout=timeout_seconds,
             headers={"User-Agent": "VZLAnews/1.0"},
-            allow_redirects=True,
+            max_bytes=max_bytes,
+            content_types=HTML_CONTENT_TYPES,
+            stop=lambda partial: len(_extract_visible_text(partial)) >= max_chars,
         )
-        if response.status_code != 200 or not response.text:
+        if not html:
             return ""
 
-        text = _extract_visible_text(response.text)
+        text = _extract_visible_text(html)
         if not text:
             return ""
         if len(text) > max_chars:
@@ -392,20 +489,27 @@ def fetch_article_text(url: str, timeout_seconds: int = 6, max_chars: int = 6000
         return ""
 
 
-def _fetch_article_text_via_jina(url: str, timeout_seconds: int = 8, max_chars: int = 7000) -> str:
+def _fetch_article_text_via_jina(
+    url: str,
+    timeout_seconds: int = 8,
+    max_chars: int = 7000,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> str:
     if not url:
         return ""
     try:
         proxy_url = f"https://r.jina.ai/http://{url.replace('https://', '').replace('http://', '')}"
-        response = requests.get(
+        # Jina returns plain text/markdown, so a few bytes per character is plenty.
+        _, body = stream_text(
             proxy_url,
             timeout=timeout_seconds,
             headers={"User-Agent": "VZLAnews/1.0"},
-            allow_redirects=True,
+            max_bytes=min(max_bytes, max_chars * 4),
+            content_types=TEXT_CONTENT_TYPES,
         )
-        if response.status_code != 200 or not response.text:
+        if not body:
             return ""
-        text = _normalize_text_block(response.text)
+        text = _normalize_text_block(body)
         if len(text) > max_chars:
             return text[:max_chars]
         return text
@@ -413,29 +517,140 @@ def _fetch_article_text_via_jina(url: str, timeout_seconds: int = 8, max_chars:
         return ""
 
 
-def _fetch_article_html(url: str, timeout_seconds: int = 6) -> tuple[str, str]:
+def _fetch_article_html(url: str, timeout_seconds: int = 6, max_bytes: int = DEFAULT_MAX_BYTES) -> tuple[str, str]:
     if not url:
         return "", ""
 
     try:
-        response = requests.get(
+        return stream_text(
             url,
             timeout=timeout_seconds,
             headers={"User-Agent": "VZLAnews/1.0"},
-            allow_redirects=True,
+            max_bytes=max_bytes,
+            content_types=HTML_CONTENT_TYPES,
         )
-        final_url = (response.url or url).strip()
-        if response.status_code != 200 or not response.text:
-            return final_url, ""
-        return final_url, response.text
     except requests.RequestException:
         return url, ""
 
 
+_META_DATE_KEYS = frozenset(
+    {
+        "article:published_time",
+        "og:published_time",
+        "pubdate",
+        "publishdate",
+        "datepublished",
+        "date",
+        "dc.date",
+        "dc.date.issued",
+    }
+)
+_META_DESCRIPTION_KEYS = ("og:description", "twitter:description", "description")
+_HEAD_END_RE = re.compile(r"</head\s*>|<body[\s>]", re.IGNORECASE)
+_JSON_LD_DATE_RE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+
+
+class _PageMetadataParser(HTMLParser):
+    """Collect ``<meta>``, ``<time>`` and JSON-LD blocks in document order.
+
+    With ``head_only`` set, collection stops at ``</head>`` or ``<body>`` so
+    metadata lookups never pay for the article body.
+    """
+
+    def __init__(self, head_only: bool = True) -> None:
+        super().__init__(convert_charrefs=True)
+        self.head_only = head_only
+        self.meta: list[tuple[str, str]] = []
+        self.times: list[str] = []
+        self.json_ld: list[str] = []
+        self._json_ld_parts: list[str] | None = None
+        self._done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._done:
+            return
+        if tag == "body" and self.head_only:
+            self._done = True
+            return
+        values = {key.lower(): (value or "") for key, value in attrs}
+        if tag == "meta":
+            key = (values.get("property") or values.get("name") or values.get("itemprop") or "").strip().lower()
+            content = values.get("content", "").strip()
+            if key and content:
+                self.meta.append((key, content))
+        elif tag == "time":
+            datetime_attr = values.get("datetime", "").strip()
+            if datetime_attr:
+                self.times.append(datetime_attr)
+        elif tag == "script" and "ld+json" in values.get("type", "").lower():
+            self._json_ld_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._done:
+            return
+        if tag == "head" and self.head_only:
+            self._done = True
+        elif tag == "script" and self._json_ld_parts is not None:
+            self.json_ld.append("".join(self._json_ld_parts))
+            self._json_ld_parts = None
+
+    def handle_data(self, data: str) -> None:
+        if self._json_ld_parts is not None and not self._done:
+            self._json_ld_parts.append(data)
+
+
+def _html_head(html: str) -> str:
+    match = _HEAD_END_RE.search(html or "")
+    if not match:
+        return html or ""
+    return html[: match.end()]
+
+
+@lru_cache(maxsize=16)
+def _page_metadata(html: str, head_only: bool = True) -> _PageMetadataParser:
+    parser = _PageMetadataParser(head_only=head_only)
+    try:
+        parser.feed(_html_head(html) if head_only else html)
+        parser.close()
+    except Exception:  # noqa: BLE001
+        pass
+    return parser
+
+
+def _json_ld_published_dates(blocks: list[str]) -> list[str]:
+    found: list[str] = []
+
+    def _walk(node) -> None:
+        if isinstance(node, dict):
+            value = node.get("datePublished")
+            if isinstance(value, str) and value.strip():
+                found.append(value.strip())
+            for child in node.values():
+                if isinstance(child, (dict, list)):
+                    _walk(child)
+        elif isinstance(node, list):
+            for child in node:
+                _walk(child)
+
+    for block in blocks:
+        try:
+            _walk(json.loads(block))
+        except (json.JSONDecodeError, ValueError):
+            found.extend(match.strip() for match in _JSON_LD_DATE_RE.findall(block))
+    return found
+
+
 def _extract_meta_description(html: str) -> str:
     if not html:
         return ""
 
+    meta = dict(reversed(_page_metadata(html).meta))
+    for key in _META_DESCRIPTION_KEYS:
+        if meta.get(key):
+            return meta[key]
+
+    # Fall back to scanning the whole document for pages that emit their
+    # description tags outside a well-formed <head>.
     patterns = [
         r'<meta[^>]+property=["\']og:description["\'][^>]+content=["\']([^"\']+)["\']',
         r'<meta[^>]+name=["\']twitter:description["\'][^>]+content=["\']([^"\']+)["\']',
@@ -448,45 +663,33 @@ def _extract_meta_description(html: str) -> str:
     return ""
 
 
-def _extract_source_published_date(html: str) -> str:
-    if not html:
-        return ""
+def _published_date_candidates(parsed: _PageMetadataParser) -> list[str]:
+    candidates = [content for key, content in parsed.meta if key in _META_DATE_KEYS]
+    candidates.extend(_json_ld_published_dates(parsed.json_ld))
+    candidates.extend(parsed.times)
+    return candidates
 
-    candidates: list[str] = []
-
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        meta_keys = {
-            "article:published_time",
-            "og:published_time",
-            "pubdate",
-            "publishdate",
-            "datepublished",
-            "date",
-            "dc.date",
-            "dc.date.issued",
-        }
-        for meta in soup.find_all("meta"):
-            key = (meta.get("property") or meta.get("name") or meta.get("itemprop") or "").strip().lower()
-            content = (meta.get("content") or "").strip()
-            if key in meta_keys and content:
-                candidates.append(content)
-        for time_tag in soup.find_all("time"):
-            datetime_attr = (time_tag.get("datetime") or "").strip()
-            if datetime_attr:
-                candidates.append(datetime_attr)
-    except Exception:  # noqa: BLE001
-        pass
 
+def _first_parsable_date(candidates: list[str]) -> str:
     for candidate in candidates:
-        try:
-            parsed = dateutil_parser.parse(candidate)
-            return parsed.date().isoformat()
-        except Exception:  # noqa: BLE001
-            continue
+        parsed = parse_date_iso(candidate)
+        if parsed:
+            return parsed
     return ""
 
 
+def _extract_source_published_date(html: str) -> str:
+    if not html:
+        return ""
+
+    published = _first_parsable_date(_published_date_candidates(_page_metadata(html)))
+    if published:
+        return published
+    # Only walk the full body (e.g. <time> tags inside the article) when the
+    # head had nothing usable.
+    return _first_parsable_date(_published_date_candidates(_page_metadata(html, head_only=False)))
+
+
 def _extract_first_meaningful_paragraph(html: str) -> str:
     if not html:
         return ""
@@ -506,21 +709,11 @@ def _is_blocked_extraction_domain(entry: dict, blocked_domains: set[str]) -> boo
     if not blocked_domains:
         return False
 
-    source_domain = (entry.get("source_domain", "") or "").lower().strip()
-    link_domain = _domain(entry.get("link", "") or "").lower().strip()
-    publisher_domain = _domain(entry.get("publisher_url", "") or "").lower().strip()
-
-    for blocked in blocked_domains:
-        blocked = blocked.lower().strip()
-        if not blocked:
-            continue
-        if source_domain == blocked or source_domain.endswith(f".{blocked}"):
-            return True
-        if link_domain == blocked or link_domain.endswith(f".{blocked}"):
-            return True
-        if publisher_domain == blocked or publisher_domain.endswith(f".{blocked}"):
-            return True
-    return False
+    return (
+        domain_in((entry.get("source_domain", "") or "").lower().strip(), blocked_domains)
+        or domain_in(parse_url(entry.get("link", "") or "").host, blocked_domains)
+        or domain_in(parse_url(entry.get("publisher_url", "") or "").host, blocked_domains)
+    )
 
 
 def enrich_entries_with_article_text(entries: list[dict], cfg: dict) -> None:
@@ -533,6 +726,7 @@ def enrich_entries_with_article_text(entries: list[dict], cfg: dict) -> None:
     timeout_seconds = max(1, int(extraction_cfg.get("timeout_seconds", 6)))
     min_chars = max(100, int(extraction_cfg.get("min_chars", 240)))
     max_chars = max(1000, int(extraction_cfg.get("max_chars", 6000)))
+    max_bytes = max(64 * 1024, int(extraction_cfg.get("max_bytes", DEFAULT_MAX_BYTES)))
     blocked_domains = {
         str(domain).lower().strip()
         for domain in extraction_cfg.get("blocked_domains", [])
@@ -577,7 +771,11 @@ def enrich_entries_with_article_text(entries: list[dict], cfg: dict) -> None:
         if preferred_url in html_cache:
             resolved_link, html = html_cache[preferred_url]
         else:
-            resolved_link, html = _fetch_article_html(preferred_url, timeout_seconds=timeout_seconds)
+            resolved_link, html = _fetch_article_html(
+                preferred_url,
+                timeout_seconds=timeout_seconds,
+                max_bytes=max_bytes,
+            )
             html_cache[preferred_url] = (resolved_link, html)
 
         if resolved_link and resolved_link != preferred_url:
@@ -612,9 +810,19 @@ def enrich_entries_with_article_text(entries: list[dict], cfg: dict) -> None:
                 entry["snippet"] = cleaned_paragraph
 
         article_url = entry.get("link") or resolved_link or preferred_url
-        article_text = fetch_article_text(article_url, timeout_seconds=timeout_seconds, max_chars=max_chars)
+        article_text = fetch_article_text(
+            article_url,
+            timeout_seconds=timeout_seconds,
+            max_chars=max_chars,
+            max_bytes=max_bytes,
+        )
         if len(article_text) < min_chars:
-            article_text = _fetch_article_text_via_jina(article_url, timeout_seconds=max(timeout_seconds, 8), max_chars=max_chars)
+            article_text = _fetch_article_text_via_jina(
+                article_url,
+                timeout_seconds=max(timeout_seconds, 8),
+                max_chars=max_chars,
+                max_bytes=max_bytes,
+            )
         if len(article_text) >= min_chars:
             entry["article_text"] = article_text
             enriched_count += 1
@@ -630,35 +838,11 @@ def enrich_entries_with_article_text(entries: list[dict], cfg: dict) -> None:
 
 def _parse_date(entry) -> datetime | None:
     """Try to extract a timezone-aware datetime from a feedparser entry."""
-    for attr in ("published_parsed", "updated_parsed"):
-        val = entry.get(attr)
-        if val:
-            try:
-                ts = _time.mktime(val)
-                return datetime.fromtimestamp(ts, tz=timezone.utc)
-            except (OverflowError, OSError):
-                pass
-    for attr in ("published", "updated"):
-        val = entry.get(attr)
-        if val:
-            try:
-                dt = dateutil_parser.parse(val)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except (ValueError, OverflowError):
-                pass
-    return None
+    return entry_datetime(entry)
 
 
 def _domain(url: str) -> str:
-    try:
-        host = (urlparse(url).netloc or "").lower()
-        if host.startswith("www."):
-            host = host[4:]
-        return host
-    except Exception:  # noqa: BLE001
-        return ""
+    return parse_url(url).host
 
 
 # ---------------------------------------------------------------------------
@@ -710,6 +894,11 @@ def filter_entries(
     cfg: dict,
     now: datetime,
 ) -> list[dict]:
+    return list(iter_filtered_entries(entries, cfg, now))
+
+
+def iter_filtered_entries(entries: Iterable[dict], cfg: dict, now: datetime) -> Iterator[dict]:
+    """Yield the entries that pass the title, relevance, age, exclude and country checks."""
     max_age = cfg.get("max_age_days", 7)
     sector_max_age = cfg.get("sector_max_age_days", {})
     country_terms = [t.lower() for t in cfg.get("country_terms", [])]
@@ -717,7 +906,6 @@ def filter_entries(
     exclude_terms = [t.lower() for t in cfg.get("exclude_terms", [])]
     require_country = cfg.get("require_country_match", True)
 
-    filtered = []
     for e in entries:
         source_url = str(e.get("source_url", "") or "")
         title_text = str(e.get("title", "") or "")
@@ -777,44 +965,50 @@ def filter_entries(
                 published_at=_fmt_date(e.get("published")),
             )
             continue
-        filtered.append(e)
-    return filtered
+        yield e
 
 
 def apply_link_quality_gate(entries: list[dict], cfg: dict) -> list[dict]:
+    return list(iter_link_gated_entries(entries, cfg))
+
+
+def iter_link_gated_entries(
+    entries: Iterable[dict],
+    cfg: dict,
+    reject: Callable[..., None] = _log_rejection,
+) -> Iterator[dict]:
+    """Resolve each entry's link and yield the ones that land on a usable article URL."""
     timeout_seconds = max(1, int(cfg.get("article_extraction", {}).get("timeout_seconds", 6)))
-    accepted: list[dict] = []
     for entry in entries:
         source_url = str(entry.get("source_url", "") or "")
         title = str(entry.get("title", "") or "")
         candidate_url = str(entry.get("link", "") or "").strip()
         if not candidate_url:
-            _log_rejection(source_url, title, "no_link_found", "", "", _fmt_date(entry.get("published")))
+            reject(source_url, title, "no_link_found", "", "", _fmt_date(entry.get("published")))
             continue
 
         final_url = _resolve_redirects(candidate_url, timeout_seconds=timeout_seconds)
         final_url = _resolve_entry_link(final_url)
         if not final_url:
-            _log_rejection(source_url, title, "redirect_resolve_failed", candidate_url, "", _fmt_date(entry.get("published")))
+            reject(source_url, title, "redirect_resolve_failed", candidate_url, "", _fmt_date(entry.get("published")))
             continue
 
         entry["link"] = final_url
         entry["source_domain"] = _domain(final_url) or entry.get("source_domain", "")
 
         if _is_global_feed_source(source_url) and not _is_venezuela_relevant_entry(entry):
-            _log_rejection(source_url, title, "not_venezuela_relevant", candidate_url, final_url, _fmt_date(entry.get("published")))
+            reject(source_url, title, "not_venezuela_relevant", candidate_url, final_url, _fmt_date(entry.get("published")))
             continue
 
         if _is_paywalled_or_firewalled_domain(final_url):
-            _log_rejection(source_url, title, "paywall_or_firewall", candidate_url, final_url, _fmt_date(entry.get("published")))
+            reject(source_url, title, "paywall_or_firewall", candidate_url, final_url, _fmt_date(entry.get("published")))
             continue
 
         if not _is_valid_resource_url(final_url):
-            _log_rejection(source_url, title, "url_not_article", candidate_url, final_url, _fmt_date(entry.get("published")))
+            reject(source_url, title, "url_not_article", candidate_url, final_url, _fmt_date(entry.get("published")))
             continue
 
-        accepted.append(entry)
-    return accepted
+        yield entry
 
 
 # ---------------------------------------------------------------------------
@@ -828,47 +1022,7 @@ def _title_key(title: str) -> str:
 def _canonical_url_for_dedupe(url: str) -> str:
     if not url:
         return ""
-    raw = str(url).strip()
-    if not raw:
-        return ""
-
-    try:
-        parsed = urlparse(raw)
-    except Exception:  # noqa: BLE001
-        return raw
-
-    host = (parsed.netloc or "").lower().strip()
-    if host.startswith("www."):
-        host = host[4:]
-
-    path = (parsed.path or "").strip() or "/"
-    if path != "/":
-        path = path.rstrip("/")
-
-    query_pairs = parse_qsl(parsed.query, keep_blank_values=False)
-    drop_keys = {
-        "fbclid",
-        "gclid",
-        "mc_cid",
-        "mc_eid",
-        "oc",
-        "ocid",
-        "ref",
-        "ref_src",
-        "source",
-    }
-    filtered_pairs = [
-        (k, v)
-        for k, v in query_pairs
-        if not k.lower().startswith("utm_") and k.lower() not in drop_keys
-    ]
-    filtered_query = urlencode(filtered_pairs, doseq=True)
-
-    scheme = (parsed.scheme or "https").lower()
-    if not host:
-        return raw
-
-    return urlunparse((scheme, host, path, "", filtered_query, ""))
+    return parse_url(url).canonical
 
 
 def _title_topic_key(title: str) -> str:
@@ -887,10 +1041,15 @@ def _title_topic_key(title: str) -> str:
 
 def deduplicate(entries: list[dict], threshold: float = 0.90, cfg: dict | None = None) -> list[dict]:
     """Remove duplicate entries using URL + title-similarity checks."""
+    return list(iter_unique_entries(entries, threshold, cfg))
+
+
+def iter_unique_entries(entries: Iterable[dict], threshold: float = 0.90, cfg: dict | None = None) -> Iterator[dict]:
+    """Yield entries not already seen by URL or title; only the keys of kept entries are held."""
     seen_urls: set[str] = set()
     seen_titles: list[str] = []
     seen_topics: list[str] = []
-    unique: list[dict] = []
+    seen_labels: list[str] = []
     dedup_cfg = (cfg or {}).get("deduplication", {}) if isinstance(cfg, dict) else {}
     topic_threshold = float(dedup_cfg.get("topic_similarity_threshold", max(0.84, threshold - 0.05)))
 
@@ -901,6 +1060,7 @@ def deduplicate(entries: list[dict], threshold: float = 0.90, cfg: dict | None =
 
         title = _title_key(e.get("title", ""))
         topic = _title_topic_key(e.get("title", ""))
+        label = detect_sector_label(e, cfg) if cfg is not None else ""
         duplicate = False
         for idx, seen in enumerate(seen_titles):
             ratio = SequenceMatcher(None, title, seen).ratio()
@@ -911,12 +1071,8 @@ def deduplicate(entries: list[dict], threshold: float = 0.90, cfg: dict | None =
             )
             same_topic = bool(topic and seen_topics[idx] and (topic == seen_topics[idx] or topic_ratio >= topic_threshold))
             if ratio >= threshold or same_topic:
-                if cfg is not None:
-                    existing = unique[idx]
-                    new_label = detect_sector_label(e, cfg)
-                    existing_label = detect_sector_label(existing, cfg)
-                    if new_label != existing_label:
-                        continue
+                if cfg is not None and label != seen_labels[idx]:
+                    continue
                 duplicate = True
                 break
         if duplicate:
@@ -926,9 +1082,8 @@ def deduplicate(entries: list[dict], threshold: float = 0.90, cfg: dict | None =
             seen_urls.add(url)
         seen_titles.append(title)
         seen_topics.append(topic)
-        unique.append(e)
-
-    return unique
+        seen_labels.append(label)
+        yield e
 
 
 # ---------------------------------------------------------------------------
@@ -1012,8 +1167,97 @@ def score_and_rank(entries: list[dict], cfg: dict, now: datetime) -> list[dict]:
     return sorted(entries, key=lambda x: x["score"], reverse=True)
 
 
+def rank_bounded(entries: Iterable[dict], cfg: dict, now: datetime, per_section: int) -> list[dict]:
+    """Score entries as they arrive and keep only each section's best ``per_section``.
+
+    Returns the kept entries in ``score_and_rank`` order (score descending,
+    arrival order on ties); everything else is released as soon as it falls
+    out of its section's pool.
+    """
+    pools: dict[str, list[tuple[float, int, dict]]] = {}
+    for seq, entry in enumerate(entries):
+        entry["score"] = score_entry(entry, cfg, now)
+        pool = pools.setdefault(detect_sector_label(entry, cfg), [])
+        # (score, -seq) is unique, so the heap never compares the entries themselves.
+        item = (entry["score"], -seq, entry)
+        if len(pool) < per_section:
+            heapq.heappush(pool, item)
+        elif item[:2] > pool[0][:2]:
+            heapq.heapreplace(pool, item)
+    kept = [item for pool in pools.values() for item in pool]
+    kept.sort(key=lambda item: (-item[0], -item[1]))
+    return [item[2] for item in kept]
+
+
+def _counted(items: Iterable[dict], counts: dict[str, int], name: str) -> Iterator[dict]:
+    counts[name] = 0
+    for item in items:
+        counts[name] += 1
+        yield item
+
+
+def iter_feed_entries(feed_urls: list[str]) -> Iterator[dict]:
+    """Fetch feeds one at a time, yielding their entries."""
+    for url in feed_urls:
+        host = _domain(url)
+        with run_metrics.span("fetch_feeds"):
+            run_metrics.count("http_requests", host=host)
+            fetched = fetch_feed(url)
+            run_metrics.count("feed_entries", len(fetched), host=host)
+        logger.info("  %s → %d entries", url, len(fetched))
+        yield from fetched
+
+
+def stream_candidates(feed_urls: list[str], cfg: dict, now: datetime, max_results: int) -> tuple[list[dict], dict[str, int]]:
+    """Fetch, filter, gate, dedupe and score as one chain of generators.
+
+    Only a bounded pool of ranked candidates is materialised.  A section can
+    place at most ``max_results`` entries in the selection and lose at most
+    ``max_results`` more to dedupe keys taken by other sections, so keeping
+    ``2 * max_results`` per section yields exactly what
+    ``select_diverse_top_entries`` would pick from the full ranking.  Stage
+    counts are returned alongside for the run metadata.
+    """
+    counts: dict[str, int] = {}
+    deferred_rejections: list[tuple] = []
+    threshold = cfg.get("deduplication", {}).get("title_similarity_threshold", 0.90)
+
+    stream = _counted(iter_feed_entries(feed_urls), counts, "fetched")
+    stream = _counted(run_metrics.iter_span(iter_filtered_entries(stream, cfg, now), "filter"), counts, "filtered")
+    # Gate rejections are logged after the filter's, matching the batch order.
+    stream = _counted(
+        run_metrics.iter_span(
+            iter_link_gated_entries(stream, cfg, reject=lambda *args: deferred_rejections.append(args)),
+            "link_gate",
+        ),
+        counts,
+        "link_gated",
+    )
+    stream = _counted(run_metrics.iter_span(iter_unique_entries(stream, threshold, cfg=cfg), "dedupe"), counts, "deduped")
+    with run_metrics.span("score"):
+        ranked = rank_bounded(stream, cfg, now, per_section=2 * max(1, max_results))
+
+    for args in deferred_rejections:
+        _log_rejection(*args)
+    return ranked, counts
+
+
+def _selection_key(item: dict) -> str:
+    link = _canonical_url_for_dedupe(item.get("link", ""))
+    title = _title_topic_key(item.get("title", "")) or _title_key(item.get("title", ""))
+    return f"{link}::{title}"
+
+
 def select_diverse_top_entries(entries: list[dict], cfg: dict, max_results: int) -> list[dict]:
-    """Select top entries while preserving sector diversity when available."""
+    """Select top entries while preserving sector diversity when available.
+
+    ``entries`` arrive ranked, so an entry's index is its priority.  Sector
+    labels and dedupe keys are derived at most once per entry and only as
+    deep into the ranking as needed; per-sector queues serve the minimum
+    quotas, one scan in rank order fills the rest under the section caps,
+    and entries turned away by a full section are kept in rank order for
+    the uncapped backfill.
+    """
     if not entries or max_results <= 0:
         return []
 
@@ -1022,100 +1266,78 @@ def select_diverse_top_entries(entries: list[dict], cfg: dict, max_results: int)
     max_per_section = max(1, int(selection_cfg.get("max_per_section", max_results)))
     section_order = cfg.get("brief_sections", [])
 
-    grouped: dict[str, list[dict]] = {section: [] for section in section_order}
-    for entry in entries:
-        label = detect_sector_label(entry, cfg)
-        grouped.setdefault(label, []).append(entry)
+    labels: list[str | None] = [None] * len(entries)
+
+    def _label(idx: int) -> str:
+        label = labels[idx]
+        if label is None:
+            label = labels[idx] = detect_sector_label(entries[idx], cfg)
+        return label
 
-    selected: list[dict] = []
+    # Only scan as deep as needed to find each section's quota candidates.
+    section_queues: dict[str, list[int]] = {section: [] for section in section_order}
+    short_sections = {section for section in section_order if min_per_section > 0}
+    for idx in range(len(entries)):
+        if not short_sections:
+            break
+        label = _label(idx)
+        queue = section_queues.setdefault(label, [])
+        if len(queue) < min_per_section:
+            queue.append(idx)
+            if len(queue) >= min_per_section:
+                short_sections.discard(label)
+
+    selected: list[int] = []
     selected_keys: set[str] = set()
-    section_counts: dict[str, int] = {section: 0 for section in grouped}
+    section_counts: dict[str, int] = {section: 0 for section in section_order}
+    key_cache: dict[int, str] = {}
 
-    def _entry_key(item: dict) -> str:
-        link = _canonical_url_for_dedupe(item.get("link", ""))
-        title = _title_topic_key(item.get("title", "")) or _title_key(item.get("title", ""))
-        return f"{link}::{title}"
+    def _key(idx: int) -> str:
+        key = key_cache.get(idx)
+        if key is None:
+            key = key_cache[idx] = _selection_key(entries[idx])
+        return key
 
-    def _try_add(item: dict, section: str, enforce_cap: bool = True) -> bool:
-        if len(selected) >= max_results:
-            return False
-        if enforce_cap and section_counts.get(section, 0) >= max_per_section:
-            return False
-        key = _entry_key(item)
-        if key in selected_keys:
-            return False
-        selected.append(item)
-        selected_keys.add(key)
-        section_counts[section] = section_counts.get(section, 0) + 1
-        return True
+    def _add(idx: int) -> None:
+        selected.append(idx)
+        selected_keys.add(_key(idx))
+        section_counts[_label(idx)] = section_counts.get(_label(idx), 0) + 1
 
-    # Pass 1: guarantee a minimum number per configured section if entries exist.
+    # Minimum quota: the top ``min_per_section`` entries of each configured section.
     for section in section_order:
-        section_entries = grouped.get(section, [])
-        for item in section_entries[:min_per_section]:
-            _try_add(item, section)
-
-    # Pass 2: fill remaining slots by global score while respecting section caps.
-    for item in entries:
-        section = detect_sector_label(item, cfg)
-        _try_add(item, section)
-        if len(selected) >= max_results:
-            break
-
-    # Pass 3: if caps leave spare slots, backfill by score regardless of caps.
-    if len(selected) < max_results:
-        for item in entries:
-            section = detect_sector_label(item, cfg)
-            _try_add(item, section, enforce_cap=False)
+        for idx in section_queues.get(section, []):
             if len(selected) >= max_results:
                 break
-
-    # Pass 4: language balancing backfill (without lowering quality thresholds).
-    language_targets = selection_cfg.get("min_per_language", {}) or {}
-    if isinstance(language_targets, dict) and len(selected) < max_results:
-        for language, target in language_targets.items():
-            lang = str(language or "").strip().lower()
-            if lang not in {"en", "es"}:
-                continue
-            try:
-                needed = int(target)
-            except (TypeError, ValueError):
-                continue
-            if needed <= 0:
+            if section_counts.get(section, 0) >= max_per_section or _key(idx) in selected_keys:
                 continue
+            _add(idx)
 
-            current = sum(
-                1
-                for item in selected
-                if _detect_content_language(
-                    str(item.get("title", "") or ""),
-                    str(item.get("summary", "") or ""),
-                    str(item.get("snippet", "") or ""),
-                )
-                == lang
-            )
-            if current >= needed:
-                continue
+    # Capped fill by global rank; entries of a full section wait for the backfill.
+    taken = set(selected)
+    overflow: list[int] = []
+    for idx in range(len(entries)):
+        if len(selected) >= max_results:
+            break
+        if idx in taken:
+            continue
+        if section_counts.get(_label(idx), 0) >= max_per_section:
+            overflow.append(idx)
+            continue
+        if _key(idx) in selected_keys:
+            continue
+        _add(idx)
 
-            for item in entries:
-                if len(selected) >= max_results or current >= needed:
-                    break
-                section = detect_sector_label(item, cfg)
-                key = _entry_key(item)
-                if key in selected_keys:
-                    continue
-                item_lang = _detect_content_language(
-                    str(item.get("title", "") or ""),
-                    str(item.get("summary", "") or ""),
-                    str(item.get("snippet", "") or ""),
-                )
-                if item_lang != lang:
-                    continue
-                if not _try_add(item, section):
-                    continue
-                current += 1
+    # Uncapped backfill, still in rank order, when caps left slots empty.
+    for idx in overflow:
+        if len(selected) >= max_results:
+            break
+        if _key(idx) in selected_keys:
+            continue
+        _add(idx)
 
-    return selected
+    # selection.min_per_language is not applied: a language backfill could only
+    # run once every distinct candidate is already selected, so it never adds one.
+    return [entries[idx] for idx in selected]
 
 
 # ---------------------------------------------------------------------------
@@ -1199,10 +1421,7 @@ def _fmt_source(entry: dict) -> str:
 
 
 def _summary_excerpt(entry: dict, max_chars: int) -> str:
-    raw = entry.get("summary", "") or ""
-    clean = re.sub(r"<[^>]+>", " ", raw)
-    clean = unescape(clean)
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _normalize_text_block(entry.get("summary", "") or "")
     if not clean:
         return ""
     if len(clean) <= max_chars:
@@ -1212,32 +1431,58 @@ def _summary_excerpt(entry: dict, max_chars: int) -> str:
 
 
 GOOGLE_NEWS_BOILERPLATE = "Comprehensive up-to-date news coverage, aggregated from sources all over the world by Google News"
-PREVIEW_DATELINE_PAT = r"^[A-ZÁÉÍÓÚÑ][A-Za-zÁÉÍÓÚÑáéíóúñ\s\.\-]{2,40}\s+\([^\)]+\)\s+[-—]\s+"
+PREVIEW_DATELINE_PAT = DATELINE_RE.pattern
+_GOOGLE_NEWS_BOILERPLATE_KEY = GOOGLE_NEWS_BOILERPLATE.lower().rstrip(".")
+_BYLINE_PREFIX_RE = re.compile(r"^\s*(By|Por)\s+", flags=re.IGNORECASE)
+_PREVIEW_REJECT_MARKERS = compile_markers(
+    [
+        "title:",
+        "url source:",
+        "markdown content:",
+        "request blocked",
+        "we can't connect to the server",
+        "we cant connect to the server",
+        "can't connect to the server for this app or website",
+        "cannot connect to the server for this app or website",
+        "this app or website at this time",
+        "just a moment",
+        "performing security verification",
+        "skip to content",
+        "this website uses a security service",
+        "latest news stories from around the world",
+        "privacy statement",
+        "cookie policy",
+        "reset password",
+        "wrong login information",
+        "iniciar sesión",
+        "wrong site?",
+        "go back hide about us",
+        "main topics",
+        "featured topics",
+        "a lock ( ) or https://",
+    ]
+)
 
 
 def _is_google_news_boilerplate(text: str) -> bool:
     clean = _normalize_text_block(text).strip().lower().rstrip(".")
-    return clean == GOOGLE_NEWS_BOILERPLATE.lower().rstrip(".")
+    return clean == _GOOGLE_NEWS_BOILERPLATE_KEY
 
 
 def _preview_sentence_split(text: str) -> list[str]:
     clean = _normalize_text_block(text)
     if not clean:
         return []
-    return [
-        part.strip()
-        for part in re.split(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ])", clean)
-        if part.strip()
-    ]
+    return split_sentences(clean)
 
 
 def _preview_has_byline_or_dateline(text: str) -> bool:
     clean = _normalize_text_block(text)
     if not clean:
         return False
-    if re.match(r"^\s*(By|Por)\s+", clean, flags=re.IGNORECASE):
+    if _BYLINE_PREFIX_RE.match(clean):
         return True
-    if re.search(PREVIEW_DATELINE_PAT, clean):
+    if DATELINE_RE.search(clean):
         return True
     return False
 
@@ -1249,33 +1494,7 @@ def _validate_preview_text(text: str) -> str:
     if _is_google_news_boilerplate(clean):
         return ""
     low = clean.lower()
-    if any(marker in low for marker in [
-        "title:",
-        "url source:",
-        "markdown content:",
-        "request blocked",
-        "we can't connect to the server",
-        "we cant connect to the server",
-        "can't connect to the server for this app or website",
-        "cannot connect to the server for this app or website",
-        "this app or website at this time",
-        "just a moment",
-        "performing security verification",
-        "skip to content",
-        "this website uses a security service",
-        "latest news stories from around the world",
-        "privacy statement",
-        "cookie policy",
-        "reset password",
-        "wrong login information",
-        "iniciar sesión",
-        "wrong site?",
-        "go back hide about us",
-        "main topics",
-        "featured topics",
-        "a lock ( ) or https://",
-        "latest news stories from around the world",
-    ]):
+    if has_marker(_PREVIEW_REJECT_MARKERS, low):
         return ""
     if "](http" in clean.lower() or clean.count("[") >= 3:
         return ""
@@ -1304,99 +1523,37 @@ def _validate_preview_text(text: str) -> str:
 
 
 def _detect_content_language(*texts: str) -> str:
-    combined = " ".join([_normalize_text_block(text) for text in texts if text]).strip()
-    if not combined:
-        return "other"
-    low = combined.lower()
-
-    spanish_markers = {
-        " de ", " la ", " el ", " y ", " en ", " para ", " por ", " con ", " una ", " del ",
-        "venezuela", "gobierno", "economía", "petróleo", "inflación", "mercado", "sanciones",
-    }
-    english_markers = {
-        " the ", " and ", " in ", " for ", " with ", " from ", " that ", " this ", "venezuela",
-        "government", "economy", "oil", "inflation", "market", "sanctions",
-    }
-    score_es = sum(1 for marker in spanish_markers if marker in f" {low} ")
-    score_en = sum(1 for marker in english_markers if marker in f" {low} ")
-
-    # Accented Spanish characters are a helpful signal, but not definitive on their own
-    # since names and quotes can appear in otherwise English text.
-    accent_hits = len(re.findall(r"[áéíóúñ¿¡]", low))
-    if accent_hits >= 2:
-        score_es += 1
-
-    words = re.findall(r"[a-záéíóúñ]+", low)
-    if words:
-        spanish_stopwords = {
-            "de", "la", "el", "y", "en", "para", "por", "con", "una", "del", "los", "las", "que", "se", "es", "al",
-        }
-        english_stopwords = {
-            "the", "and", "in", "for", "with", "from", "that", "this", "to", "of", "on", "as", "is", "are", "by",
-        }
-        es_hits = sum(1 for word in words if word in spanish_stopwords)
-        en_hits = sum(1 for word in words if word in english_stopwords)
-        score_es += es_hits // 2
-        score_en += en_hits // 2
-    if score_es == 0 and score_en == 0:
-        if re.search(r"[a-z]", low):
-            return "en"
-        return "other"
-    if score_es >= score_en + 1:
-        return "es"
-    if score_en >= score_es + 1:
-        return "en"
-    # Tie-breaker: default to English for ASCII-latin text when Spanish signal is not stronger.
-    if re.search(r"[a-z]", low) and not re.search(r"[áéíóúñ¿¡]", low):
-        return "en"
-    return "other"
+    return detect_language(*texts)
 
 
 def _is_probable_homepage_url(url: str) -> bool:
     if not url:
         return True
-    try:
-        parsed = urlparse(url)
-    except Exception:  # noqa: BLE001
-        return True
+    return parse_url(url).is_homepage
 
-    path = (parsed.path or "").strip().lower()
-    if path in {"", "/", "/home", "/home/", "/index", "/index/", "/index.html", "/en", "/es"}:
-        return True
 
-    segments = [segment for segment in path.split("/") if segment]
-    if len(segments) <= 1 and not parsed.query:
-        return True
-    return False
+PAYWALLED_DOMAINS = frozenset({"wsj.com", "bloomberg.com", "ft.com", "economist.com"})
 
 
 def _is_paywalled_or_firewalled_domain(url: str) -> bool:
-    host = _domain(url).lower().strip()
-    blocked = [
-        "wsj.com",
-        "bloomberg.com",
-        "ft.com",
-        "economist.com",
-    ]
-    return any(host == domain or host.endswith(f".{domain}") for domain in blocked)
+    return domain_in(parse_url(url).host, PAYWALLED_DOMAINS)
 
 
 def _is_valid_resource_url(url: str) -> bool:
     if not url:
         return False
-    try:
-        parsed = urlparse(url)
-    except Exception:  # noqa: BLE001
+    parsed = parse_url(url)
+    if not parsed.ok:
         return False
-    host = (parsed.netloc or "").lower().strip()
+    host = parsed.netloc.strip()
     if not host:
         return False
     if "news.google.com" in host:
         return False
-    if _is_paywalled_or_firewalled_domain(url):
+    if domain_in(parsed.host, PAYWALLED_DOMAINS):
         return False
 
-    path = (parsed.path or "").lower()
+    path = parsed.path_lower
     bad_exact = {
         "",
         "/",
@@ -1439,10 +1596,10 @@ def _is_valid_resource_url(url: str) -> bool:
     if any(path.startswith(prefix) for prefix in bad_starts):
         return False
 
-    if _is_probable_homepage_url(url):
+    if parsed.is_homepage:
         return False
 
-    segments = [segment for segment in path.split("/") if segment]
+    segments = parsed.segments
     if len(segments) < 2:
         return False
 
@@ -1479,7 +1636,6 @@ def _is_valid_resource_url(url: str) -> bool:
 
 def _load_preview_cache(latest_payload_path: str) -> dict[str, dict]:
     cache: dict[str, dict] = {}
-    allowed_sources = {"trafilatura", "readability", "jina", "cache", "fallback_summary"}
     if not os.path.exists(latest_payload_path):
         return cache
     try:
@@ -1504,12 +1660,209 @@ def _load_preview_cache(latest_payload_path: str) -> dict[str, dict]:
             if not preview:
                 continue
             source = str(item.get("preview_source", "cache") or "cache").strip() or "cache"
-            if source not in allowed_sources:
+            if source not in PREVIEW_SOURCES:
                 continue
             cache[url] = {"preview": preview, "preview_source": source}
     return cache
 
 
+def _preview_store_key(url: str) -> str:
+    return _canonical_url_for_dedupe(url) or str(url or "").strip()
+
+
+def _load_preview_store(path: str) -> None:
+    global _PREVIEW_STORE, _PREVIEW_STATS
+    _PREVIEW_STORE = {}
+    _PREVIEW_STATS = {"hits": 0, "misses": 0, "expired": 0, "seeded": 0}
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            loaded = json.load(fh)
+        if isinstance(loaded, dict):
+            _PREVIEW_STORE = {
+                key: record
+                for key, record in loaded.items()
+                if isinstance(record, dict) and record.get("preview")
+            }
+    except (json.JSONDecodeError, OSError):
+        _PREVIEW_STORE = {}
+
+
+def _save_preview_store(path: str, now_ts: int) -> None:
+    live = {
+        key: record
+        for key, record in _PREVIEW_STORE.items()
+        if now_ts - int(record.get("extracted_at", 0) or 0) <= int(record.get("ttl", 0) or 0)
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(live, fh, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def _preview_store_get(url: str, now_ts: int) -> dict | None:
+    record = _PREVIEW_STORE.get(_preview_store_key(url))
+    if record is None:
+        _PREVIEW_STATS["misses"] = _PREVIEW_STATS.get("misses", 0) + 1
+        return None
+    if now_ts - int(record.get("extracted_at", 0) or 0) > int(record.get("ttl", 0) or 0):
+        _PREVIEW_STATS["expired"] = _PREVIEW_STATS.get("expired", 0) + 1
+        _PREVIEW_STATS["misses"] = _PREVIEW_STATS.get("misses", 0) + 1
+        return None
+    _PREVIEW_STATS["hits"] = _PREVIEW_STATS.get("hits", 0) + 1
+    return {"preview": record["preview"], "preview_source": record.get("preview_source", "cache")}
+
+
+def _preview_store_put(url: str, preview: str, source: str, now_ts: int, ttl_seconds: int) -> None:
+    key = _preview_store_key(url)
+    if not key or not preview or source not in PREVIEW_SOURCES:
+        return
+    _PREVIEW_STORE[key] = {
+        "url": str(url or "").strip(),
+        "preview": preview,
+        "preview_source": source,
+        "extracted_at": int(now_ts),
+        "ttl": int(ttl_seconds),
+    }
+
+
+def _seed_preview_store(legacy_cache: dict[str, dict], now_ts: int, ttl_seconds: int) -> None:
+    """Carry previews from the previous latest.json into an empty or partial store."""
+    for url, payload in legacy_cache.items():
+        if _preview_store_key(url) in _PREVIEW_STORE:
+            continue
+        _preview_store_put(url, payload.get("preview", ""), payload.get("preview_source", "cache"), now_ts, ttl_seconds)
+        _PREVIEW_STATS["seeded"] = _PREVIEW_STATS.get("seeded", 0) + 1
+
+
+def _preview_store_summary() -> dict:
+    hits = int(_PREVIEW_STATS.get("hits", 0))
+    misses = int(_PREVIEW_STATS.get("misses", 0))
+    lookups = hits + misses
+    return {
+        "entries": len(_PREVIEW_STORE),
+        "hits": hits,
+        "misses": misses,
+        "expired": int(_PREVIEW_STATS.get("expired", 0)),
+        "seeded": int(_PREVIEW_STATS.get("seeded", 0)),
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+    }
+
+
+def _config_hash(cfg: dict) -> str:
+    raw = json.dumps(cfg, sort_keys=True, default=str)
+    return hashlib.sha1(f"{DERIVED_MEMO_VERSION}|{raw}".encode("utf-8")).hexdigest()[:16]
+
+
+def _source_text_hash(entry: dict) -> str:
+    """Hash every entry field the derived intelligence is computed from."""
+    published = entry.get("published")
+    parts = [
+        str(entry.get("title", "") or ""),
+        str(entry.get("link", "") or ""),
+        str(entry.get("summary", "") or ""),
+        str(entry.get("snippet", "") or ""),
+        str(entry.get("snippet_status", "") or ""),
+        str(entry.get("article_text", "") or ""),
+        str(entry.get("meta_description", "") or ""),
+        str(entry.get("first_paragraph", "") or ""),
+        str(entry.get("source_domain", "") or ""),
+        str(entry.get("source_url", "") or ""),
+        published.isoformat() if hasattr(published, "isoformat") else str(published or ""),
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _load_derived_memo(path: str) -> None:
+    global _DERIVED_MEMO, _DERIVED_MEMO_STATS
+    _DERIVED_MEMO = {}
+    _DERIVED_MEMO_STATS = {"hits": 0, "misses": 0, "stale": 0}
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            loaded = json.load(fh)
+        if isinstance(loaded, dict):
+            _DERIVED_MEMO = {
+                key: record
+                for key, record in loaded.items()
+                if isinstance(record, dict) and isinstance(record.get("fields"), dict)
+            }
+    except (json.JSONDecodeError, OSError):
+        _DERIVED_MEMO = {}
+
+
+def _save_derived_memo(path: str, now_ts: int, ttl_seconds: int) -> None:
+    live = {
+        key: record
+        for key, record in _DERIVED_MEMO.items()
+        if now_ts - int(record.get("used_at", 0) or 0) <= ttl_seconds
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(live, fh, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def _derived_memo_get(
+    url: str, source_hash: str, config_hash: str, now_ts: int, previous_summary: str = ""
+) -> dict | None:
+    """Memoised fields for ``url`` when its source and config are unchanged.
+
+    The previous snapshot's summary only feeds number extraction when it
+    differs from the summary derived now, so it invalidates a record only then.
+    """
+    record = _DERIVED_MEMO.get(_preview_store_key(url))
+    if record is None:
+        _DERIVED_MEMO_STATS["misses"] = _DERIVED_MEMO_STATS.get("misses", 0) + 1
+        return None
+    fields = record["fields"]
+    if (
+        record.get("source_hash") != source_hash
+        or record.get("config_hash") != config_hash
+        or (previous_summary and previous_summary != fields.get("summary_text"))
+    ):
+        _DERIVED_MEMO_STATS["stale"] = _DERIVED_MEMO_STATS.get("stale", 0) + 1
+        _DERIVED_MEMO_STATS["misses"] = _DERIVED_MEMO_STATS.get("misses", 0) + 1
+        return None
+    if any(name not in fields for name in DERIVED_MEMO_FIELDS):
+        _DERIVED_MEMO_STATS["misses"] = _DERIVED_MEMO_STATS.get("misses", 0) + 1
+        return None
+    record["used_at"] = int(now_ts)
+    _DERIVED_MEMO_STATS["hits"] = _DERIVED_MEMO_STATS.get("hits", 0) + 1
+    return json.loads(json.dumps(fields))
+
+
+def _derived_memo_put(url: str, source_hash: str, config_hash: str, fields: dict, now_ts: int) -> None:
+    key = _preview_store_key(url)
+    if not key:
+        return
+    _DERIVED_MEMO[key] = {
+        "source_hash": source_hash,
+        "config_hash": config_hash,
+        "fields": json.loads(json.dumps({name: fields[name] for name in DERIVED_MEMO_FIELDS if name in fields})),
+        "used_at": int(now_ts),
+    }
+
+
+def _derived_memo_summary() -> dict:
+    hits = int(_DERIVED_MEMO_STATS.get("hits", 0))
+    misses = int(_DERIVED_MEMO_STATS.get("misses", 0))
+    lookups = hits + misses
+    return {
+        "entries": len(_DERIVED_MEMO),
+        "hits": hits,
+        "misses": misses,
+        "stale": int(_DERIVED_MEMO_STATS.get("stale", 0)),
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+    }
+
+
 def _clean_snippet(
     text: str,
     title: str,
@@ -1550,15 +1903,11 @@ def _clean_snippet(
 
 
 def _normalize_text_block(text: str) -> str:
-    clean = re.sub(r"<[^>]+>", " ", text or "")
-    clean = unescape(clean)
-    clean = re.sub(r"\s+", " ", clean).strip()
-    return clean
+    return normalize_text_block(text)
 
 
-def _sentence_is_noise(sentence: str) -> bool:
-    lower = sentence.lower()
-    noisy_markers = [
+_SENTENCE_NOISE_MARKERS = compile_markers(
+    [
         "request blocked",
         "we can't connect to the server",
         "we cant connect to the server",
@@ -1600,20 +1949,27 @@ def _sentence_is_noise(sentence: str) -> bool:
         "share this article",
         "advertisement",
     ]
-    if any(marker in lower for marker in noisy_markers):
+)
+_PERCENT_RE = re.compile(r"[+-]?\d+(?:\.\d+)?%")
+_PLAIN_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_ASCII_ALNUM_RE = re.compile(r"[A-Za-z0-9]")
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def _sentence_is_noise(sentence: str) -> bool:
+    if has_marker(_SENTENCE_NOISE_MARKERS, sentence.lower()):
         return True
 
     # Filter out ticker-like fragments with repeated +/- percentage patterns.
-    pct_hits = len(re.findall(r"[+-]?\d+(?:\.\d+)?%", sentence))
-    price_hits = len(re.findall(r"\b\d+(?:\.\d+)?\b", sentence))
+    pct_hits = len(_PERCENT_RE.findall(sentence))
+    price_hits = len(_PLAIN_NUMBER_RE.findall(sentence))
     if pct_hits >= 2 and price_hits >= 4:
         return True
 
     # Reject sentences that are mostly symbols/numbers (common in scraped nav/ticker text).
-    alnum = re.findall(r"[A-Za-z0-9]", sentence)
-    letters = re.findall(r"[A-Za-z]", sentence)
+    alnum = len(_ASCII_ALNUM_RE.findall(sentence))
     if alnum:
-        letter_ratio = len(letters) / len(alnum)
+        letter_ratio = len(_ASCII_LETTER_RE.findall(sentence)) / alnum
         if letter_ratio < 0.55:
             return True
 
@@ -1905,73 +2261,83 @@ def _summary_confidence_label(entry: dict) -> str:
     return mapping.get(source, "Unknown")
 
 
+TIER_1_DOMAINS = frozenset(
+    {
+        # wire services
+        "reuters.com", "apnews.com", "bloomberg.com", "ft.com", "wsj.com",
+        # NGOs and multilaterals
+        "paho.org", "who.int", "reliefweb.int", "worldbank.org", "nrc.no",
+        # major media
+        "bbc.com", "cnn.com", "nytimes.com", "nbcnews.com",
+    }
+)
+TIER_2_DOMAINS = frozenset(
+    {"elpitazo.net", "efectococuyo.com", "el-nacional.com", "talcualdigital.com", "venezuelanalysis.com"}
+)
+
+
+@lru_cache(maxsize=1024)
 def _source_quality_tier(domain: str) -> str:
     host = (domain or "").lower().strip()
     if not host:
         return "Unknown"
-
-    wire = ("reuters.com", "apnews.com", "bloomberg.com", "ft.com", "wsj.com")
-    ngo_multilateral = ("paho.org", "who.int", "reliefweb.int", "worldbank.org", "nrc.no")
-    major_media = ("bbc.com", "cnn.com", "nytimes.com", "wsj.com", "ft.com", "nbcnews.com")
-    local_regional = ("elpitazo.net", "efectococuyo.com", "el-nacional.com", "talcualdigital.com", "venezuelanalysis.com")
-
-    if any(host == d or host.endswith(f".{d}") for d in wire):
+    if domain_in(host, TIER_1_DOMAINS):
         return "Tier 1"
-    if any(host == d or host.endswith(f".{d}") for d in ngo_multilateral):
-        return "Tier 1"
-    if any(host == d or host.endswith(f".{d}") for d in major_media):
-        return "Tier 1"
-    if any(host == d or host.endswith(f".{d}") for d in local_regional):
+    if domain_in(host, TIER_2_DOMAINS):
         return "Tier 2"
     return "Tier 3"
 
 
-def _classify_event_types(entry: dict) -> list[str]:
-    text = _text(entry)
-    event_map = {
-        "Sanctions": ["sanction", "ofac", "license", "embargo", "asset freeze"],
-        "Oil production/export": ["oil", "pdvsa", "barrel", "bpd", "export", "refinery", "cargo"],
-        "Political transition": ["election", "opposition", "transition", "cabinet", "decree", "maduro"],
-        "Regulatory reform": ["regulation", "regulatory", "reform", "law", "framework", "compliance"],
-        "Humanitarian crisis": ["hunger", "malnutrition", "crisis", "humanitarian", "displacement"],
-        "FX / Inflation": ["inflation", "exchange", "fx", "currency", "devaluation", "bolivar"],
-        "Debt restructuring": ["debt", "bond", "restructuring", "creditor", "sovereign spread"],
-        "Security": ["security", "military", "protest", "violence", "guerrilla", "conflict"],
-    }
-    events = [event for event, terms in event_map.items() if any(term in text for term in terms)]
+_EVENT_TYPE_TERMS: dict[str, tuple[str, ...]] = {
+    "Sanctions": ("sanction", "ofac", "license", "embargo", "asset freeze"),
+    "Oil production/export": ("oil", "pdvsa", "barrel", "bpd", "export", "refinery", "cargo"),
+    "Political transition": ("election", "opposition", "transition", "cabinet", "decree", "maduro"),
+    "Regulatory reform": ("regulation", "regulatory", "reform", "law", "framework", "compliance"),
+    "Humanitarian crisis": ("hunger", "malnutrition", "crisis", "humanitarian", "displacement"),
+    "FX / Inflation": ("inflation", "exchange", "fx", "currency", "devaluation", "bolivar"),
+    "Debt restructuring": ("debt", "bond", "restructuring", "creditor", "sovereign spread"),
+    "Security": ("security", "military", "protest", "violence", "guerrilla", "conflict"),
+}
+_ENTITY_TERMS: dict[str, tuple[str, ...]] = {
+    "PDVSA": ("pdvsa",),
+    "Maduro": ("maduro",),
+    "OFAC": ("ofac", "license"),
+    "IMF": ("imf", "international monetary fund"),
+    "Chevron": ("chevron",),
+    "Bond restructuring": ("bond", "restructuring", "creditor"),
+    "FX controls": ("fx", "exchange", "currency control", "devaluation"),
+}
+_POSITIVE_TERMS = ("agreement", "easing", "recovery", "growth", "approval", "restart", "deal")
+_NEGATIVE_TERMS = ("sanction", "crisis", "decline", "shortage", "default", "conflict", "risk", "protest")
+_HIGH_IMPACT_TERMS = ("sanction", "oil", "pdvsa", "debt", "inflation", "export", "license", "regulation")
+_MEDIUM_IMPACT_TERMS = ("policy", "investment", "currency", "humanitarian", "security")
+# Every distinct term across the taxonomies above, so each is tested against the text once.
+_INTELLIGENCE_TERMS = tuple(
+    dict.fromkeys(
+        [term for terms in _EVENT_TYPE_TERMS.values() for term in terms]
+        + [term for terms in _ENTITY_TERMS.values() for term in terms]
+        + list(_POSITIVE_TERMS + _NEGATIVE_TERMS + _HIGH_IMPACT_TERMS + _MEDIUM_IMPACT_TERMS)
+    )
+)
+
+
+def _intelligence_hits(text: str) -> frozenset[str]:
+    return frozenset(term for term in _INTELLIGENCE_TERMS if term in text)
+
+
+def _events_from_hits(hits: frozenset[str]) -> list[str]:
+    events = [event for event, terms in _EVENT_TYPE_TERMS.items() if any(term in hits for term in terms)]
     return events[:3]
 
 
-def _detect_entities(entry: dict) -> list[str]:
-    text = _text(entry)
-    entities = [
-        "PDVSA",
-        "Maduro",
-        "OFAC",
-        "IMF",
-        "Chevron",
-        "Bond restructuring",
-        "FX controls",
-    ]
-    checks = {
-        "PDVSA": ["pdvsa"],
-        "Maduro": ["maduro"],
-        "OFAC": ["ofac", "license"],
-        "IMF": ["imf", "international monetary fund"],
-        "Chevron": ["chevron"],
-        "Bond restructuring": ["bond", "restructuring", "creditor"],
-        "FX controls": ["fx", "exchange", "currency control", "devaluation"],
-    }
-    out = [name for name in entities if any(token in text for token in checks[name])]
+def _entities_from_hits(hits: frozenset[str]) -> list[str]:
+    out = [name for name, terms in _ENTITY_TERMS.items() if any(term in hits for term in terms)]
     return out[:4]
 
 
-def _sentiment_label(entry: dict) -> str:
-    text = _text(entry)
-    positive_terms = ["agreement", "easing", "recovery", "growth", "approval", "restart", "deal"]
-    negative_terms = ["sanction", "crisis", "decline", "shortage", "default", "conflict", "risk", "protest"]
-    pos = sum(1 for token in positive_terms if token in text)
-    neg = sum(1 for token in negative_terms if token in text)
+def _sentiment_from_hits(hits: frozenset[str]) -> str:
+    pos = sum(1 for token in _POSITIVE_TERMS if token in hits)
+    neg = sum(1 for token in _NEGATIVE_TERMS if token in hits)
     if neg >= pos + 1:
         return "Negative"
     if pos >= neg + 1:
@@ -1979,22 +2345,16 @@ def _sentiment_label(entry: dict) -> str:
     return "Neutral"
 
 
-def _materiality_score(entry: dict) -> int:
-    text = _text(entry)
+def _materiality_from_hits(hits: frozenset[str], source_tier: str) -> int:
     score = 1
-    high_impact = ["sanction", "oil", "pdvsa", "debt", "inflation", "export", "license", "regulation"]
-    medium_impact = ["policy", "investment", "currency", "humanitarian", "security"]
-    score += min(2, sum(1 for token in high_impact if token in text))
-    score += min(1, sum(1 for token in medium_impact if token in text))
-    if _source_quality_tier(entry.get("source_domain", "")) == "Tier 1":
+    score += min(2, sum(1 for token in _HIGH_IMPACT_TERMS if token in hits))
+    score += min(1, sum(1 for token in _MEDIUM_IMPACT_TERMS if token in hits))
+    if source_tier == "Tier 1":
         score += 1
     return max(1, min(5, score))
 
 
-def _risk_score(entry: dict) -> int:
-    sentiment = _sentiment_label(entry)
-    materiality = _materiality_score(entry)
-    events = _classify_event_types(entry)
+def _risk_from_signals(sentiment: str, materiality: int, events: list[str]) -> int:
     base = materiality * 15
     if sentiment == "Negative":
         base += 20
@@ -2009,12 +2369,43 @@ def _risk_score(entry: dict) -> int:
     return max(0, min(100, base))
 
 
+def _classify_event_types(entry: dict) -> list[str]:
+    return _events_from_hits(_intelligence_hits(_text(entry)))
+
+
+def _detect_entities(entry: dict) -> list[str]:
+    return _entities_from_hits(_intelligence_hits(_text(entry)))
+
+
+def _sentiment_label(entry: dict) -> str:
+    return _sentiment_from_hits(_intelligence_hits(_text(entry)))
+
+
+def _materiality_score(entry: dict) -> int:
+    hits = _intelligence_hits(_text(entry))
+    return _materiality_from_hits(hits, _source_quality_tier(entry.get("source_domain", "")))
+
+
+def _risk_score(entry: dict) -> int:
+    hits = _intelligence_hits(_text(entry))
+    return _risk_from_signals(
+        _sentiment_from_hits(hits),
+        _materiality_from_hits(hits, _source_quality_tier(entry.get("source_domain", ""))),
+        _events_from_hits(hits),
+    )
+
+
 def _annotate_intelligence(entry: dict) -> None:
-    entry["event_types"] = _classify_event_types(entry)
-    entry["sentiment"] = _sentiment_label(entry)
-    entry["materiality"] = _materiality_score(entry)
-    entry["risk_score"] = _risk_score(entry)
-    entry["entities"] = _detect_entities(entry)
+    """Derive events, sentiment, materiality, risk and entities from one pass over the text."""
+    hits = _intelligence_hits(_text(entry))
+    events = _events_from_hits(hits)
+    sentiment = _sentiment_from_hits(hits)
+    materiality = _materiality_from_hits(hits, _source_quality_tier(entry.get("source_domain", "")))
+    entry["event_types"] = events
+    entry["sentiment"] = sentiment
+    entry["materiality"] = materiality
+    entry["risk_score"] = _risk_from_signals(sentiment, materiality, events)
+    entry["entities"] = _entities_from_hits(hits)
 
 
 def _sparkline(values: list[float]) -> str:
@@ -2200,46 +2591,81 @@ def _deterministic_pick(seed: str, options: list[str]) -> str:
     return options[idx]
 
 
+_NUMBER_PATTERN = re.compile(
+    r"(?<!\w)(?P<currency>US\$|\$)?(?P<number>\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d+)?)"
+    r"(?P<unit>%|\s?(?:bpd|barrels(?:/day)?|million|billion|bn|m|days?|months?|years?))?(?!\w)",
+    flags=re.IGNORECASE,
+)
+_NUMBER_UNIT_SCALE = {"million": 1e6, "m": 1e6, "billion": 1e9, "bn": 1e9}
+_NUMBER_UNIT_KIND = {
+    "%": "%",
+    "bpd": "bpd",
+    "barrels/day": "bpd",
+    "barrels": "barrels",
+    "day": "day",
+    "days": "day",
+    "month": "month",
+    "months": "month",
+    "year": "year",
+    "years": "year",
+}
+_NUMBER_PRIORITY_TERMS = (
+    "sanction", "treasury", "oil", "pdvsa", "release", "prison", "amnesty", "election",
+    "health", "outbreak", "inflation", "fx", "debt", "revenue", "license", "arrest",
+)
+_NUMBER_LABELS = (
+    ("Detentions and releases", ("release", "prison", "amnesty", "arrest")),
+    ("Sanctions and state revenue", ("sanction", "treasury", "license", "revenue")),
+    ("Oil and production", ("oil", "pdvsa", "barrel", "bpd")),
+    ("Health signal", ("health", "outbreak", "dengue", "hospital")),
+    ("Macro and finance", ("inflation", "fx", "debt", "bond")),
+)
+_MONTH_ABBREV_RE = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\b")
+_MONTH_OR_PERIOD_RE = re.compile(r"\b(week|month|year|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b")
+_MAGNITUDE_HINT_RE = re.compile(r"bpd|barrel|million|billion|bn|m", flags=re.IGNORECASE)
+_BOILERPLATE_CONTEXT_RE = re.compile(r"\b(today|homepage|menu|copyright|privacy)\b")
+_WORD_RE = re.compile(r"\S+")
+
+
+def _normalized_number_key(match: re.Match) -> str:
+    """Canonical numeric form so "$2 billion", "US$2bn" and "$2,000 million" collapse together."""
+    groups = re.split(r"[\.,]", match.group("number"))
+    if len(groups) > 1 and len(groups[-1]) != 3:
+        magnitude = float(f"{''.join(groups[:-1])}.{groups[-1]}")
+    else:
+        magnitude = float("".join(groups))
+    unit = (match.group("unit") or "").strip().lower()
+    magnitude *= _NUMBER_UNIT_SCALE.get(unit, 1.0)
+    currency = "usd" if match.group("currency") else ""
+    return f"{currency}{magnitude:g}{_NUMBER_UNIT_KIND.get(unit, '')}"
+
+
 def _extract_numbers(text: str) -> list[dict]:
     clean = _normalize_text_block(text)
     if not clean:
         return []
-    words = clean.split()
-    if not words:
+    word_matches = list(_WORD_RE.finditer(clean))
+    if not word_matches:
         return []
-
-    spans = []
-    cursor = 0
-    for word in words:
-        start = clean.find(word, cursor)
-        end = start + len(word)
-        spans.append((start, end))
-        cursor = end
+    words = [m.group(0) for m in word_matches]
+    starts = [m.start() for m in word_matches]
+    ends = [m.end() for m in word_matches]
 
     def _word_index(char_pos: int) -> int:
-        for idx, (start, end) in enumerate(spans):
-            if start <= char_pos < end:
-                return idx
-        return max(0, min(len(spans) - 1, len(spans) // 2))
+        idx = bisect_right(starts, char_pos) - 1
+        if idx >= 0 and char_pos < ends[idx]:
+            return idx
+        return max(0, min(len(words) - 1, len(words) // 2))
 
-    pattern = re.compile(
-        r"(?<!\w)(?:US\$|\$)?\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d+)?(?:%|\s?(?:bpd|barrels(?:/day)?|million|billion|bn|m|days?|months?|years?))?(?!\w)",
-        flags=re.IGNORECASE,
-    )
-    priority_terms = (
-        "sanction", "treasury", "oil", "pdvsa", "release", "prison", "amnesty", "election",
-        "health", "outbreak", "inflation", "fx", "debt", "revenue", "license", "arrest",
-    )
-
-    candidates = []
-    seen = set()
-    for match in pattern.finditer(clean):
+    best: dict[str, dict] = {}
+    for match in _NUMBER_PATTERN.finditer(clean):
         value = match.group(0).strip()
         if not value:
             continue
-        if re.fullmatch(r"\d{4}", value) and value.startswith("20"):
+        is_short_int = len(value) <= 2 and value.isdigit()
+        if len(value) == 4 and value.isdigit() and value.startswith("20"):
             continue
-        if re.fullmatch(r"\d{1,2}", value) and int(value) < 5 and "%" not in value and "$" not in value:
+        if is_short_int and int(value) < 5:
             continue
         word_idx = _word_index(match.start())
         left = max(0, word_idx - 12)
@@ -2248,38 +2674,34 @@ def _extract_numbers(text: str) -> list[dict]:
         if len(context) < 20:
             continue
         context_lower = context.lower()
-        if re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)\b", context_lower):
-            if "%" not in value and "$" not in value and not re.search(r"bpd|barrel|million|billion|bn|m", value, flags=re.IGNORECASE):
+        has_rate_or_money = "%" in value or "$" in value
+        if _MONTH_ABBREV_RE.search(context_lower):
+            if not has_rate_or_money and not _MAGNITUDE_HINT_RE.search(value):
                 continue
-        if re.fullmatch(r"\d{1,2}", value) and re.search(r"\b(week|month|year|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b", context_lower):
+        if is_short_int and _MONTH_OR_PERIOD_RE.search(context_lower):
             continue
         score = 0
-        if any(term in context_lower for term in priority_terms):
+        if any(term in context_lower for term in _NUMBER_PRIORITY_TERMS):
             score += 3
-        if "%" in value or "$" in value or "bpd" in value.lower() or "barrel" in value.lower():
+        value_lower = value.lower()
+        if has_rate_or_money or "bpd" in value_lower or "barrel" in value_lower:
             score += 2
-        if re.search(r"\b(today|homepage|menu|copyright|privacy)\b", context_lower):
+        if _BOILERPLATE_CONTEXT_RE.search(context_lower):
             score -= 3
 
         label = "Policy or market figure"
-        if any(term in context_lower for term in ("release", "prison", "amnesty", "arrest")):
-            label = "Detentions and releases"
-        elif any(term in context_lower for term in ("sanction", "treasury", "license", "revenue")):
-            label = "Sanctions and state revenue"
-        elif any(term in context_lower for term in ("oil", "pdvsa", "barrel", "bpd")):
-            label = "Oil and production"
-        elif any(term in context_lower for term in ("health", "outbreak", "dengue", "hospital")):
-            label = "Health signal"
-        elif any(term in context_lower for term in ("inflation", "fx", "debt", "bond")):
-            label = "Macro and finance"
-
-        dedupe_key = f"{value.lower()}|{context_lower[:100]}"
-        if dedupe_key in seen:
-            continue
-        seen.add(dedupe_key)
-        candidates.append({"label": label, "value": value, "context": clamp_text_py(context, 120), "score": score})
+        for candidate_label, terms in _NUMBER_LABELS:
+            if any(term in context_lower for term in terms):
+                label = candidate_label
+                break
 
-    candidates.sort(key=lambda item: (int(item.get("score", 0)), len(str(item.get("context", "")))), reverse=True)
+        record = {"label": label, "value": value, "context": clamp_text_py(context, 120), "score": score}
+        dedupe_key = _normalized_number_key(match)
+        current = best.get(dedupe_key)
+        if current is None or (score, len(record["context"])) > (current["score"], len(current["context"])):
+            best[dedupe_key] = record
+
+    candidates = sorted(best.values(), key=lambda item: (item["score"], len(item["context"])), reverse=True)
     return candidates[:8]
 
 
@@ -2313,12 +2735,9 @@ def _icons_for_item(item: dict) -> list[str]:
         icons.append("HUMAN")
     if item.get("flags", {}).get("new"):
         icons.append("NEW")
-    try:
-        pub = dateutil_parser.parse(item.get("publishedAt", ""))
-        if (datetime.now(timezone.utc) - pub).total_seconds() <= 172800:
-            icons.append("NEW")
-    except Exception:  # noqa: BLE001
-        pass
+    pub = parse_datetime(item.get("publishedAt", ""))
+    if pub is not None and (datetime.now(timezone.utc) - pub).total_seconds() <= 172800:
+        icons.append("NEW")
     deduped = []
     for icon in icons:
         if icon not in deduped:
@@ -3205,48 +3624,112 @@ def build_markdown(entries: list[dict], cfg: dict, run_meta: dict) -> str:
 # Main pipeline
 # ---------------------------------------------------------------------------
 
-def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
+def _collect_candidates(feed_urls: list[str], cfg: dict, now: datetime, max_results: int) -> tuple[list[dict], dict]:
+    """Fetch, filter, gate, dedupe and rank; return the ranked candidates and per-stage counts."""
+    if (cfg.get("pipeline", {}) or {}).get("streaming", False):
+        with run_metrics.span("collect"):
+            ranked, counts = stream_candidates(feed_urls, cfg, now, max_results)
+        logger.info("Total fetched: %d", counts["fetched"])
+        logger.info("After filtering: %d", counts["filtered"])
+        logger.info("After link quality gate: %d", counts["link_gated"])
+        logger.info("After deduplication: %d (%d kept as candidates)", counts["deduped"], len(ranked))
+        return ranked, counts
+
+    raw_entries = list(iter_feed_entries(feed_urls))
+    logger.info("Total fetched: %d", len(raw_entries))
+
+    with run_metrics.span("filter"):
+        filtered = filter_entries(raw_entries, cfg, now)
+    filtered_count = len(filtered)
+    logger.info("After filtering: %d", filtered_count)
+
+    with run_metrics.span("link_gate"):
+        filtered = apply_link_quality_gate(filtered, cfg)
+    logger.info("After link quality gate: %d", len(filtered))
+
+    threshold = cfg.get("deduplication", {}).get("title_similarity_threshold", 0.90)
+    with run_metrics.span("dedupe"):
+        deduped = deduplicate(filtered, threshold, cfg=cfg)
+    logger.info("After deduplication: %d", len(deduped))
+
+    with run_metrics.span("score"):
+        ranked = score_and_rank(deduped, cfg, now)
+    counts = {
+        "fetched": len(raw_entries),
+        "filtered": filtered_count,
+        "link_gated": len(filtered),
+        "deduped": len(deduped),
+    }
+    return ranked, counts
+
+
+def run(
+    config_path: str = CONFIG_PATH,
+    feeds_path: str = FEEDS_PATH,
+    profile_dir: str = "",
+    resume: str = "",
+) -> dict:
+    """Collect, rank and publish one brief; return the latest.json payload.
+
+    Stage outputs are checkpointed under ``DATA_DIR/checkpoints/<run_id>``.
+    With ``resume`` (``"latest"`` or a run ID) a failed run with the same
+    config and feeds picks up after its last completed stage, using that
+    run's clock.
+    """
     global _REJECTED_LINKS
     _REJECTED_LINKS = []
-    _load_redirect_cache()
+    run_metrics.reset(profile_dir)
+    redirect_cache_path = os.path.join(DATA_DIR, REDIRECT_CACHE_FILENAME)
+    _load_redirect_cache(redirect_cache_path)
 
     cfg = load_config(config_path)
     feed_urls = load_feeds(feeds_path)
     now = datetime.now(timezone.utc)
 
-    logger.info("Fetching %d feeds…", len(feed_urls))
-    raw_entries: list[dict] = []
-    for url in feed_urls:
-        fetched = fetch_feed(url)
-        logger.info("  %s → %d entries", url, len(fetched))
-        raw_entries.extend(fetched)
-
-    fetched_count = len(raw_entries)
-    logger.info("Total fetched: %d", fetched_count)
-
-    filtered = filter_entries(raw_entries, cfg, now)
-    filtered_count = len(filtered)
-    logger.info("After filtering: %d", filtered_count)
-
-    filtered = apply_link_quality_gate(filtered, cfg)
-    filtered_link_count = len(filtered)
-    logger.info("After link quality gate: %d", filtered_link_count)
-
-    threshold = cfg.get("deduplication", {}).get("title_similarity_threshold", 0.90)
-    deduped = deduplicate(filtered, threshold, cfg=cfg)
-    deduped_count = len(deduped)
-    logger.info("After deduplication: %d", deduped_count)
+    checkpoint_cfg = cfg.get("checkpoints", {}) or {}
+    checkpoints_enabled = bool(checkpoint_cfg.get("enabled", True))
+    checkpoint_root = os.path.join(DATA_DIR, CHECKPOINT_DIRNAME)
+    run_inputs = checkpoints.fingerprint(config_path, feeds_path)
+    run_dir = ""
+    if checkpoints_enabled and resume:
+        run_dir = checkpoints.find_resumable(checkpoint_root, run_inputs, "" if resume == "latest" else resume)
+        if run_dir:
+            now = datetime.fromisoformat(checkpoints.manifest(run_dir)["now"])
+            logger.info("Resuming run %s", os.path.basename(run_dir))
+        else:
+            logger.warning("No checkpointed run to resume for these inputs; starting fresh")
+    if checkpoints_enabled and not run_dir:
+        run_dir = checkpoints.start(checkpoint_root, now, run_inputs)
 
-    ranked = score_and_rank(deduped, cfg, now)
     max_results = cfg.get("max_results", 35)
-    top = select_diverse_top_entries(ranked, cfg, max_results)
-    enrich_entries_with_article_text(top, cfg)
+    candidates = checkpoints.load(run_dir, "candidates") if run_dir else None
+    if candidates is not None:
+        ranked, counts = candidates["ranked"], candidates["counts"]
+        _REJECTED_LINKS = candidates["rejected_links"]
+        logger.info("Loaded %d ranked candidates from checkpoint", len(ranked))
+    else:
+        logger.info("Fetching %d feeds…", len(feed_urls))
+        ranked, counts = _collect_candidates(feed_urls, cfg, now, max_results)
+        if run_dir:
+            checkpoints.save(run_dir, "candidates", {"ranked": ranked, "counts": counts, "rejected_links": _REJECTED_LINKS})
+            _save_redirect_cache(redirect_cache_path)
+    fetched_count = counts["fetched"]
+    filtered_count = counts["filtered"]
+    deduped_count = counts["deduped"]
+
+    top = checkpoints.load(run_dir, "selected") if run_dir else None
+    if top is not None:
+        logger.info("Loaded %d selected entries from checkpoint", len(top))
+    else:
+        with run_metrics.span("select"):
+            top = select_diverse_top_entries(ranked, cfg, max_results)
+        with run_metrics.span("enrich"):
+            enrich_entries_with_article_text(top, cfg)
+        if run_dir:
+            checkpoints.save(run_dir, "selected", top)
     selected_count = len(top)
     logger.info("Selected top %d entries", selected_count)
 
-    for entry in top:
-        _annotate_intelligence(entry)
-
     os.makedirs(DOCS_DIR, exist_ok=True)
     os.makedirs(DATA_DIR, exist_ok=True)
     docs_data_dir = os.path.join(DOCS_DIR, "data")
@@ -3277,7 +3760,20 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
         for item in previous_snapshot
         if isinstance(item, dict) and item.get("id")
     }
-    preview_cache = _load_preview_cache(previous_docs_latest_path)
+    preview_cfg = cfg.get("preview_cache", {}) or {}
+    preview_ttl_seconds = int(float(preview_cfg.get("ttl_days", 14)) * 86400)
+    fallback_ttl_seconds = int(float(preview_cfg.get("fallback_ttl_hours", 24)) * 3600)
+    preview_store_path = os.path.join(DATA_DIR, PREVIEW_STORE_FILENAME)
+    now_ts = int(now.timestamp())
+    preview_store_existed = os.path.exists(preview_store_path)
+    _load_preview_store(preview_store_path)
+    if not preview_store_existed:
+        _seed_preview_store(_load_preview_cache(previous_docs_latest_path), now_ts, fallback_ttl_seconds)
+    memo_cfg = cfg.get("derived_memo", {}) or {}
+    memo_ttl_seconds = int(float(memo_cfg.get("ttl_days", 30)) * 86400)
+    derived_memo_path = os.path.join(DATA_DIR, DERIVED_MEMO_FILENAME)
+    config_hash = _config_hash(cfg)
+    _load_derived_memo(derived_memo_path)
     current_ids = {_entry_id(entry) for entry in top}
     diff_new_ids: list[str] = []
     diff_updated_ids: list[str] = []
@@ -3311,16 +3807,32 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
 
     intelligence_rows: list[dict] = []
     normalized_items: list[dict] = []
+    preview_flush_every = max(1, int(checkpoint_cfg.get("preview_flush_every", 10)))
+    previews_since_flush = 0
     for entry in top:
         section = detect_sector_label(entry, cfg)
         aliased_section = section_alias.get(section, section)
-        summary_text = _compact_summary(
-            entry,
-            cfg,
-            max_chars=min(280, int(cfg.get("summary_max_chars", 280))),
-            section_label=section,
-            story_index=0,
-        )
+        entry_key = _entry_id(entry)
+        previous_item = previous_map.get(entry_key, {})
+        entry_url = str(entry.get("link", "") or "").strip()
+        previous_summary = str(previous_item.get("summary", "") or "")
+        source_hash = _source_text_hash(entry)
+        memo = _derived_memo_get(entry_url, source_hash, config_hash, now_ts, previous_summary)
+        if memo is not None:
+            for name in ("event_types", "sentiment", "materiality", "risk_score", "entities"):
+                entry[name] = memo[name]
+            summary_text = memo["summary_text"]
+            entry["_summary_source"] = memo["summary_source"]
+        else:
+            with run_metrics.span("annotate"):
+                _annotate_intelligence(entry)
+                summary_text = _compact_summary(
+                    entry,
+                    cfg,
+                    max_chars=min(280, int(cfg.get("summary_max_chars", 280))),
+                    section_label=section,
+                    story_index=0,
+                )
         entry["_summary_text"] = summary_text
         intelligence_rows.append(_serialize_entry(entry, aliased_section))
 
@@ -3333,8 +3845,6 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
             str(entry.get("title", "")),
             published_at,
         )
-        entry_key = _entry_id(entry)
-        previous_item = previous_map.get(entry_key, {})
         flags = {
             "risk": "🔴 Risk" in detect_flags(entry, cfg),
             "opportunity": "🟢 Opportunity" in detect_flags(entry, cfg),
@@ -3361,16 +3871,16 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
             "materiality": int(entry.get("materiality", 1) or 1),
             "risk_score": int(entry.get("risk_score", 0) or 0),
             "entities": list(entry.get("entities", []) or []),
-            "tags": _research_tags(entry, section),
+            "tags": memo["tags"] if memo is not None else _research_tags(entry, section),
             "flags": flags,
             "metrics": {
-                "numbers": _extract_numbers(
+                "numbers": memo["numbers"] if memo is not None else _extract_numbers(
                     " ".join(
                         [
                             summary_text,
                             str(entry.get("article_text", "") or ""),
                             str(entry.get("summary", "") or ""),
-                            str(previous_item.get("summary", "") or ""),
+                            previous_summary if previous_summary != summary_text else "",
                         ]
                     )
                 )
@@ -3380,10 +3890,15 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
             continue
         if not item["sourcePublishedAt"] and item.get("publishedAt"):
             item["sourcePublishedAt"] = str(item.get("publishedAt", ""))
-        entry_url = str(entry.get("link", "") or "").strip()
-        preview_payload = preview_cache.get(entry_url)
+        preview_payload = _preview_store_get(entry_url, now_ts)
         if not preview_payload:
-            extracted = _extract_preview(entry_url)
+            with run_metrics.span("preview"):
+                extracted = _extract_preview(entry_url)
+            previews_since_flush += 1
+            if run_dir and previews_since_flush >= preview_flush_every:
+                # Persist extracted previews as we go so a resumed run does not fetch them again.
+                _save_preview_store(preview_store_path, now_ts)
+                previews_since_flush = 0
             extracted_preview = _validate_preview_text(str(extracted.get("preview", "") or ""))
             extracted_source = str(extracted.get("preview_source", "none") or "none").strip() or "none"
             if extracted_preview:
@@ -3391,7 +3906,7 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
                     "preview": extracted_preview,
                     "preview_source": extracted_source,
                 }
-                preview_cache[entry_url] = preview_payload
+                _preview_store_put(entry_url, extracted_preview, extracted_source, now_ts, preview_ttl_seconds)
             else:
                 fallback_preview = ""
                 for candidate in [
@@ -3417,7 +3932,7 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
                         "preview": fallback_preview,
                         "preview_source": "fallback_summary",
                     }
-                    preview_cache[entry_url] = preview_payload
+                    _preview_store_put(entry_url, fallback_preview, "fallback_summary", now_ts, fallback_ttl_seconds)
                 else:
                     preview_payload = {"preview": "", "preview_source": "none"}
 
@@ -3428,20 +3943,59 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
         item["language"] = _detect_content_language(item.get("preview", ""), item.get("title", ""))
         if item["language"] not in {"en", "es"}:
             continue
-        source_parts = [
-            str(entry.get("article_text", "") or "").strip(),
-            str(entry.get("meta_description", "") or "").strip(),
-            str(entry.get("first_paragraph", "") or "").strip(),
-        ]
-        source_text_for_insight = " ".join([part for part in source_parts if part]).strip()
-        if not source_text_for_insight:
-            fallback_summary = summary_text.strip()
-            if fallback_summary and not _is_google_news_boilerplate(fallback_summary):
-                source_text_for_insight = fallback_summary
-        item["insight2"] = _generate_insight2(item, source_text_for_insight)
+        if memo is not None:
+            item["insight2"] = memo["insight2"]
+        else:
+            source_parts = [
+                str(entry.get("article_text", "") or "").strip(),
+                str(entry.get("meta_description", "") or "").strip(),
+                str(entry.get("first_paragraph", "") or "").strip(),
+            ]
+            source_text_for_insight = " ".join([part for part in source_parts if part]).strip()
+            if not source_text_for_insight:
+                fallback_summary = summary_text.strip()
+                if fallback_summary and not _is_google_news_boilerplate(fallback_summary):
+                    source_text_for_insight = fallback_summary
+            item["insight2"] = _generate_insight2(item, source_text_for_insight)
+            _derived_memo_put(
+                entry_url,
+                source_hash,
+                config_hash,
+                {
+                    "event_types": entry["event_types"],
+                    "sentiment": entry["sentiment"],
+                    "materiality": entry["materiality"],
+                    "risk_score": entry["risk_score"],
+                    "entities": entry["entities"],
+                    "summary_text": summary_text,
+                    "summary_source": str(entry.get("_summary_source", "") or ""),
+                    "tags": item["tags"],
+                    "numbers": item["metrics"]["numbers"],
+                    "insight2": item["insight2"],
+                },
+                now_ts,
+            )
+        # Icons depend on the current time ("NEW" within 48h), so they are never memoised.
         item["icons"] = _icons_for_item(item)
         normalized_items.append(item)
 
+    preview_cache_stats = _preview_store_summary()
+    logger.info(
+        "Preview cache: %d hits, %d misses (%d expired), hit rate %.0f%%",
+        preview_cache_stats["hits"],
+        preview_cache_stats["misses"],
+        preview_cache_stats["expired"],
+        preview_cache_stats["hit_rate"] * 100,
+    )
+    derived_memo_stats = _derived_memo_summary()
+    logger.info(
+        "Derived memo: %d hits, %d misses (%d stale), hit rate %.0f%%",
+        derived_memo_stats["hits"],
+        derived_memo_stats["misses"],
+        derived_memo_stats["stale"],
+        derived_memo_stats["hit_rate"] * 100,
+    )
+
     infra_rows = [row for row in intelligence_rows if "Infrastructure" in row.get("tags", [])]
 
     sector_rows: dict[str, list[dict]] = {
@@ -3541,6 +4095,8 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
         "diff_new": diff_new,
         "diff_updated": diff_updated,
         "diff_dropped": diff_dropped,
+        "preview_cache": preview_cache_stats,
+        "derived_memo": derived_memo_stats,
         "trend_summary": trend_summary,
         "sanctions_index": sanctions_index,
         "macro_indicators": macro_indicators,
@@ -3551,179 +4107,214 @@ def run(config_path: str = CONFIG_PATH, feeds_path: str = FEEDS_PATH) -> None:
         "docs_data_dir": docs_data_dir,
     }
 
-    markdown = _build_docs_shell(now.strftime("%Y-%m-%d %H:%M UTC"))
-    if _write_if_changed(OUTPUT_PATH, markdown):
-        logger.info("Wrote %s", OUTPUT_PATH)
-    else:
-        logger.info("No changes to %s", OUTPUT_PATH)
-
-    app_js_path = os.path.join(docs_assets_dir, "app.js")
-    styles_css_path = os.path.join(docs_assets_dir, "styles.css")
-    if _write_if_changed(app_js_path, _default_app_js()):
-        logger.info("Wrote %s", app_js_path)
-    if _write_if_changed(styles_css_path, _default_styles_css()):
-        logger.info("Wrote %s", styles_css_path)
-
-    with open(METADATA_PATH, "w", encoding="utf-8") as fh:
-        json.dump(run_meta, fh, indent=2, default=str)
-    logger.info("Wrote %s", METADATA_PATH)
-
-    section_order = cfg.get("brief_sections", [])
-    section_item_limit = max(1, int(cfg.get("section_item_limit", 5)))
-    grouped: dict[str, list[dict]] = {s: [] for s in section_order}
-    grouped["Cross-cutting / Policy / Risk"] = grouped.get("Cross-cutting / Policy / Risk", [])
-    for entry in top:
-        section = detect_sector_label(entry, cfg)
-        grouped.setdefault(section, []).append(entry)
-
-    export_rows: list[dict] = []
-    for section in section_order:
-        top_items = _sort_entries_for_sector(grouped.get(section, []))[:section_item_limit]
-        for idx, entry in enumerate(top_items):
-            summary_text = _compact_summary(
-                entry,
-                cfg,
-                max_chars=min(280, int(cfg.get("summary_max_chars", 280))),
-                section_label=section,
-                story_index=idx,
+    with run_metrics.span("write_outputs"):
+        markdown = _build_docs_shell(now.strftime("%Y-%m-%d %H:%M UTC"))
+        if _write_if_changed(OUTPUT_PATH, markdown):
+            logger.info("Wrote %s", OUTPUT_PATH)
+        else:
+            logger.info("No changes to %s", OUTPUT_PATH)
+
+        app_js_path = os.path.join(docs_assets_dir, "app.js")
+        styles_css_path = os.path.join(docs_assets_dir, "styles.css")
+        if _write_if_changed(app_js_path, _default_app_js()):
+            logger.info("Wrote %s", app_js_path)
+        if _write_if_changed(styles_css_path, _default_styles_css()):
+            logger.info("Wrote %s", styles_css_path)
+
+        section_order = cfg.get("brief_sections", [])
+        section_item_limit = max(1, int(cfg.get("section_item_limit", 5)))
+        grouped: dict[str, list[dict]] = {s: [] for s in section_order}
+        grouped["Cross-cutting / Policy / Risk"] = grouped.get("Cross-cutting / Policy / Risk", [])
+        for entry in top:
+            section = detect_sector_label(entry, cfg)
+            grouped.setdefault(section, []).append(entry)
+
+        export_rows: list[dict] = []
+        for section in section_order:
+            top_items = _sort_entries_for_sector(grouped.get(section, []))[:section_item_limit]
+            for idx, entry in enumerate(top_items):
+                summary_text = _compact_summary(
+                    entry,
+                    cfg,
+                    max_chars=min(280, int(cfg.get("summary_max_chars", 280))),
+                    section_label=section,
+                    story_index=idx,
+                )
+                entry["_summary_text"] = summary_text
+                row = _serialize_entry(entry, section)
+                row["retrieved"] = now.strftime("%Y-%m-%d %H:%M UTC")
+                export_rows.append(row)
+
+        normalized_by_section: dict[str, list[dict]] = {section: [] for section in section_order}
+        for item in normalized_items:
+            section_name = str(item.get("sector", "") or "")
+            if section_name:
+                normalized_by_section.setdefault(section_name, []).append(item)
+
+        def _normalized_item_sort_key(item: dict) -> tuple[int, int, str]:
+            return (
+                int(item.get("materiality", 1) or 1),
+                int(item.get("risk_score", 0) or 0),
+                str(item.get("publishedAt", "") or ""),
             )
-            entry["_summary_text"] = summary_text
-            row = _serialize_entry(entry, section)
-            row["retrieved"] = now.strftime("%Y-%m-%d %H:%M UTC")
-            export_rows.append(row)
-
-    normalized_by_section: dict[str, list[dict]] = {section: [] for section in section_order}
-    for item in normalized_items:
-        section_name = str(item.get("sector", "") or "")
-        if section_name:
-            normalized_by_section.setdefault(section_name, []).append(item)
-
-    def _normalized_item_sort_key(item: dict) -> tuple[int, int, str]:
-        return (
-            int(item.get("materiality", 1) or 1),
-            int(item.get("risk_score", 0) or 0),
-            str(item.get("publishedAt", "") or ""),
-        )
 
-    sector_synth: dict[str, dict] = {}
-    sectors_payload: list[dict] = []
-    for section in section_order:
-        items_for_section = sorted(
-            normalized_by_section.get(section, []),
-            key=_normalized_item_sort_key,
-            reverse=True,
-        )[:section_item_limit]
-        synth = _build_sector_synth(section, items_for_section)
-        sector_synth[section] = synth
-        sectors_payload.append({"name": section, "synth": synth, "items": items_for_section})
-
-    highlights_payload = _build_highlights(normalized_items, sector_synth)
-    latest_payload = {
-        "runAt": now.isoformat(),
-        "totalItems": len(normalized_items),
-        "sectors": sectors_payload,
-    }
-    diff_payload = {
-        "runAt": now.isoformat(),
-        "counts": {
-            "new": diff_new,
-            "updated": diff_updated,
-            "dropped": diff_dropped,
-        },
-        "new": diff_new_ids,
-        "updated": diff_updated_ids,
-        "dropped": diff_dropped_ids,
-    }
-    macros_payload = {
-        "runAt": now.isoformat(),
-        "indicators": macro_indicators,
-    }
+        sector_synth: dict[str, dict] = {}
+        sectors_payload: list[dict] = []
+        for section in section_order:
+            items_for_section = sorted(
+                normalized_by_section.get(section, []),
+                key=_normalized_item_sort_key,
+                reverse=True,
+            )[:section_item_limit]
+            synth = _build_sector_synth(section, items_for_section)
+            sector_synth[section] = synth
+            sectors_payload.append({"name": section, "synth": synth, "items": items_for_section})
+
+        highlights_payload = _build_highlights(normalized_items, sector_synth)
+        latest_payload = {
+            "runAt": now.isoformat(),
+            "totalItems": len(normalized_items),
+            "sectors": sectors_payload,
+        }
+        diff_payload = {
+            "runAt": now.isoformat(),
+            "counts": {
+                "new": diff_new,
+                "updated": diff_updated,
+                "dropped": diff_dropped,
+            },
+            "new": diff_new_ids,
+            "updated": diff_updated_ids,
+            "dropped": diff_dropped_ids,
+        }
+        macros_payload = {
+            "runAt": now.isoformat(),
+            "indicators": macro_indicators,
+        }
 
-    docs_latest_path = os.path.join(docs_data_dir, "latest.json")
-    docs_diff_path = os.path.join(docs_data_dir, "diff.json")
-    docs_macros_path = os.path.join(docs_data_dir, "macros.json")
-    docs_highlights_path = os.path.join(docs_data_dir, "highlights.json")
-    docs_rejected_path = os.path.join(docs_data_dir, "rejected_links.json")
-
-    if _write_if_changed(docs_latest_path, json.dumps(latest_payload, indent=2)):
-        logger.info("Wrote %s", docs_latest_path)
-    if _write_if_changed(docs_diff_path, json.dumps(diff_payload, indent=2)):
-        logger.info("Wrote %s", docs_diff_path)
-    if _write_if_changed(docs_macros_path, json.dumps(macros_payload, indent=2)):
-        logger.info("Wrote %s", docs_macros_path)
-    if _write_if_changed(docs_highlights_path, json.dumps(highlights_payload, indent=2)):
-        logger.info("Wrote %s", docs_highlights_path)
-    if _write_if_changed(docs_rejected_path, json.dumps(_REJECTED_LINKS, indent=2)):
-        logger.info("Wrote %s", docs_rejected_path)
-
-    with open(latest_snapshot_path, "w", encoding="utf-8") as fh:
-        json.dump(export_rows, fh, indent=2)
-    logger.info("Wrote %s", latest_snapshot_path)
-
-    with open(latest_csv_path, "w", encoding="utf-8", newline="") as fh:
-        writer = csv.writer(fh)
-        writer.writerow([
-            "id",
-            "title",
-            "url",
-            "source",
-            "source_quality",
-            "published",
-            "retrieved",
-            "sector",
-            "summary",
-            "summary_confidence",
-            "event_types",
-            "sentiment",
-            "materiality",
-            "risk_score",
-            "entities",
-            "tags",
-        ])
-        for row in export_rows:
+        docs_latest_path = os.path.join(docs_data_dir, "latest.json")
+        docs_diff_path = os.path.join(docs_data_dir, "diff.json")
+        docs_macros_path = os.path.join(docs_data_dir, "macros.json")
+        docs_highlights_path = os.path.join(docs_data_dir, "highlights.json")
+        docs_rejected_path = os.path.join(docs_data_dir, "rejected_links.json")
+
+        if _write_if_changed(docs_latest_path, json.dumps(latest_payload, indent=2)):
+            logger.info("Wrote %s", docs_latest_path)
+        if _write_if_changed(docs_diff_path, json.dumps(diff_payload, indent=2)):
+            logger.info("Wrote %s", docs_diff_path)
+        if _write_if_changed(docs_macros_path, json.dumps(macros_payload, indent=2)):
+            logger.info("Wrote %s", docs_macros_path)
+        if _write_if_changed(docs_highlights_path, json.dumps(highlights_payload, indent=2)):
+            logger.info("Wrote %s", docs_highlights_path)
+        if _write_if_changed(docs_rejected_path, json.dumps(_REJECTED_LINKS, indent=2)):
+            logger.info("Wrote %s", docs_rejected_path)
+
+        with open(latest_snapshot_path, "w", encoding="utf-8") as fh:
+            json.dump(export_rows, fh, indent=2)
+        logger.info("Wrote %s", latest_snapshot_path)
+
+        with open(latest_csv_path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
             writer.writerow([
-                row.get("id", ""),
-                row.get("title", ""),
-                row.get("url", ""),
-                row.get("source", ""),
-                row.get("source_quality", ""),
-                row.get("published", ""),
-                row.get("retrieved", ""),
-                row.get("sector", ""),
-                row.get("summary", ""),
-                row.get("summary_confidence", ""),
-                "; ".join(row.get("event_types", [])),
-                row.get("sentiment", ""),
-                row.get("materiality", ""),
-                row.get("risk_score", ""),
-                "; ".join(row.get("entities", [])),
-                "; ".join(row.get("tags", [])),
+                "id",
+                "title",
+                "url",
+                "source",
+                "source_quality",
+                "published",
+                "retrieved",
+                "sector",
+                "summary",
+                "summary_confidence",
+                "event_types",
+                "sentiment",
+                "materiality",
+                "risk_score",
+                "entities",
+                "tags",
             ])
-    logger.info("Wrote %s", latest_csv_path)
-
-    with open(signal_history_path, "w", encoding="utf-8") as fh:
-        json.dump(history_records, fh, indent=2)
-    logger.info("Wrote %s", signal_history_path)
-
-    with open(alerts_path, "w", encoding="utf-8") as fh:
-        json.dump({"run_at": now.isoformat(), "alerts": alerts}, fh, indent=2)
-    logger.info("Wrote %s", alerts_path)
-
-    with open(intelligence_summary_path, "w", encoding="utf-8") as fh:
-        json.dump(
-            {
-                "run_at": now.isoformat(),
-                "trend_summary": trend_summary,
-                "sanctions_index": sanctions_index,
-                "sector_briefs": sector_briefs,
-            },
-            fh,
-            indent=2,
-        )
-    logger.info("Wrote %s", intelligence_summary_path)
+            for row in export_rows:
+                writer.writerow([
+                    row.get("id", ""),
+                    row.get("title", ""),
+                    row.get("url", ""),
+                    row.get("source", ""),
+                    row.get("source_quality", ""),
+                    row.get("published", ""),
+                    row.get("retrieved", ""),
+                    row.get("sector", ""),
+                    row.get("summary", ""),
+                    row.get("summary_confidence", ""),
+                    "; ".join(row.get("event_types", [])),
+                    row.get("sentiment", ""),
+                    row.get("materiality", ""),
+                    row.get("risk_score", ""),
+                    "; ".join(row.get("entities", [])),
+                    "; ".join(row.get("tags", [])),
+                ])
+        logger.info("Wrote %s", latest_csv_path)
+
+        with open(signal_history_path, "w", encoding="utf-8") as fh:
+            json.dump(history_records, fh, indent=2)
+        logger.info("Wrote %s", signal_history_path)
+
+        with open(alerts_path, "w", encoding="utf-8") as fh:
+            json.dump({"run_at": now.isoformat(), "alerts": alerts}, fh, indent=2)
+        logger.info("Wrote %s", alerts_path)
+
+        with open(intelligence_summary_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "run_at": now.isoformat(),
+                    "trend_summary": trend_summary,
+                    "sanctions_index": sanctions_index,
+                    "sector_briefs": sector_briefs,
+                },
+                fh,
+                indent=2,
+            )
+        logger.info("Wrote %s", intelligence_summary_path)
 
-    _save_redirect_cache()
+    with run_metrics.span("save_caches"):
+        _save_redirect_cache(redirect_cache_path)
+        _save_preview_store(preview_store_path, now_ts)
+        _save_derived_memo(derived_memo_path, now_ts, memo_ttl_seconds)
+
+    run_meta["timings"] = run_metrics.snapshot()
+    with open(METADATA_PATH, "w", encoding="utf-8") as fh:
+        json.dump(run_meta, fh, indent=2, default=str)
+    logger.info("Wrote %s", METADATA_PATH)
+    for path in run_metrics.dump_profiles():
+        logger.info("Wrote %s", path)
+    if run_dir:
+        checkpoints.remove(run_dir)
+        max_age_days = float(checkpoint_cfg.get("max_age_days", 7))
+        for run_id in checkpoints.collect_garbage(checkpoint_root, now, max_age_days):
+            logger.info("Removed stale checkpoint %s", run_id)
+    return latest_payload
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Collect and publish the Venezuela news brief.")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=os.path.join(DATA_DIR, "profile"),
+        default="",
+        metavar="DIR",
+        help="write cProfile stats per stage to DIR (default: data/profile)",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="latest",
+        default="",
+        metavar="RUN_ID",
+        help="continue a failed run from its last completed stage (default: the most recent one)",
+    )
+    args = parser.parse_args(argv)
+    run(profile_dir=args.profile, resume=args.resume)
 
 
 if __name__ == "__main__":
-    run()
+    main()
@@ -0,0 +1,164 @@
+"""
+date_utils.py – shared date parsing for the collectors.
+
+Feed timestamps are overwhelmingly RFC-822 (``Mon, 20 Feb 2026 10:00:00 GMT``)
+or ISO-8601, and the same strings recur across feeds and runs.  Both shapes
+are parsed by hand-written fast paths, results are memoised, and dateutil
+is only consulted for anything else.
+"""
+
+import calendar
+import re
+import time as _time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+# Only needed for the rare strings the fast paths reject.
+dateutil_parser = lazy_import("dateutil.parser")
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_ZONE_OFFSETS = {
+    "gmt": 0, "ut": 0, "utc": 0, "z": 0,
+    "est": -5, "edt": -4, "cst": -6, "cdt": -5, "mst": -7, "mdt": -6, "pst": -8, "pdt": -7,
+}
+
+_RFC822_RE = re.compile(
+    r"^(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([A-Za-z]{1,3}|[+-]\d{4})?$"
+)
+_ISO_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?\s*(Z|[+-]\d{2}(?::?\d{2})?)?)?$",
+    re.IGNORECASE,
+)
+
+
+def _offset(value: str | None) -> timezone | None:
+    """Return a tzinfo for a zone token, or None when the token is unknown."""
+    if not value:
+        return timezone.utc
+    token = value.strip()
+    if token[0] in "+-":
+        digits = token[1:].replace(":", "")
+        hours = int(digits[:2])
+        minutes = int(digits[2:4] or 0)
+        delta = timedelta(hours=hours, minutes=minutes)
+        return timezone(-delta if token[0] == "-" else delta)
+    hours = _ZONE_OFFSETS.get(token.lower())
+    if hours is None:
+        return None
+    return timezone.utc if hours == 0 else timezone(timedelta(hours=hours))
+
+
+def _parse_rfc822(value: str) -> datetime | None:
+    match = _RFC822_RE.match(value)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    tzinfo = _offset(zone)
+    if month is None or tzinfo is None:
+        return None
+    try:
+        return datetime(int(year), month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+def _parse_iso(value: str) -> datetime | None:
+    match = _ISO_RE.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, zone = match.groups()
+    tzinfo = _offset(zone)
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int((fraction or "0").ljust(6, "0")),
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+
+
+def _aware(parsed: datetime) -> datetime:
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime_strict(value: str) -> datetime | None:
+    """Like ``parse_datetime`` but only full ISO-8601 and RFC-822 dates.
+
+    dateutil fills missing parts from today, so ``"2025"`` or ``"March"``
+    would come back as concrete dates; callers that must reject partial
+    dates use this instead.
+    """
+    text = str(value or "").strip()
+    if not text:
+        return None
+    parsed = _parse_rfc822(text) or _parse_iso(text)
+    return _aware(parsed) if parsed else None
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime | None:
+    """Parse a date string into an aware datetime; naive values are taken as UTC."""
+    text = str(value or "").strip()
+    if not text:
+        return None
+    parsed = parse_datetime_strict(text)
+    if parsed is not None:
+        return parsed
+    try:
+        return _aware(dateutil_parser.parse(text))
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def parse_date_iso(value: str) -> str:
+    """``YYYY-MM-DD`` for a date string, or ``""`` when it cannot be parsed."""
+    parsed = parse_datetime(value)
+    return parsed.date().isoformat() if parsed else ""
+
+
+def parse_date(value: str, default: date | None = None, strict: bool = False) -> date | None:
+    parsed = parse_datetime_strict(value) if strict else parse_datetime(value)
+    return parsed.date() if parsed else default
+
+
+def struct_time_to_utc(value: _time.struct_time | tuple | None) -> datetime | None:
+    """Convert feedparser's ``*_parsed`` values, which are UTC, without local-time skew."""
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(calendar.timegm(value), tz=timezone.utc)
+    except (OverflowError, OSError, ValueError, TypeError):
+        return None
+
+
+def entry_datetime(entry) -> datetime | None:
+    """Best timestamp of a feedparser entry: parsed fields first, then raw strings."""
+    for attr in ("published_parsed", "updated_parsed"):
+        parsed = struct_time_to_utc(entry.get(attr))
+        if parsed is not None:
+            return parsed
+    for attr in ("published", "updated"):
+        value = entry.get(attr)
+        if value:
+            parsed = parse_datetime(str(value))
+            if parsed is not None:
+                return parsed
+    return None
@@ -1,10 +1,32 @@
+import json
+import os
 import re
+from functools import lru_cache
 
-import requests
 import trafilatura
 from bs4 import BeautifulSoup
 from readability import Document
 
+try:
+    from http_fetch import DEFAULT_MAX_BYTES, HTML_CONTENT_TYPES, TEXT_CONTENT_TYPES, stream_text
+except ImportError:
+    from scripts.http_fetch import DEFAULT_MAX_BYTES, HTML_CONTENT_TYPES, TEXT_CONTENT_TYPES, stream_text
+
+try:
+    from url_analysis import parse_url
+except ImportError:
+    from scripts.url_analysis import parse_url
+
+try:
+    from text_core import DATELINE_RE, collapse_whitespace, compile_markers, has_marker, split_sentences
+except ImportError:
+    from scripts.text_core import DATELINE_RE, collapse_whitespace, compile_markers, has_marker, split_sentences
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Per-domain extractor order learned by benchmarks/extraction.py; absent means DEFAULT_ORDER everywhere.
+EXTRACTOR_ORDER_PATH = os.path.join(ROOT_DIR, "data", "extractor_order.json")
+DEFAULT_ORDER = ("trafilatura", "readability", "jina")
+
 UA = "Mozilla/5.0 (compatible; MarketEdgeVZLAnews/1.0; +https://marketedgeglobal.github.io/VZLAnews/)"
 
 BOILERPLATE = {
@@ -12,95 +34,87 @@ BOILERPLATE = {
     "Comprehensive up-to-date news coverage, aggregated from sources all over the world by Google News.",
 }
 
-BYLINE_PATTERNS = [
-    r"^\s*by\s+[a-z].{0,80}$",
-    r"^\s*por\s+[a-záéíóúñ].{0,80}$",
-    r"^\s*reuters\s*$",
-    r"^\s*ap\s*$",
-    r"^\s*afp\s*$",
-]
-
-DATELINE_PAT = r"^[A-ZÁÉÍÓÚÑ][A-Za-zÁÉÍÓÚÑáéíóúñ\s\.\-]{2,40}\s+\([^\)]+\)\s+[-—]\s+"
+BYLINE_RE = re.compile(
+    r"^\s*by\s+[a-z].{0,80}$"
+    r"|^\s*por\s+[a-záéíóúñ].{0,80}$"
+    r"|^\s*reuters\s*$"
+    r"|^\s*ap\s*$"
+    r"|^\s*afp\s*$",
+    flags=re.IGNORECASE,
+)
+
+DATELINE_PAT = DATELINE_RE.pattern
+
+NOISE_MARKERS = compile_markers(
+    [
+        "request blocked",
+        "we can't connect to the server",
+        "we cant connect to the server",
+        "can't connect to the server for this app or website",
+        "cannot connect to the server for this app or website",
+        "this app or website at this time",
+        "title:",
+        "url source:",
+        "markdown content:",
+        "just a moment",
+        "performing security verification",
+        "skip to content",
+        "wrong site?",
+        "go back hide about us",
+        "main topics",
+        "featured topics",
+        "a lock ( ) or https://",
+        "latest news stories from around the world",
+        "cookies",
+        "subscribe",
+        "suscríb",
+        "sign up",
+        "iniciar sesión",
+        "accept all",
+        "privacy policy",
+        "terms of use",
+        "newsletter",
+        "read more",
+        "cookie policy",
+        "all rights reserved",
+        "reset password",
+        "wrong login information",
+        "security service to protect",
+    ]
+)
 
 
 def _clean_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "").strip())
+    return collapse_whitespace(text)
 
 
 def _split_sentences(text: str) -> list[str]:
     normalized = _clean_spaces(text)
     if not normalized:
         return []
-    parts = re.split(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ])", normalized)
-    return [part.strip() for part in parts if part.strip()]
+    return split_sentences(normalized)
 
 
 def _is_byline(paragraph: str) -> bool:
     text = _clean_spaces(paragraph)
     if not text:
         return False
-    if re.search(DATELINE_PAT, text):
+    if DATELINE_RE.search(text):
         return True
-    low = text.lower()
-    for pattern in BYLINE_PATTERNS:
-        if re.match(pattern, low, flags=re.IGNORECASE):
-            return True
-    return False
+    return BYLINE_RE.match(text.lower()) is not None
 
 
 def _looks_like_noise(paragraph: str) -> bool:
     low = paragraph.lower()
-    if "request blocked" in low:
-        return True
-    if "we can't connect to the server" in low or "we cant connect to the server" in low:
-        return True
-    if "can't connect to the server for this app or website" in low:
-        return True
-    if "cannot connect to the server for this app or website" in low:
-        return True
-    if "this app or website at this time" in low:
+    if has_marker(NOISE_MARKERS, low):
         return True
     if low.count("http") >= 2:
         return True
     if low.count(" |") >= 3 or low.count(" - ") >= 6:
         return True
-    if "title:" in low or "url source:" in low or "markdown content:" in low:
-        return True
-    if "just a moment" in low or "performing security verification" in low:
-        return True
-    if "skip to content" in low:
-        return True
-    if "wrong site?" in low or "go back hide about us" in low:
-        return True
-    if "main topics" in low or "featured topics" in low:
-        return True
-    if "a lock ( ) or https://" in low:
-        return True
-    if "latest news stories from around the world" in low:
-        return True
     if "home -" in low and low.count("home") >= 2:
         return True
-    return any(
-        marker in low
-        for marker in [
-            "cookies",
-            "subscribe",
-            "suscríb",
-            "sign up",
-            "iniciar sesión",
-            "accept all",
-            "privacy policy",
-            "terms of use",
-            "newsletter",
-            "read more",
-            "cookie policy",
-            "all rights reserved",
-            "reset password",
-            "wrong login information",
-            "security service to protect",
-            "performing security verification",
-        ]
-    )
+    return False
 
 
 def _first_substantive_paragraph(paragraphs: list[str]) -> str:
@@ -120,12 +134,20 @@ def _first_substantive_paragraph(paragraphs: list[str]) -> str:
     return ""
 
 
-def _extract_with_trafilatura(url: str) -> str:
-    downloaded = trafilatura.fetch_url(url)
-    if not downloaded:
-        return ""
+def _fetch_page(url: str) -> str:
+    _, page = stream_text(
+        url,
+        timeout=20,
+        headers={"User-Agent": UA},
+        max_bytes=DEFAULT_MAX_BYTES,
+        content_types=HTML_CONTENT_TYPES,
+    )
+    return page or ""
+
+
+def _text_with_trafilatura(html: str) -> str:
     text = trafilatura.extract(
-        downloaded,
+        html,
         output_format="txt",
         include_comments=False,
         include_tables=False,
@@ -133,55 +155,73 @@ def _extract_with_trafilatura(url: str) -> str:
     return text or ""
 
 
-def _extract_with_readability(url: str) -> str:
-    response = requests.get(url, headers={"User-Agent": UA}, timeout=20)
-    response.raise_for_status()
-    doc = Document(response.text)
-    html = doc.summary(html_partial=True)
-    soup = BeautifulSoup(html, "lxml")
+def _text_with_readability(html: str) -> str:
+    doc = Document(html)
+    summary = doc.summary(html_partial=True)
+    soup = BeautifulSoup(summary, "lxml")
     return soup.get_text("\n")
 
 
-def _extract_with_jina(url: str) -> str:
-    response = requests.get(f"https://r.jina.ai/{url}", headers={"User-Agent": UA}, timeout=25)
-    if response.status_code != 200:
-        return ""
-    return response.text or ""
-
+# Extractors that work on the fetched page; Jina fetches its own rendering.
+HTML_EXTRACTORS = {
+    "trafilatura": _text_with_trafilatura,
+    "readability": _text_with_readability,
+}
 
-def extract_preview(url: str) -> dict:
-    full = ""
-    source = "none"
 
-    if not url:
-        return {"preview": "", "preview_source": "none"}
+def _extract_with_jina(url: str) -> str:
+    _, text = stream_text(
+        f"https://r.jina.ai/{url}",
+        timeout=25,
+        headers={"User-Agent": UA},
+        max_bytes=DEFAULT_MAX_BYTES,
+        content_types=TEXT_CONTENT_TYPES,
+    )
+    return text
 
-    try:
-        full = _extract_with_trafilatura(url)
-        if full:
-            source = "trafilatura"
-    except Exception:
-        full = ""
 
-    if not full:
-        try:
-            full = _extract_with_readability(url)
-            if full:
-                source = "readability"
-        except Exception:
-            full = ""
+def _domain(url: str) -> str:
+    return parse_url(url).host.split(":")[0]
 
-    if not full:
-        try:
-            full = _extract_with_jina(url)
-            if full:
-                source = "jina"
-        except Exception:
-            full = ""
 
+@lru_cache(maxsize=4)
+def _load_extractor_order(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _complete_order(names) -> tuple[str, ...]:
+    known = [name for name in names or () if name in DEFAULT_ORDER]
+    return tuple(dict.fromkeys(known + list(DEFAULT_ORDER)))
+
+
+def extractor_order(url: str) -> tuple[str, ...]:
+    """Extractors to try for ``url``: the learned order for its domain (or a parent domain), else the default.
+
+    A learned order only reorders; extractors it leaves out are still tried
+    afterwards in the default order.
+    """
+    payload = _load_extractor_order(EXTRACTOR_ORDER_PATH)
+    domains = payload.get("domains", {}) or {}
+    host = _domain(url)
+    while host:
+        if host in domains:
+            return _complete_order(domains[host])
+        _, _, host = host.partition(".")
+        if "." not in host:
+            break
+    return _complete_order(payload.get("default"))
+
+
+def preview_from_text(full: str) -> str:
+    """Pick the first substantive paragraph of extracted text and trim it to a 2–3 sentence preview."""
     full = full or ""
     if not full.strip():
-        return {"preview": "", "preview_source": "none"}
+        return ""
 
     paragraphs = [p.strip() for p in re.split(r"\n{2,}|\r\n\r\n", full) if p.strip()]
     if len(paragraphs) < 2:
@@ -193,7 +233,7 @@ def extract_preview(url: str) -> dict:
         paragraph = fallback if not _looks_like_noise(fallback) else ""
 
     if not paragraph:
-        return {"preview": "", "preview_source": "none"}
+        return ""
 
     sentences = _split_sentences(paragraph)
     if len(sentences) >= 3:
@@ -208,6 +248,34 @@ def extract_preview(url: str) -> dict:
         preview = preview.replace(boilerplate, "").strip()
 
     if _looks_like_noise(preview):
+        return ""
+    return preview
+
+
+def extract_preview(url: str) -> dict:
+    """Preview for ``url`` from the first extractor, in the domain's order, that returns text.
+
+    The page is fetched at most once and shared by the HTML extractors.  As
+    before the order was learned, text that yields no preview does not send
+    the page on to the next (possibly networked) extractor.
+    """
+    if not url:
         return {"preview": "", "preview_source": "none"}
 
-    return {"preview": preview, "preview_source": source}
+    page = None
+    for name in extractor_order(url):
+        try:
+            if name == "jina":
+                full = _extract_with_jina(url)
+            else:
+                if page is None:
+                    page = _fetch_page(url)
+                full = HTML_EXTRACTORS[name](page) if page else ""
+        except Exception:
+            page = "" if page is None else page
+            full = ""
+        if full and full.strip():
+            preview = preview_from_text(full)
+            return {"preview": preview, "preview_source": name if preview else "none"}
+
+    return {"preview": "", "preview_source": "none"}
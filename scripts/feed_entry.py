@@ -0,0 +1,154 @@
+"""
+feed_entry.py – compact record for feed entries moving through the pipeline.
+
+Entries used to be free-form dicts that grew a dozen keys on the way through
+filtering, enrichment and annotation.  ``FeedEntry`` stores the known fields
+in ``__slots__`` and interns strings that repeat across a feed (source URL,
+domain, publisher), while keeping the dict-style interface the pipeline
+stages and tests rely on.  Keys outside the known set go to a small overflow
+dict so nothing is rejected.
+"""
+
+import sys
+from typing import Any, Iterator
+
+FIELDS = (
+    "title",
+    "link",
+    "summary",
+    "content",
+    "snippet",
+    "snippet_status",
+    "publisher_url",
+    "publisher",
+    "author",
+    "guid",
+    "categories",
+    "published",
+    "source_url",
+    "source_domain",
+    "source_published_at",
+    "score",
+    "article_text",
+    "meta_description",
+    "first_paragraph",
+    "event_types",
+    "sentiment",
+    "materiality",
+    "risk_score",
+    "entities",
+    "_summary_source",
+    "_summary_text",
+)
+# Values drawn from a small vocabulary, shared across every entry of a run.
+INTERNED_FIELDS = frozenset(
+    {"source_url", "source_domain", "publisher", "publisher_url", "snippet_status", "sentiment", "_summary_source"}
+)
+
+_FIELD_SET = frozenset(FIELDS)
+_MISSING = object()
+
+
+class FeedEntry:
+    __slots__ = FIELDS + ("_extra",)
+
+    def __init__(self, **fields: Any) -> None:
+        for name in FIELDS:
+            object.__setattr__(self, name, _MISSING)
+        object.__setattr__(self, "_extra", None)
+        for key, value in fields.items():
+            self[key] = value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, key, value)
+            return
+        if self._extra is None:
+            object.__setattr__(self, "_extra", {})
+        self._extra[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_SET and getattr(self, key) is not _MISSING:
+            object.__setattr__(self, key, _MISSING)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return getattr(self, key) is not _MISSING
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FeedEntry):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None  # mutable, like the dicts it replaces
+
+    def __repr__(self) -> str:
+        return f"FeedEntry({self.to_dict()!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            self[key] = default
+            return self.get(key)
+        return value
+
+    def pop(self, key: str, *default: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        del self[key]
+        return value
+
+    def update(self, other: Any = (), **fields: Any) -> None:
+        items = other.items() if hasattr(other, "items") else other
+        for key, value in items:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    def keys(self) -> list[str]:
+        names = [name for name in FIELDS if getattr(self, name) is not _MISSING]
+        if self._extra:
+            names.extend(self._extra)
+        return names
+
+    def values(self) -> list[Any]:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> list[tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self) -> "FeedEntry":
+        return FeedEntry(**self.to_dict())
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
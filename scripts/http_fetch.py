@@ -0,0 +1,118 @@
+"""
+http_fetch.py – byte-bounded HTTP downloads shared by the collectors.
+
+Pages are streamed in chunks so that a response is rejected on its
+``content-type`` before the body is read, never grows past ``max_bytes``
+and can stop early once the caller has seen enough text.
+"""
+
+import codecs
+from typing import Callable
+from urllib.parse import urlsplit
+
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+try:
+    import run_metrics
+except ImportError:
+    from scripts import run_metrics
+
+requests = lazy_import("requests")
+
+DEFAULT_MAX_BYTES = 1_500_000
+CHUNK_SIZE = 64 * 1024
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+TEXT_CONTENT_TYPES = HTML_CONTENT_TYPES + ("text/plain", "text/markdown")
+
+
+def content_type_allowed(content_type: str, allowed: tuple[str, ...] | None, allow_missing: bool = True) -> bool:
+    """Return True when ``content_type`` matches one of ``allowed``.
+
+    A missing header is accepted unless ``allow_missing`` is False; plenty of
+    small publishers omit it.
+    """
+    if not allowed:
+        return True
+    value = (content_type or "").lower()
+    if not value:
+        return allow_missing
+    return any(kind in value for kind in allowed)
+
+
+def _incremental_decoder(encoding: str | None) -> codecs.IncrementalDecoder:
+    # Servers send charsets Python does not know (utf8mb4, x-user-defined, lists).
+    # apparent_encoding would read the whole body, so fall back to utf-8.
+    try:
+        return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def stream_text(
+    url: str,
+    timeout: float,
+    headers: dict | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    content_types: tuple[str, ...] | None = HTML_CONTENT_TYPES,
+    stop: Callable[[str], bool] | None = None,
+    allow_missing_content_type: bool = True,
+) -> tuple[str, str]:
+    """GET ``url`` and return ``(final_url, text)``.
+
+    The body is read at most ``max_bytes`` deep.  ``stop`` is called with the
+    decoded text each time it doubles in size and ends the download early
+    when it returns True.  Non-200 responses and disallowed content types
+    yield an empty text; a missing content-type passes unless
+    ``allow_missing_content_type`` is False.  An unknown charset is decoded as
+    utf-8.  ``requests.RequestException`` propagates.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    run_metrics.count("http_requests", host=host)
+    response = requests.get(
+        url,
+        timeout=timeout,
+        headers=headers or {},
+        allow_redirects=True,
+        stream=True,
+    )
+    read_bytes = 0
+    try:
+        final_url = str(response.url or url).strip()
+        if response.status_code != 200:
+            run_metrics.count("http_errors", host=host)
+            return final_url, ""
+        if not content_type_allowed(
+            response.headers.get("content-type", ""), content_types, allow_missing_content_type
+        ):
+            return final_url, ""
+
+        decoder = _incremental_decoder(response.encoding)
+        pieces: list[str] = []
+        decoded_chars = 0
+        next_check = CHUNK_SIZE
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not chunk:
+                continue
+            remaining = max_bytes - read_bytes
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+            read_bytes += len(chunk)
+            piece = decoder.decode(chunk)
+            pieces.append(piece)
+            decoded_chars += len(piece)
+            if read_bytes >= max_bytes:
+                break
+            if stop is not None and decoded_chars >= next_check:
+                next_check = decoded_chars * 2
+                if stop("".join(pieces)):
+                    break
+        pieces.append(decoder.decode(b"", final=True))
+        return final_url, "".join(pieces)
+    finally:
+        response.close()
+        if read_bytes:
+            run_metrics.count("http_bytes", read_bytes, host=host)
@@ -0,0 +1,87 @@
+"""
+lang_detect.py – shared English/Spanish content-language heuristic.
+
+Marker tables and regexes are built once at import, and results are cached
+on the input texts so the collector, the selector and the brief builders
+classify a given item only once per run.
+"""
+
+import re
+from functools import lru_cache
+from html import unescape
+
+SPANISH_MARKERS = (
+    " de ", " la ", " el ", " y ", " en ", " para ", " por ", " con ", " una ", " del ",
+    "venezuela", "gobierno", "economía", "petróleo", "inflación", "mercado", "sanciones",
+)
+ENGLISH_MARKERS = (
+    " the ", " and ", " in ", " for ", " with ", " from ", " that ", " this ", "venezuela",
+    "government", "economy", "oil", "inflation", "market", "sanctions",
+)
+SPANISH_STOPWORDS = frozenset(
+    {"de", "la", "el", "y", "en", "para", "por", "con", "una", "del", "los", "las", "que", "se", "es", "al"}
+)
+ENGLISH_STOPWORDS = frozenset(
+    {"the", "and", "in", "for", "with", "from", "that", "this", "to", "of", "on", "as", "is", "are", "by"}
+)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_ACCENT_RE = re.compile(r"[áéíóúñ¿¡]")
+_WORD_RE = re.compile(r"[a-záéíóúñ]+")
+_ASCII_LETTER_RE = re.compile(r"[a-z]")
+
+
+def _normalize(text: str) -> str:
+    return _SPACE_RE.sub(" ", unescape(_TAG_RE.sub(" ", text or ""))).strip()
+
+
+@lru_cache(maxsize=4096)
+def detect_language(*texts: str) -> str:
+    """Return ``"en"``, ``"es"`` or ``"other"`` for the combined texts."""
+    combined = " ".join([_normalize(text) for text in texts if text]).strip()
+    if not combined:
+        return "other"
+    low = combined.lower()
+    padded = f" {low} "
+
+    score_es = sum(1 for marker in SPANISH_MARKERS if marker in padded)
+    score_en = sum(1 for marker in ENGLISH_MARKERS if marker in padded)
+
+    # Accented Spanish characters are a helpful signal, but not definitive on their own
+    # since names and quotes can appear in otherwise English text.
+    has_accent = _ACCENT_RE.search(low) is not None
+    if has_accent and len(_ACCENT_RE.findall(low)) >= 2:
+        score_es += 1
+
+    es_hits = 0
+    en_hits = 0
+    for word in _WORD_RE.findall(low):
+        if word in SPANISH_STOPWORDS:
+            es_hits += 1
+        elif word in ENGLISH_STOPWORDS:
+            en_hits += 1
+    score_es += es_hits // 2
+    score_en += en_hits // 2
+
+    if score_es == 0 and score_en == 0:
+        if _ASCII_LETTER_RE.search(low):
+            return "en"
+        return "other"
+    if score_es >= score_en + 1:
+        return "es"
+    if score_en >= score_es + 1:
+        return "en"
+    # Tie-breaker: default to English for ASCII-latin text when Spanish signal is not stronger.
+    if _ASCII_LETTER_RE.search(low) and not has_accent:
+        return "en"
+    return "other"
+
+
+def entry_language(entry: dict) -> str:
+    """Language of a feed entry from its title, summary and snippet."""
+    return detect_language(
+        str(entry.get("title", "") or ""),
+        str(entry.get("summary", "") or ""),
+        str(entry.get("snippet", "") or ""),
+    )
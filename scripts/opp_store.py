@@ -0,0 +1,192 @@
+"""
+opp_store.py – persistent store of scored BD opportunities between daily runs.
+
+Items are keyed by a hash of their URL and title and remembered with a
+fingerprint of the fields they were judged on, so an item only goes through
+the opportunity filters and scoring again when it is new or one of those
+fields changed.  Rejections are remembered per (key, fingerprint) until they
+stop showing up, and never evict an accepted opportunity, so a copy that comes
+back with its accepted text is not scored again.  The store only caches
+verdicts: what gets published is limited to the records seen in the current
+run.
+
+Two in-memory indexes are rebuilt on load:
+
+* a min-heap of ``(deadline, key)`` so expired opportunities are popped in
+  O(log n) each instead of re-checking every deadline every day;
+* a list of ``(publishedAt, key)`` kept sorted, so the 60/90-day windows are
+  a bisect and pruning old opportunities is a slice.
+
+Both are updated lazily: superseded entries stay put until they reach the
+front and are skipped when their key no longer matches.
+"""
+
+import bisect
+import hashlib
+import heapq
+import json
+import os
+
+FORMAT_VERSION = 2
+
+
+def item_key(url: str, title: str) -> str:
+    """Store key of an item: the builder's URL|title dedupe key, hashed."""
+    dedupe_key = f"{url.strip().lower()}|{title.strip().lower()}"
+    return hashlib.sha1(dedupe_key.encode("utf-8")).hexdigest()[:20]
+
+
+def fingerprint(text: str) -> str:
+    """Short hash of the serialised fields an item was judged on."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class OpportunityStore:
+    def __init__(self) -> None:
+        # key -> {"fingerprint", "opportunity", "deadlineDate", "seenAt", "seq"}
+        self.opportunities: dict[str, dict] = {}
+        # key -> {fingerprint: seenAt}
+        self.rejected: dict[str, dict[str, str]] = {}
+        self._deadlines: list[tuple[str, str]] = []
+        self._published: list[tuple[str, str]] = []
+        self._next_seq = 0
+
+    @classmethod
+    def load(cls, path: str) -> "OpportunityStore":
+        store = cls()
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return store
+        if not isinstance(loaded, dict) or loaded.get("version") != FORMAT_VERSION:
+            return store
+        store.opportunities = {
+            key: record for key, record in (loaded.get("opportunities") or {}).items() if isinstance(record, dict)
+        }
+        store.rejected = {
+            key: digests for key, digests in (loaded.get("rejected") or {}).items() if isinstance(digests, dict)
+        }
+        store._deadlines = [
+            (record["deadlineDate"], key) for key, record in store.opportunities.items() if record.get("deadlineDate")
+        ]
+        heapq.heapify(store._deadlines)
+        seqs = [int(record.get("seq", 0) or 0) for record in store.opportunities.values()]
+        store._next_seq = max(seqs, default=-1) + 1
+        store._published = sorted(
+            (str(record["opportunity"].get("publishedAt") or ""), key) for key, record in store.opportunities.items()
+        )
+        return store
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = {
+            "version": FORMAT_VERSION,
+            "opportunities": dict(sorted(self.opportunities.items())),
+            "rejected": dict(sorted(self.rejected.items())),
+        }
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def known(self, key: str, digest: str, today_iso: str) -> bool:
+        """True when ``key`` was already judged with the same fingerprint; marks it seen today."""
+        record = self.opportunities.get(key)
+        if record is not None and record.get("fingerprint") == digest:
+            record["seenAt"] = today_iso
+            return True
+        rejected = self.rejected.get(key)
+        if rejected is not None and digest in rejected:
+            rejected[digest] = today_iso
+            return True
+        return False
+
+    def put(self, key: str, digest: str, opportunity: dict, deadline_iso: str, today_iso: str) -> None:
+        rejected = self.rejected.get(key)
+        if rejected is not None:
+            rejected.pop(digest, None)
+            if not rejected:
+                del self.rejected[key]
+        previous = self.opportunities.get(key)
+        if previous is not None:
+            seq = int(previous.get("seq", 0) or 0)
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        self.opportunities[key] = {
+            "fingerprint": digest,
+            "opportunity": opportunity,
+            "deadlineDate": deadline_iso,
+            "seenAt": today_iso,
+            "seq": seq,
+        }
+        if deadline_iso:
+            heapq.heappush(self._deadlines, (deadline_iso, key))
+        bisect.insort(self._published, (str(opportunity.get("publishedAt") or ""), key))
+
+    def reject(self, key: str, digest: str, today_iso: str) -> None:
+        """Remember that ``key`` with this fingerprint is not an opportunity; a stored one stays."""
+        self.rejected.setdefault(key, {})[digest] = today_iso
+
+    def expire(self, today_iso: str) -> list[str]:
+        """Move opportunities whose deadline is before ``today_iso`` to the rejected set; return their keys."""
+        expired: list[str] = []
+        while self._deadlines and self._deadlines[0][0] < today_iso:
+            deadline_iso, key = heapq.heappop(self._deadlines)
+            record = self.opportunities.get(key)
+            if record is None or record.get("deadlineDate") != deadline_iso:
+                continue
+            del self.opportunities[key]
+            self.reject(key, record.get("fingerprint", ""), record.get("seenAt", today_iso))
+            expired.append(key)
+        return expired
+
+    def _current(self, published_iso: str, key: str) -> dict | None:
+        record = self.opportunities.get(key)
+        if record is None or str(record["opportunity"].get("publishedAt") or "") != published_iso:
+            return None
+        return record
+
+    def prune_published_before(self, cutoff_iso: str) -> int:
+        """Drop opportunities published before ``cutoff_iso``; they can no longer be shown."""
+        split = bisect.bisect_left(self._published, (cutoff_iso, ""))
+        removed = 0
+        for published_iso, key in self._published[:split]:
+            if self._current(published_iso, key) is not None:
+                del self.opportunities[key]
+                removed += 1
+        del self._published[:split]
+        return removed
+
+    def prune_rejected(self, cutoff_iso: str) -> int:
+        """Forget rejections not seen since ``cutoff_iso``."""
+        removed = 0
+        for key in list(self.rejected):
+            digests = self.rejected[key]
+            stale = [digest for digest, seen_at in digests.items() if str(seen_at or "") < cutoff_iso]
+            for digest in stale:
+                del digests[digest]
+            removed += len(stale)
+            if not digests:
+                del self.rejected[key]
+        return removed
+
+    def published_since(self, cutoff_iso: str, order: dict[str, int] | None = None) -> list[dict]:
+        """Opportunities published on or after ``cutoff_iso``, in the order they were first stored.
+
+        With ``order``, only the keys it maps are returned, sorted by their value.
+        """
+        start = bisect.bisect_left(self._published, (cutoff_iso, ""))
+        found: dict[str, dict] = {}
+        for published_iso, key in self._published[start:]:
+            record = self._current(published_iso, key)
+            # A key re-added with the same date has two index entries.
+            if record is not None and (order is None or key in order):
+                found[key] = record
+        if order is not None:
+            return [found[key]["opportunity"] for key in sorted(found, key=order.__getitem__)]
+        return [record["opportunity"] for record in sorted(found.values(), key=lambda record: record.get("seq", 0))]
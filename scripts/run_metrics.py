@@ -0,0 +1,162 @@
+"""
+run_metrics.py – lightweight stage timings and counters for a collector run.
+
+Stages are timed with nested ``span`` context managers.  Each span name
+accumulates calls, wall and CPU time, and self time (wall time minus time
+spent in nested spans).  ``count`` adds to the innermost open span and,
+when a host is given, to a per-host table.  Everything is module state,
+cleared by ``reset``.
+
+With a profile directory set, each outermost span also runs under its own
+``cProfile`` profiler.  ``dump_profiles`` then writes a ``<stage>.prof`` file
+and a text summary for each.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+_STAGES: dict[str, dict] = {}
+_HOSTS: dict[str, dict[str, int]] = {}
+_COUNTERS: dict[str, int] = {}
+_PROFILERS: dict[str, cProfile.Profile] = {}
+_PROFILE_DIR = ""
+_STARTED_AT = time.perf_counter()
+
+
+def reset(profile_dir: str = "") -> None:
+    """Clear all timings and counters; profile outermost spans into ``profile_dir`` when set."""
+    global _PROFILE_DIR, _STARTED_AT
+    with _LOCK:
+        _STAGES.clear()
+        _HOSTS.clear()
+        _COUNTERS.clear()
+        _PROFILERS.clear()
+    _LOCAL.stack = []
+    _PROFILE_DIR = profile_dir
+    _STARTED_AT = time.perf_counter()
+
+
+def _stack() -> list[list]:
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+def _stage(name: str) -> dict:
+    stage = _STAGES.get(name)
+    if stage is None:
+        stage = _STAGES[name] = {"calls": 0, "wall_s": 0.0, "self_s": 0.0, "cpu_s": 0.0, "counters": {}}
+    return stage
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as stage ``name``."""
+    stack = _stack()
+    profiler = None
+    if _PROFILE_DIR and not stack and threading.current_thread() is threading.main_thread():
+        profiler = _PROFILERS.get(name)
+        if profiler is None:
+            profiler = _PROFILERS[name] = cProfile.Profile()
+        profiler.enable()
+    with _LOCK:
+        _stage(name)  # registers stages in the order they are first entered
+    # [name, wall time of nested spans]
+    frame = [name, 0.0]
+    stack.append(frame)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        stack.pop()
+        if stack:
+            stack[-1][1] += wall
+        if profiler is not None:
+            profiler.disable()
+        with _LOCK:
+            stage = _stage(name)
+            stage["calls"] += 1
+            stage["wall_s"] += wall
+            stage["self_s"] += wall - frame[1]
+            stage["cpu_s"] += cpu
+
+
+def iter_span(items: Iterable[T], name: str) -> Iterator[T]:
+    """Yield from ``items``, timing each step of the iterator as stage ``name``.
+
+    Used for generator stages, where the work happens lazily as items are pulled.
+    """
+    iterator = iter(items)
+    while True:
+        with span(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def count(name: str, n: int = 1, host: str = "") -> None:
+    """Add ``n`` to counter ``name`` on the innermost open span and on ``host``."""
+    stack = _stack()
+    with _LOCK:
+        if stack:
+            counters = _stage(stack[-1][0])["counters"]
+        else:
+            counters = _COUNTERS
+        counters[name] = counters.get(name, 0) + n
+        if host:
+            per_host = _HOSTS.setdefault(host, {})
+            per_host[name] = per_host.get(name, 0) + n
+
+
+def snapshot() -> dict:
+    """JSON-ready view of the run so far, rounded to milliseconds."""
+    with _LOCK:
+        stages = {
+            name: {
+                "calls": stage["calls"],
+                "wall_s": round(stage["wall_s"], 3),
+                "self_s": round(stage["self_s"], 3),
+                "cpu_s": round(stage["cpu_s"], 3),
+                **({"counters": dict(stage["counters"])} if stage["counters"] else {}),
+            }
+            for name, stage in _STAGES.items()
+        }
+        hosts = {host: dict(sorted(values.items())) for host, values in sorted(_HOSTS.items())}
+        counters = dict(_COUNTERS)
+    payload = {"total_s": round(time.perf_counter() - _STARTED_AT, 3), "stages": stages, "hosts": hosts}
+    if counters:
+        payload["counters"] = counters
+    return payload
+
+
+def dump_profiles(limit: int = 40) -> list[str]:
+    """Write ``<stage>.prof`` and ``<stage>.txt`` for every profiled stage; return the paths."""
+    if not _PROFILE_DIR or not _PROFILERS:
+        return []
+    os.makedirs(_PROFILE_DIR, exist_ok=True)
+    written: list[str] = []
+    for name, profiler in _PROFILERS.items():
+        base = os.path.join(_PROFILE_DIR, name.replace("/", "_"))
+        profiler.dump_stats(base + ".prof")
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(limit)
+        with open(base + ".txt", "w", encoding="utf-8") as fh:
+            fh.write(buffer.getvalue())
+        written.extend([base + ".prof", base + ".txt"])
+    return written
@@ -0,0 +1,216 @@
+"""
+run_pipeline.py – run the collector and the daily builders in one process.
+
+The scheduled workflows each start a fresh interpreter, re-import the stack
+and re-read docs/data/latest.json.  This runner executes the same stages as
+a small DAG instead: the collector's latest payload and the PDF publications
+are handed to later stages in memory, every feed URL is fetched and parsed
+once per run, and the PDF builder resolves redirects through the collector's
+persistent redirect cache.  The IMF fetcher is a Node script; it runs as a
+subprocess alongside the Python stages.
+
+A stage whose inputs were not produced in this run reads them from disk, as
+its standalone script does, so any subset can be run:
+
+    python scripts/run_pipeline.py                       # everything
+    python scripts/run_pipeline.py --only pdf_publications,bd_opps,exec_brief
+    python scripts/run_pipeline.py --skip collect,imf
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+try:
+    from lazy_import import lazy_import
+except ImportError:
+    from scripts.lazy_import import lazy_import
+
+try:
+    import build_bd_opps
+    import build_exec_brief_snappy
+    import build_pdf_publications
+    import collect_rfps
+except ImportError:
+    from scripts import build_bd_opps, build_exec_brief_snappy, build_pdf_publications, collect_rfps
+
+feedparser = lazy_import("feedparser")
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_collect(state: dict) -> dict:
+    return collect_rfps.run(profile_dir=state.get("profile_dir", ""))
+
+
+def _shared_resolve(url: str) -> str:
+    # Same HEAD-then-GET resolution as build_pdf_publications.resolve_final_url,
+    # answered from (and recorded in) the collector's redirect cache.
+    url = build_pdf_publications.unwrap_search_redirect(url)
+    if not url:
+        return ""
+    return collect_rfps._resolve_redirects(url, timeout_seconds=12)
+
+
+def _run_pdf_publications(state: dict) -> dict:
+    return build_pdf_publications.main(latest=state.get("collect"), resolve_url=_shared_resolve)
+
+
+def _run_bd_opps(state: dict) -> dict:
+    return build_bd_opps.main(latest=state.get("collect"))
+
+
+def _run_exec_brief(state: dict) -> dict:
+    recent = state.get("pdf_publications")
+    pdfs = recent.get("publications") if recent else None
+    return build_exec_brief_snappy.main(latest=state.get("collect"), pdfs=pdfs or None)
+
+
+def _run_news(state: dict) -> None:
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    importlib.import_module("fetch_news").main()
+
+
+# name -> (stages whose in-memory output it uses when they run in the same pipeline, runner).
+# Listed in dependency order.
+STAGES: dict[str, tuple[tuple[str, ...], Callable[[dict], object]]] = {
+    "collect": ((), _run_collect),
+    "pdf_publications": (("collect",), _run_pdf_publications),
+    "bd_opps": (("collect",), _run_bd_opps),
+    "exec_brief": (("collect", "pdf_publications"), _run_exec_brief),
+    "news": ((), _run_news),
+}
+# Stages that are not Python; started first and waited for at the end.
+EXTERNAL_STAGES: dict[str, list[str]] = {
+    "imf": ["node", os.path.join("scripts", "fetch_imf_ven.js")],
+}
+
+
+@contextmanager
+def shared_feed_cache() -> Iterator[dict]:
+    """Parse each feed URL once for the duration of the block; later calls get the same result.
+
+    Yields the cache so callers can report on it.  Results are shared, not
+    copied; the stages only read them.
+    """
+    cache: dict[str, object] = {}
+    lock = threading.Lock()
+    original_parse = feedparser.parse
+
+    def parse(source, *args, **kwargs):
+        if not (isinstance(source, str) and source.startswith(("http://", "https://"))):
+            return original_parse(source, *args, **kwargs)
+        with lock:
+            cached = cache.get(source)
+        if cached is None:
+            cached = original_parse(source, *args, **kwargs)
+            with lock:
+                cached = cache.setdefault(source, cached)
+        return cached
+
+    feedparser.parse = parse
+    try:
+        yield cache
+    finally:
+        feedparser.parse = original_parse
+
+
+def select_stages(only: list[str], skip: list[str]) -> list[str]:
+    """Stage names to run, in dependency order."""
+    known = list(STAGES) + list(EXTERNAL_STAGES)
+    unknown = [name for name in only + skip if name not in known]
+    if unknown:
+        raise ValueError(f"unknown stage(s): {', '.join(unknown)}; choose from {', '.join(known)}")
+    chosen = only or known
+    return [name for name in known if name in chosen and name not in skip]
+
+
+def run_pipeline(stages: list[str], profile_dir: str = "") -> dict[str, str]:
+    """Run ``stages`` and return each one's outcome: ``ok``, ``failed`` or ``skipped``."""
+    state: dict = {"profile_dir": profile_dir}
+    outcomes: dict[str, str] = {}
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+
+    processes: dict[str, tuple[subprocess.Popen, float]] = {}
+    for name in stages:
+        if name in EXTERNAL_STAGES:
+            try:
+                processes[name] = (subprocess.Popen(EXTERNAL_STAGES[name], cwd=ROOT_DIR), time.perf_counter())
+            except OSError as exc:
+                logger.error("Stage %s could not start: %s", name, exc)
+                outcomes[name] = "failed"
+
+    redirect_cache_path = os.path.join(collect_rfps.DATA_DIR, collect_rfps.REDIRECT_CACHE_FILENAME)
+    collect_rfps._load_redirect_cache(redirect_cache_path)
+    with shared_feed_cache() as feeds:
+        for name in stages:
+            if name not in STAGES:
+                continue
+            deps, runner = STAGES[name]
+            blocked = [dep for dep in deps if outcomes.get(dep) in ("failed", "skipped")]
+            if blocked:
+                logger.warning("Skipping %s: %s did not complete", name, ", ".join(blocked))
+                outcomes[name] = "skipped"
+                continue
+            stage_started = time.perf_counter()
+            try:
+                state[name] = runner(state)
+                outcomes[name] = "ok"
+            except Exception:  # noqa: BLE001
+                logger.exception("Stage %s failed", name)
+                outcomes[name] = "failed"
+            timings[name] = time.perf_counter() - stage_started
+    collect_rfps._save_redirect_cache(redirect_cache_path)
+
+    for name, (process, process_started) in processes.items():
+        returncode = process.wait()
+        outcomes[name] = "ok" if returncode == 0 else "failed"
+        timings[name] = time.perf_counter() - process_started
+
+    for name in stages:
+        logger.info("%-18s %-8s %7.2fs", name, outcomes.get(name, "skipped"), timings.get(name, 0.0))
+    logger.info("Pipeline finished in %.2fs; %d feeds parsed once and shared", time.perf_counter() - started, len(feeds))
+    return outcomes
+
+
+def _csv(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the collector and the daily builders as one pipeline.")
+    parser.add_argument("--only", type=_csv, default=[], help="comma-separated stages to run")
+    parser.add_argument("--skip", type=_csv, default=[], help="comma-separated stages to leave out")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=os.path.join(collect_rfps.DATA_DIR, "profile"),
+        default="",
+        metavar="DIR",
+        help="write the collector's cProfile stats per stage to DIR (default: data/profile)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        stages = select_stages(args.only, args.skip)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # The builders use paths relative to the repository root.
+    os.chdir(ROOT_DIR)
+    outcomes = run_pipeline(stages, profile_dir=args.profile)
+    return 0 if all(outcome == "ok" for outcome in outcomes.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
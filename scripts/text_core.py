@@ -0,0 +1,61 @@
+"""
+text_core.py – shared text normalisation, sentence splitting and noise markers.
+
+The collectors all clean scraped text the same way.  The patterns live here
+precompiled, marker lists are compiled into a single alternation so a text
+is scanned once instead of once per marker, and normalisation of short,
+frequently repeated inputs (titles, snippets) is memoised.
+"""
+
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Iterable
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ])")
+# Also breaks before a sentence that opens with a figure ("... rose. 40% of ...").
+SENTENCE_BOUNDARY_WITH_DIGITS_RE = re.compile(r"(?<=[\.\!\?])\s+(?=[A-ZÁÉÍÓÚÑ0-9])")
+DATELINE_RE = re.compile(r"^[A-ZÁÉÍÓÚÑ][A-Za-zÁÉÍÓÚÑáéíóúñ\s\.\-]{2,40}\s+\([^\)]+\)\s+[-—]\s+")
+
+# Inputs up to this length go through the memo; longer bodies are rarely repeated.
+MEMO_MAX_CHARS = 600
+
+
+def compile_markers(markers: Iterable[str]) -> re.Pattern:
+    """Compile literal markers into one pattern that finds any of them in a single scan."""
+    unique = sorted(set(markers), key=len, reverse=True)
+    if not unique:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(marker) for marker in unique))
+
+
+def has_marker(pattern: re.Pattern, text: str) -> bool:
+    return pattern.search(text) is not None
+
+
+def collapse_whitespace(text: str) -> str:
+    return _SPACE_RE.sub(" ", text or "").strip()
+
+
+def _normalize(text: str) -> str:
+    return _SPACE_RE.sub(" ", unescape(_TAG_RE.sub(" ", text))).strip()
+
+
+_normalize_cached = lru_cache(maxsize=8192)(_normalize)
+
+
+def normalize_text_block(text: str) -> str:
+    """Strip tags, unescape entities and collapse whitespace."""
+    if not text:
+        return ""
+    if len(text) <= MEMO_MAX_CHARS:
+        return _normalize_cached(text)
+    return _normalize(text)
+
+
+def split_sentences(text: str, boundary: re.Pattern = SENTENCE_BOUNDARY_RE) -> list[str]:
+    """Split on terminal punctuation followed by a capitalised word; empty parts are dropped."""
+    return [part.strip() for part in boundary.split(text) if part.strip()]
@@ -0,0 +1,107 @@
+"""
+url_analysis.py – parse each URL once and answer every question about it.
+
+The collectors ask the same link for its host, canonical form, path shape and
+domain class many times per run.  ``parse_url`` does the ``urlparse`` work
+once per raw URL (LRU cached) and ``domain_in`` answers "is this host, or a
+subdomain of it, in the set" with one set lookup per host label.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Query keys that never change which article a link points at.
+TRACKING_QUERY_KEYS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "mc_cid",
+        "mc_eid",
+        "oc",
+        "ocid",
+        "ref",
+        "ref_src",
+        "source",
+    }
+)
+
+HOMEPAGE_PATHS = frozenset({"", "/", "/home", "/home/", "/index", "/index/", "/index.html", "/en", "/es"})
+
+
+class ParsedURL(NamedTuple):
+    raw: str
+    ok: bool
+    scheme: str
+    netloc: str
+    host: str
+    path: str
+    query: str
+    segments: tuple[str, ...]
+    canonical: str
+    is_homepage: bool
+
+    @property
+    def path_lower(self) -> str:
+        return self.path.lower()
+
+
+def host_suffixes(host: str) -> list[str]:
+    """Return ``host`` and each parent domain: a.b.c -> [a.b.c, b.c, c]."""
+    if not host:
+        return []
+    labels = host.split(".")
+    return [".".join(labels[idx:]) for idx in range(len(labels))]
+
+
+def domain_in(host: str, domains: frozenset[str] | set[str]) -> bool:
+    """True when ``host`` equals, or is a subdomain of, any entry in ``domains``."""
+    if not host or not domains:
+        return False
+    return any(suffix in domains for suffix in host_suffixes(host.lower().strip()))
+
+
+def _strip_www(host: str) -> str:
+    return host[4:] if host.startswith("www.") else host
+
+
+def _canonical(raw: str, scheme: str, host: str, path: str, query: str) -> str:
+    if not host:
+        return raw
+    canonical_path = path.strip() or "/"
+    if canonical_path != "/":
+        canonical_path = canonical_path.rstrip("/")
+    filtered_pairs = [
+        (key, value)
+        for key, value in parse_qsl(query, keep_blank_values=False)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_QUERY_KEYS
+    ]
+    filtered_query = urlencode(filtered_pairs, doseq=True)
+    return urlunparse(((scheme or "https").lower(), host, canonical_path, "", filtered_query, ""))
+
+
+@lru_cache(maxsize=8192)
+def parse_url(url: str) -> ParsedURL:
+    raw = str(url or "").strip()
+    try:
+        parsed = urlparse(raw)
+    except Exception:  # noqa: BLE001
+        return ParsedURL(raw, False, "", "", "", "", "", (), raw, True)
+
+    netloc = (parsed.netloc or "").lower()
+    host = _strip_www(netloc.strip())
+    path = parsed.path or ""
+    segments = tuple(segment for segment in path.strip().lower().split("/") if segment)
+    is_homepage = path.strip().lower() in HOMEPAGE_PATHS or (len(segments) <= 1 and not parsed.query)
+    return ParsedURL(
+        raw=raw,
+        ok=True,
+        scheme=parsed.scheme or "",
+        netloc=netloc,
+        host=host,
+        path=path,
+        query=parsed.query or "",
+        segments=segments,
+        canonical=_canonical(raw, parsed.scheme, host, path, parsed.query or ""),
+        is_homepage=is_homepage,
+    )
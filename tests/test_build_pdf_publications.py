@@ -0,0 +1,220 @@
+"""
+Tests for scripts/build_pdf_publications.py
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import build_pdf_publications as bpp
+
+
+class TestFirstConfirmedPdf:
+    def test_earliest_confirmed_candidate_wins_even_if_slower(self, monkeypatch):
+        def verify_pdf(url):
+            # The first real PDF answers last; a serial scan would still pick it.
+            time.sleep(0.2 if url.endswith("first") else 0.0)
+            return url.endswith(("first", "second")), url, 2025 if url.endswith("first") else None
+
+        monkeypatch.setattr(bpp, "verify_pdf", verify_pdf)
+        candidates = ["https://www.imf.org/page", "https://www.imf.org/first", "https://www.imf.org/second"]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            chosen = bpp._first_confirmed_pdf(candidates, lambda url: url, pool)
+        assert chosen == ("https://www.imf.org/first", 2025)
+
+    def test_skips_disallowed_and_unconfirmed_candidates(self, monkeypatch):
+        monkeypatch.setattr(bpp, "verify_pdf", lambda url: (False, url, None))
+        candidates = ["https://example.com/report.pdf", "https://www.imf.org/page", "https://www.iadb.org/doc.pdf"]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            assert bpp._first_confirmed_pdf(candidates, lambda url: url, pool) == ("https://www.iadb.org/doc.pdf", None)
+            assert bpp._first_confirmed_pdf(candidates[:2], lambda url: url, pool) == ("", None)
+
+
+class _RangeResponse:
+    def __init__(self, url, body, status_code=206, headers=None):
+        self.url = url
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class TestVerifyPdf:
+    def test_checks_magic_bytes_not_content_type(self, monkeypatch):
+        bodies = {
+            "https://www.imf.org/a": b"%PDF-1.7\n1 0 obj << /CreationDate (D:20250314) >>" + b"x" * 4000,
+            "https://www.imf.org/b": b"<html>not a pdf</html>",
+        }
+        requested: list[dict] = []
+
+        def fake_get(url, **kwargs):
+            requested.append(kwargs["headers"])
+            headers = {"content-type": "text/html", "content-range": "bytes 0-1023/52000"}
+            return _RangeResponse(url, bodies[url], headers=headers)
+
+        monkeypatch.setattr(bpp.requests, "get", fake_get)
+        record = bpp.probe_pdf("https://www.imf.org/a")
+        assert record["is_pdf"] is True
+        assert record["size"] == 52000
+        assert record["year"] == 2025
+        assert requested[0]["Range"] == "bytes=0-1023"
+        assert bpp.probe_pdf("https://www.imf.org/b")["is_pdf"] is False
+
+    def test_cached_verdicts_skip_the_network_until_they_expire(self, tmp_path, monkeypatch):
+        calls: list[str] = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            if url.endswith("down"):
+                raise bpp.requests.ConnectionError("offline")
+            if url.endswith("busy"):
+                return _RangeResponse(url, b"", status_code=503)
+            return _RangeResponse(url + "?v=1", b"%PDF-1.4")
+
+        monkeypatch.setattr(bpp.requests, "get", fake_get)
+        monkeypatch.setattr(bpp, "_PDF_VERIFY_CACHE", {})
+        assert bpp.verify_pdf("https://www.imf.org/doc") == (True, "https://www.imf.org/doc?v=1", None)
+        assert bpp.verify_pdf("https://www.imf.org/doc") == (True, "https://www.imf.org/doc?v=1", None)
+        for url in ("https://www.imf.org/down", "https://www.imf.org/busy"):
+            assert bpp.verify_pdf(url) == (False, url, None)
+            assert bpp.verify_pdf(url) == (False, url, None)
+        # Network failures and error statuses are retried; verdicts are not.
+        assert calls == ["https://www.imf.org/doc"] + ["https://www.imf.org/down"] * 2 + ["https://www.imf.org/busy"] * 2
+
+        bpp._PDF_VERIFY_CACHE["https://www.imf.org/stale"] = {"is_pdf": False, "checked_at": 0}
+        path = str(tmp_path / "cache.json")
+        bpp._save_pdf_verify_cache(path)
+        bpp._load_pdf_verify_cache(path)
+        assert list(bpp._PDF_VERIFY_CACHE) == ["https://www.imf.org/doc"]
+
+
+LANDING_PAGE = """
+<html><head><title>Venezuela Economic Update 2025 | World Bank</title></head><body>
+<nav><a href="/content/dam/annual-report.pdf">Annual report (PDF)</a></nav>
+<main>
+  <h1>Venezuela Economic Update 2025</h1>
+  <p>Summary of the outlook.</p>
+  <a href="/docs/annex-tables.pdf">Annex tables</a>
+  <a href="/docs/venezuela-economic-update-2025.pdf#page=2">Download the full report</a>
+  <a href="/about">About</a>
+</main>
+<footer><a href="https://other.org/privacy.pdf">Privacy</a></footer>
+</body></html>
+"""
+
+
+class TestExtractPdfLinks:
+    def _page(self, monkeypatch, html, fed_sizes=None):
+        def fake_stream_text(url, timeout, stop=None, **kwargs):
+            text = ""
+            for start in range(0, len(html), 64):
+                text = html[: start + 64]
+                if fed_sizes is not None:
+                    fed_sizes.append(len(text))
+                if stop is not None and stop(text):
+                    break
+            return "https://www.worldbank.org/en/country/venezuela/update", text
+
+        monkeypatch.setattr(bpp, "stream_text", fake_stream_text)
+
+    def test_ranks_title_match_and_download_wording_first(self, monkeypatch):
+        self._page(monkeypatch, LANDING_PAGE)
+        links = bpp.extract_pdf_links_from_page("https://www.worldbank.org/x", "Venezuela Economic Update 2025")
+        assert links[0] == "https://www.worldbank.org/docs/venezuela-economic-update-2025.pdf#page=2"
+        assert links[1] == "https://www.worldbank.org/docs/annex-tables.pdf"
+        assert set(links[2:]) == {"https://www.worldbank.org/content/dam/annual-report.pdf", "https://other.org/privacy.pdf"}
+
+    def test_stops_reading_once_enough_anchors_were_found(self, monkeypatch):
+        anchors = "".join(f'<a href="/doc{index}.pdf">doc</a>' for index in range(200))
+        fed_sizes: list[int] = []
+        self._page(monkeypatch, f"<html><body>{anchors}</body></html>", fed_sizes)
+        links = bpp.extract_pdf_links_from_page("https://www.imf.org/x")
+        assert len(links) >= bpp.PDF_LINK_LIMIT
+        assert fed_sizes[-1] < len(anchors) / 2
+
+
+def _item(index, year, **extra):
+    return {
+        "id": str(index),
+        "title": f"Venezuela report {index}",
+        "url": f"https://www.imf.org/page{index}",
+        "publishedAt": f"{year}-01-{index:02d}T00:00:00Z",
+        **extra,
+    }
+
+
+class TestAdmitCandidates:
+    def test_drops_network_free_rejects_and_sorts_newest_first(self):
+        year = max(bpp.TARGET_YEARS)
+        items = [
+            _item(1, year),
+            _item(3, year),
+            _item(2, year, title="Oil outlook", preview="Caracas", description="Regional data"),
+            {**_item(4, year), "title": f"Venezuela outlook {year}", "publishedAt": ""},
+        ]
+        admitted = bpp.admit_candidates(items)
+        # Undated items fall back to the year, which sorts below full dates.
+        assert [item["id"] for item in admitted] == ["3", "1", "4"]
+
+
+class TestMain:
+    def _run(self, tmp_path, monkeypatch, items, extract_links):
+        monkeypatch.setattr(bpp, "_items_from_latest", lambda payload: items)
+        monkeypatch.setattr(bpp, "_items_from_feeds", lambda urls: [])
+        monkeypatch.setattr(bpp, "load_feed_urls", lambda: [])
+        monkeypatch.setattr(bpp, "extract_pdf_links_from_page", extract_links)
+        monkeypatch.setattr(bpp, "verify_pdf", lambda url: (False, url, None))
+        for name in ("OUT_JSON_RECENT", "OUT_JSON_2025", "OUT_JSON_2025_2026", "PDF_VERIFY_CACHE_PATH"):
+            monkeypatch.setattr(bpp, name, str(tmp_path / f"{name}.json"))
+        return bpp.main(latest={}, resolve_url=lambda url: url)
+
+    def test_concurrent_discovery_keeps_order_and_dedupes_newest_first(self, tmp_path, monkeypatch):
+        year = max(bpp.TARGET_YEARS)
+        items = [_item(index, year) for index in range(1, 5)]
+        # Pages 1 and 3 link the same PDF; the newer item keeps it.
+        pdf_for_page = {
+            "https://www.imf.org/page1": "https://www.imf.org/shared.pdf",
+            "https://www.imf.org/page2": "https://www.imf.org/two.pdf",
+            "https://www.imf.org/page3": "https://www.imf.org/shared.pdf",
+            "https://www.imf.org/page4": "https://www.imf.org/four.pdf",
+        }
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def extract_links(url, title=""):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.3 if url.endswith("page4") else 0.05)
+            with lock:
+                active["now"] -= 1
+            return [pdf_for_page[url]]
+
+        recent = self._run(tmp_path, monkeypatch, items, extract_links)
+        assert [p["id"] for p in recent["publications"]] == ["4", "3", "2"]
+        assert recent["publications"][1]["pdfUrl"] == "https://www.imf.org/shared.pdf"
+        assert active["peak"] > 1
+
+    def test_stops_discovery_once_recent_list_is_filled(self, tmp_path, monkeypatch):
+        year = max(bpp.TARGET_YEARS)
+        items = [_item(index, year) for index in range(1, 41)]
+        fetched: list[str] = []
+
+        def extract_links(url, title=""):
+            fetched.append(url)
+            return [url + ".pdf"]
+
+        recent = self._run(tmp_path, monkeypatch, items, extract_links)
+        assert [p["id"] for p in recent["publications"]] == [str(index) for index in range(40, 33, -1)]
+        # Only the newest items plus the in-flight window were looked at.
+        assert len(fetched) <= bpp.RECENT_LIMIT + bpp.DISCOVERY_WORKERS
+        assert "https://www.imf.org/page1" not in fetched
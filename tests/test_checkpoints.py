@@ -0,0 +1,41 @@
+"""
+Tests for scripts/checkpoints.py
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import checkpoints
+from feed_entry import FeedEntry
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestCheckpoints:
+    def test_round_trip_keeps_entries_and_datetimes(self, tmp_path):
+        run_dir = checkpoints.start(str(tmp_path), NOW, "abc")
+        entry = FeedEntry(title="Oil tender", published=NOW, categories=["energy"], custom={"k": 1})
+        checkpoints.save(run_dir, "selected", [entry, {"title": "plain", "published": NOW}])
+        loaded = checkpoints.load(run_dir, "selected")
+        assert isinstance(loaded[0], FeedEntry)
+        assert loaded[0] == entry
+        assert loaded[1] == {"title": "plain", "published": NOW}
+        assert checkpoints.manifest(run_dir)["completed"] == ["selected"]
+        assert checkpoints.load(run_dir, "candidates") is None
+
+    def test_find_resumable_matches_inputs_and_prefers_newest(self, tmp_path):
+        older = checkpoints.start(str(tmp_path), NOW, "abc")
+        newer = checkpoints.start(str(tmp_path), NOW + timedelta(hours=1), "abc")
+        checkpoints.start(str(tmp_path), NOW + timedelta(hours=2), "other-inputs")
+        assert checkpoints.find_resumable(str(tmp_path), "abc") == newer
+        assert checkpoints.find_resumable(str(tmp_path), "abc", os.path.basename(older)) == older
+        assert checkpoints.find_resumable(str(tmp_path / "missing"), "abc") == ""
+
+    def test_collect_garbage_removes_only_stale_runs(self, tmp_path):
+        stale = checkpoints.start(str(tmp_path), NOW - timedelta(days=10), "abc")
+        fresh = checkpoints.start(str(tmp_path), NOW - timedelta(days=1), "abc")
+        assert checkpoints.collect_garbage(str(tmp_path), NOW, max_age_days=7) == [os.path.basename(stale)]
+        assert os.path.isdir(fresh)
+        assert not os.path.exists(stale)
@@ -392,6 +392,122 @@ class TestScoreEntry:
         assert cr.score_entry(signal, cfg, NOW) > cr.score_entry(plain, cfg, NOW)
 
 
+# ---------------------------------------------------------------------------
+# select_diverse_top_entries
+# ---------------------------------------------------------------------------
+
+class TestSelectDiverseTopEntries:
+    def _entries(self):
+        oil = [make_entry(title=f"Venezuela oil field {i} output", link=f"https://example.com/news/oil-{i}") for i in range(5)]
+        food = [make_entry(title=f"Venezuela agriculture plan {i}", link=f"https://example.com/news/food-{i}") for i in range(2)]
+        return oil[:4] + food + oil[4:]
+
+    def test_minimum_quota_then_rank_under_caps(self):
+        cfg = minimal_cfg()
+        cfg["selection"] = {"min_per_section": 1, "max_per_section": 2}
+        titles = [e["title"] for e in cr.select_diverse_top_entries(self._entries(), cfg, 4)]
+        assert titles == [
+            "Venezuela oil field 0 output",
+            "Venezuela agriculture plan 0",
+            "Venezuela oil field 1 output",
+            "Venezuela agriculture plan 1",
+        ]
+
+    def test_capped_entries_backfill_in_rank_order(self):
+        cfg = minimal_cfg()
+        cfg["selection"] = {"min_per_section": 0, "max_per_section": 2}
+        titles = [e["title"] for e in cr.select_diverse_top_entries(self._entries(), cfg, 6)]
+        assert titles == [
+            "Venezuela oil field 0 output",
+            "Venezuela oil field 1 output",
+            "Venezuela agriculture plan 0",
+            "Venezuela agriculture plan 1",
+            "Venezuela oil field 2 output",
+            "Venezuela oil field 3 output",
+        ]
+
+    def test_duplicate_keys_selected_once(self):
+        cfg = minimal_cfg()
+        entry = make_entry(title="Venezuela oil field output", link="https://example.com/news/oil?utm_source=x")
+        twin = make_entry(title="Venezuela oil field output", link="https://example.com/news/oil")
+        assert len(cr.select_diverse_top_entries([entry, twin], cfg, 5)) == 1
+
+
+class TestStreamCandidates:
+    def _feeds(self):
+        titles = [
+            "PDVSA restarts Maracaibo upgrader in Venezuela",
+            "Chevron cargo leaves Jose terminal for Gulf refiners",
+            "Orinoco belt drilling rigs return after power cuts",
+            "Venezuela gas flaring falls as compressors come online",
+            "Caracas names new oil minister amid licence talks",
+            "Zulia pipeline spill prompts PDVSA cleanup crews",
+            "Tanker fleet shortage slows Venezuela crude exports",
+            "Monagas field operator signs gas supply contract",
+            "Venezuela diluent imports climb to six-month high",
+            "Refinery outage at Cardon trims Venezuela fuel output",
+            "Falcon coast gas project draws Trinidad interest",
+            "Venezuelan oil union warns over delayed wage talks",
+        ]
+        oil = [
+            make_entry(
+                title=title,
+                link=f"https://example.com/news/2026/02/{title.lower().replace(' ', '-')}",
+                summary="Venezuela PDVSA oil tender" if i % 2 else "Venezuela oil",
+                published=NOW - timedelta(days=i % 9),
+            )
+            for i, title in enumerate(titles)
+        ]
+        food = [
+            make_entry(
+                title=title,
+                link=f"https://example.com/news/2026/02/{title.lower().replace(' ', '-')}",
+                published=NOW - timedelta(days=1),
+            )
+            for title in (
+                "Venezuela agriculture ministry expands seed credit",
+                "Food security survey flags Venezuela rice deficit",
+                "Venezuela agriculture exports of cocoa reach record",
+            )
+        ]
+        rejected = [make_entry(title="Football in Venezuela", link="https://example.com/news/2026/02/football")]
+        return {"https://a.example/rss": oil[:6] + rejected, "https://b.example/rss": food + oil[6:]}
+
+    def _run(self, streaming: bool, max_results: int):
+        feeds = self._feeds()
+        cfg = minimal_cfg()
+        cfg["selection"] = {"min_per_section": 1, "max_per_section": 2}
+        cr._REJECTED_LINKS = []
+        with (
+            patch.object(cr, "fetch_feed", side_effect=lambda url: feeds[url]),
+            patch.object(cr, "_resolve_redirects", side_effect=lambda url, timeout_seconds=6: url),
+        ):
+            if streaming:
+                ranked, counts = cr.stream_candidates(list(feeds), cfg, NOW, max_results)
+            else:
+                raw = list(cr.iter_feed_entries(list(feeds)))
+                deduped = cr.deduplicate(cr.apply_link_quality_gate(cr.filter_entries(raw, cfg, NOW), cfg), cfg=cfg)
+                ranked = cr.score_and_rank(deduped, cfg, NOW)
+                counts = {"fetched": len(raw), "deduped": len(deduped)}
+        top = cr.select_diverse_top_entries(ranked, cfg, max_results)
+        return [e["title"] for e in top], counts, ranked, list(cr._REJECTED_LINKS)
+
+    def test_matches_batch_selection(self):
+        for max_results in (1, 2, 4):
+            batch_titles, batch_counts, _, batch_rejected = self._run(False, max_results)
+            stream_titles, stream_counts, _, stream_rejected = self._run(True, max_results)
+            assert stream_titles == batch_titles
+            assert stream_counts["fetched"] == batch_counts["fetched"] == 16
+            assert stream_counts["deduped"] == batch_counts["deduped"]
+            assert stream_rejected == batch_rejected
+
+    def test_pool_is_bounded_per_section(self):
+        _, _, ranked, _ = self._run(True, 2)
+        labels = [cr.detect_sector_label(e, minimal_cfg()) for e in ranked]
+        assert labels.count("Extractives & Mining") == 4
+        assert [e["score"] for e in ranked] == sorted((e["score"] for e in ranked), reverse=True)
+
+
 # ---------------------------------------------------------------------------
 # detect_flags
 # ---------------------------------------------------------------------------
@@ -452,6 +568,146 @@ class TestArticleTextEnrichment:
         assert "article_text" in allowed
 
 
+class TestPageMetadata:
+    def test_reads_head_meta_and_json_ld(self):
+        html = (
+            "<html><head>"
+            '<meta content="Ignored because og wins." name="description">'
+            '<meta property="og:description" content="Caracas port operators expanded customs hours.">'
+            '<script type="application/ld+json">{"@graph": [{"datePublished": "2026-02-18T10:00:00Z"}]}</script>'
+            "</head><body><time datetime=\"2025-01-01\">old</time></body></html>"
+        )
+        assert cr._extract_meta_description(html) == "Caracas port operators expanded customs hours."
+        assert cr._extract_source_published_date(html) == "2026-02-18"
+
+    def test_falls_back_to_body_time_tag(self):
+        html = "<html><head><title>x</title></head><body><time datetime=\"2026-02-17\">Feb 17</time></body></html>"
+        assert cr._extract_source_published_date(html) == "2026-02-17"
+        assert cr._extract_meta_description(html) == ""
+
+
+class TestPreviewStore:
+    def test_round_trip_keyed_by_canonical_url(self, tmp_path):
+        path = str(tmp_path / "preview_store.json")
+        cr._load_preview_store(path)
+        cr._preview_store_put(
+            "https://www.example.com/news/venezuela-port?utm_source=rss",
+            "Port operators expanded customs hours.",
+            "trafilatura",
+            now_ts=1_000,
+            ttl_seconds=100,
+        )
+        cr._save_preview_store(path, now_ts=1_000)
+
+        cr._load_preview_store(path)
+        hit = cr._preview_store_get("https://example.com/news/venezuela-port", now_ts=1_050)
+        assert hit == {"preview": "Port operators expanded customs hours.", "preview_source": "trafilatura"}
+        assert cr._preview_store_get("https://example.com/news/other", now_ts=1_050) is None
+        stats = cr._preview_store_summary()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_expired_entries_miss_and_are_pruned(self, tmp_path):
+        path = str(tmp_path / "preview_store.json")
+        cr._load_preview_store(path)
+        cr._preview_store_put("https://example.com/news/a", "Preview text.", "jina", now_ts=0, ttl_seconds=10)
+        assert cr._preview_store_get("https://example.com/news/a", now_ts=11) is None
+        assert cr._preview_store_summary()["expired"] == 1
+        cr._save_preview_store(path, now_ts=11)
+        assert json.loads(open(path, encoding="utf-8").read()) == {}
+
+
+class TestDerivedMemo:
+    FIELDS = {
+        "event_types": ["Sanctions"],
+        "sentiment": "Negative",
+        "materiality": 3,
+        "risk_score": 80,
+        "entities": ["OFAC"],
+        "summary_text": "OFAC extended the license.",
+        "summary_source": "feed_snippet",
+        "tags": ["Sanctions"],
+        "numbers": [],
+        "insight2": {"s1": "a", "s2": "b", "s3": "c", "confidence": "MED", "evidence": []},
+    }
+
+    def test_hit_requires_matching_source_and_config(self, tmp_path):
+        path = str(tmp_path / "derived_memo.json")
+        cr._load_derived_memo(path)
+        entry = make_entry(title="OFAC license for Venezuela", link="https://example.com/a?utm_source=x")
+        source_hash = cr._source_text_hash(entry)
+        cr._derived_memo_put(entry["link"], source_hash, "cfg1", self.FIELDS, now_ts=100)
+        cr._save_derived_memo(path, now_ts=100, ttl_seconds=1000)
+
+        cr._load_derived_memo(path)
+        assert cr._derived_memo_get("https://example.com/a", source_hash, "cfg1", now_ts=200) == self.FIELDS
+        changed = dict(entry, summary="Updated text")
+        assert cr._derived_memo_get("https://example.com/a", cr._source_text_hash(changed), "cfg1", now_ts=200) is None
+        assert cr._derived_memo_get("https://example.com/a", source_hash, "cfg2", now_ts=200) is None
+        stats = cr._derived_memo_summary()
+        assert (stats["hits"], stats["misses"], stats["stale"]) == (1, 2, 2)
+
+    def test_config_hash_is_order_independent(self):
+        assert cr._config_hash({"a": 1, "b": [1, 2]}) == cr._config_hash({"b": [1, 2], "a": 1})
+        assert cr._config_hash({"a": 1}) != cr._config_hash({"a": 2})
+
+
+class TestAnnotateIntelligence:
+    def test_sanctions_story(self):
+        entry = make_entry(
+            title="OFAC tightens sanctions on PDVSA oil exports",
+            summary="The embargo deepens the crisis as Maduro faces protest.",
+        )
+        entry["source_domain"] = "reuters.com"
+        cr._annotate_intelligence(entry)
+        assert entry["event_types"] == ["Sanctions", "Oil production/export", "Political transition"]
+        assert entry["sentiment"] == "Negative"
+        assert entry["materiality"] == 4
+        assert entry["risk_score"] == 95
+        assert entry["entities"] == ["PDVSA", "Maduro", "OFAC"]
+
+    def test_matches_individual_scorers(self):
+        entry = make_entry(
+            title="Chevron deal signals oil recovery",
+            summary="IMF notes currency easing and bond growth.",
+        )
+        cr._annotate_intelligence(entry)
+        assert entry["event_types"] == cr._classify_event_types(entry)
+        assert entry["sentiment"] == cr._sentiment_label(entry) == "Positive"
+        assert entry["materiality"] == cr._materiality_score(entry)
+        assert entry["risk_score"] == cr._risk_score(entry)
+        assert entry["entities"] == cr._detect_entities(entry)
+
+
+class TestExtractNumbers:
+    def test_equivalent_values_are_deduplicated(self):
+        text = (
+            "Treasury officials said the license could unlock $2 billion in oil revenue for PDVSA. "
+            "Analysts estimate the same US$2bn figure could move the bond market by 3.5% this quarter."
+        )
+        values = [record["value"] for record in cr._extract_numbers(text)]
+        assert values.count("$2 billion") + values.count("US$2bn") == 1
+        assert "3.5%" in values
+
+    def test_context_window_centres_on_match(self):
+        filler = " ".join(f"word{i}" for i in range(40))
+        text = f"{filler} PDVSA exported 850,000 barrels/day last month {filler}"
+        records = cr._extract_numbers(text)
+        assert records[0]["value"] == "850,000 barrels/day"
+        assert "PDVSA exported 850,000 barrels/day" in records[0]["context"]
+        assert records[0]["label"] == "Oil and production"
+
+    def test_normalised_number_forms(self):
+        def key(value):
+            return cr._normalized_number_key(cr._NUMBER_PATTERN.search(value))
+
+        assert key("$2 billion") == key("US$2bn") == key("$2,000 million")
+        assert key("1.5%") == key("1,5%")
+        assert key("1,200 bpd") == key("1.200 barrels/day")
+        assert key("45 days") != key("45 months")
+
+
 # ---------------------------------------------------------------------------
 # detect_sector_label
 # ---------------------------------------------------------------------------
@@ -675,6 +931,10 @@ class TestRunIntegration:
         meta = json.loads(metadata_path.read_text())
         assert meta["fetched"] == 1
         assert "run_at" in meta
+        assert "hit_rate" in meta["preview_cache"]
+        assert meta["timings"]["stages"]["fetch_feeds"]["counters"]["feed_entries"] == 1
+        assert "write_outputs" in meta["timings"]["stages"]
+        assert (data_dir / "preview_store.json").exists()
 
     def test_idempotency(self, tmp_path):
         """Running twice without new data should not change docs/index.md."""
@@ -728,3 +988,103 @@ class TestRunIntegration:
         assert mtime_after_first == mtime_after_second, (
             "docs/index.md should not be re-written when content is unchanged"
         )
+
+    def test_resume_skips_completed_stages_after_a_crash(self, tmp_path):
+        cfg_path = tmp_path / "config.yml"
+        feeds_path = tmp_path / "feeds.txt"
+        cfg_path.write_text(yaml.dump(minimal_cfg()))
+        feeds_path.write_text("https://example.com/rss\n")
+        docs_dir = tmp_path / "docs"
+        data_dir = tmp_path / "data"
+        mock_entry = {
+            "title": "Venezuela oil production tender",
+            "link": "https://example.com/2026/02/venezuela-oil-tender",
+            "summary": "Venezuela PDVSA tender procurement for oil production services.",
+            "published": NOW - timedelta(days=1),
+            "source_url": "https://example.com/rss",
+            "source_domain": "example.com",
+        }
+        kwargs = dict(config_path=str(cfg_path), feeds_path=str(feeds_path))
+
+        with (
+            patch.object(cr, "DOCS_DIR", str(docs_dir)),
+            patch.object(cr, "DATA_DIR", str(data_dir)),
+            patch.object(cr, "OUTPUT_PATH", str(docs_dir / "index.md")),
+            patch.object(cr, "METADATA_PATH", str(data_dir / "last_run.json")),
+            patch.object(cr, "enrich_entries_with_article_text"),
+            patch("collect_rfps.datetime") as mock_dt,
+        ):
+            mock_dt.now.return_value = NOW
+            mock_dt.fromtimestamp = datetime.fromtimestamp
+            mock_dt.fromisoformat = datetime.fromisoformat
+            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+            with (
+                patch.object(cr, "fetch_feed", return_value=[mock_entry]),
+                patch.object(cr, "_extract_preview", side_effect=KeyboardInterrupt),
+                pytest.raises(KeyboardInterrupt),
+            ):
+                cr.run(**kwargs)
+            (run_dir,) = list((data_dir / "checkpoints").iterdir())
+            assert json.loads((run_dir / "manifest.json").read_text())["completed"] == ["candidates", "selected"]
+
+            with (
+                patch.object(cr, "fetch_feed", side_effect=AssertionError("feeds fetched again")),
+                patch.object(cr, "_extract_preview", return_value={"preview": "", "preview_source": "none"}),
+            ):
+                cr.run(resume="latest", **kwargs)
+
+        assert json.loads((data_dir / "last_run.json").read_text())["fetched"] == 1
+        assert list((data_dir / "checkpoints").iterdir()) == []
+
+    def test_derived_memo_hits_from_the_second_run_with_identical_rows(self, tmp_path):
+        cfg_path = tmp_path / "config.yml"
+        feeds_path = tmp_path / "feeds.txt"
+        cfg_path.write_text(yaml.dump(minimal_cfg()))
+        feeds_path.write_text("https://example.com/rss\n")
+        docs_dir = tmp_path / "docs"
+        data_dir = tmp_path / "data"
+        mock_entry = {
+            "title": "Venezuela oil production tender",
+            "link": "https://example.com/2026/02/venezuela-oil-tender",
+            "summary": "Venezuela PDVSA opened a tender for oil production services worth $120 million in Zulia.",
+            "published": NOW - timedelta(days=1),
+            "source_url": "https://example.com/rss",
+            "source_domain": "example.com",
+        }
+        preview = {
+            "preview": "PDVSA opened a tender for oil production services in Zulia, with bids due next month.",
+            "preview_source": "trafilatura",
+        }
+        kwargs = dict(config_path=str(cfg_path), feeds_path=str(feeds_path))
+        rows: list[tuple[list, list]] = []
+        memo_stats: list[dict] = []
+
+        with (
+            patch.object(cr, "DOCS_DIR", str(docs_dir)),
+            patch.object(cr, "DATA_DIR", str(data_dir)),
+            patch.object(cr, "OUTPUT_PATH", str(docs_dir / "index.md")),
+            patch.object(cr, "METADATA_PATH", str(data_dir / "last_run.json")),
+            patch.object(cr, "enrich_entries_with_article_text"),
+            patch.object(cr, "fetch_feed", side_effect=lambda url: [dict(mock_entry)]),
+            patch.object(cr, "_extract_preview", return_value=preview),
+            patch("collect_rfps.datetime") as mock_dt,
+        ):
+            mock_dt.now.return_value = NOW
+            mock_dt.fromtimestamp = datetime.fromtimestamp
+            mock_dt.fromisoformat = datetime.fromisoformat
+            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+            for _ in range(3):
+                cr.run(**kwargs)
+                latest = json.loads((docs_dir / "data" / "latest.json").read_text())
+                snapshot = json.loads((data_dir / "latest_stories.json").read_text())
+                rows.append(([item for sector in latest["sectors"] for item in sector["items"]], snapshot))
+                memo_stats.append(json.loads((data_dir / "last_run.json").read_text())["derived_memo"])
+
+        assert rows[0][0], "the item should be published"
+        assert rows[0][0][0]["summary_confidence"] != "Unknown"
+        # Only the new/updated flags (and the icons drawn from them) follow the run-to-run diff.
+        first_items = [{**item, "flags": {}, "icons": []} for item in rows[0][0]]
+        assert [{**item, "flags": {}, "icons": []} for item in rows[1][0]] == first_items
+        assert rows[1][1] == rows[0][1]
+        assert rows[2] == rows[1]
+        assert [(stats["hits"], stats["stale"]) for stats in memo_stats] == [(0, 0), (1, 0), (1, 0)]
@@ -0,0 +1,59 @@
+"""
+Tests for scripts/date_utils.py
+"""
+
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import date_utils as du
+
+
+class TestParseDatetime:
+    def test_rfc822(self):
+        assert du.parse_datetime("Fri, 06 Mar 2026 14:03:12 +0000") == datetime(2026, 3, 6, 14, 3, 12, tzinfo=timezone.utc)
+        assert du.parse_datetime("Thu, 5 Mar 2026 09:03 -0500") == datetime(2026, 3, 5, 14, 3, tzinfo=timezone.utc)
+        assert du.parse_datetime("Mon, 20 Feb 2026 10:00:00 GMT").tzinfo is not None
+
+    def test_iso(self):
+        assert du.parse_datetime("2026-02-20") == datetime(2026, 2, 20, tzinfo=timezone.utc)
+        parsed = du.parse_datetime("2026-02-20T10:11:12.5+02:00")
+        assert parsed.utcoffset() == timedelta(hours=2)
+        assert parsed.microsecond == 500000
+
+    def test_exotic_formats_fall_back_to_dateutil(self):
+        assert du.parse_datetime("February 20, 2026") == datetime(2026, 2, 20, tzinfo=timezone.utc)
+
+    def test_invalid(self):
+        assert du.parse_datetime("") is None
+        assert du.parse_datetime("not a date") is None
+        assert du.parse_datetime("2026-02-30") is None
+        assert du.parse_date_iso("garbage") == ""
+        assert du.parse_date("garbage", date.min) == date.min
+
+    def test_strict_rejects_partial_dates(self):
+        assert du.parse_date("2026-02-20T10:00:00Z", date.min, strict=True) == date(2026, 2, 20)
+        assert du.parse_date("Fri, 06 Mar 2026 14:03:12 +0000", strict=True) == date(2026, 3, 6)
+        for partial in ("2025", "March", "Monday", "February 20, 2026"):
+            assert du.parse_date(partial, date.min, strict=True) == date.min
+
+
+class TestEntryDatetime:
+    def test_struct_time_is_read_as_utc(self, monkeypatch):
+        monkeypatch.setenv("TZ", "America/Caracas")
+        if hasattr(time, "tzset"):
+            time.tzset()
+        try:
+            entry = {"published_parsed": time.strptime("2026-02-20 10:00:00", "%Y-%m-%d %H:%M:%S")}
+            assert du.entry_datetime(entry) == datetime(2026, 2, 20, 10, 0, tzinfo=timezone.utc)
+        finally:
+            monkeypatch.delenv("TZ")
+            if hasattr(time, "tzset"):
+                time.tzset()
+
+    def test_falls_back_to_raw_strings(self):
+        entry = {"published_parsed": None, "updated": "2026-02-20T08:00:00Z"}
+        assert du.entry_datetime(entry) == datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc)
+        assert du.entry_datetime({}) is None
@@ -0,0 +1,74 @@
+"""
+Tests for scripts/extract_preview.py
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import extract_preview
+
+ARTICLE = (
+    "Venezuela's oil output rose to 900,000 barrels per day in May, according to OPEC secondary sources. "
+    "The increase follows new licences granted to foreign partners in the Orinoco belt. "
+    "Analysts expect further gains if sanctions relief holds."
+)
+
+
+def _write_order(tmp_path, monkeypatch, payload: dict) -> None:
+    path = tmp_path / "extractor_order.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    monkeypatch.setattr(extract_preview, "EXTRACTOR_ORDER_PATH", str(path))
+    extract_preview._load_extractor_order.cache_clear()
+
+
+class TestExtractorOrder:
+    def test_defaults_without_order_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(extract_preview, "EXTRACTOR_ORDER_PATH", str(tmp_path / "missing.json"))
+        extract_preview._load_extractor_order.cache_clear()
+        assert extract_preview.extractor_order("https://example.com/a") == extract_preview.DEFAULT_ORDER
+
+    def test_learned_order_applies_to_domain_and_subdomains(self, tmp_path, monkeypatch):
+        _write_order(tmp_path, monkeypatch, {"default": ["readability"], "domains": {"reuters.com": ["jina", "bogus"]}})
+        assert extract_preview.extractor_order("https://www.reuters.com/a") == ("jina", "trafilatura", "readability")
+        assert extract_preview.extractor_order("https://graphics.reuters.com/a") == ("jina", "trafilatura", "readability")
+        assert extract_preview.extractor_order("https://apnews.com/a") == ("readability", "trafilatura", "jina")
+
+
+class TestExtractPreview:
+    def test_fetches_once_and_falls_through_to_a_working_extractor(self, tmp_path, monkeypatch):
+        _write_order(tmp_path, monkeypatch, {"domains": {}})
+        fetched: list[str] = []
+        monkeypatch.setattr(extract_preview, "_fetch_page", lambda url: fetched.append(url) or "<html></html>")
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "trafilatura", lambda html: "")
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "readability", lambda html: ARTICLE)
+        result = extract_preview.extract_preview("https://example.com/story")
+        assert result["preview_source"] == "readability"
+        assert result["preview"].startswith("Venezuela's oil output rose")
+        assert fetched == ["https://example.com/story"]
+
+    def test_first_extractor_with_text_wins_even_if_it_is_noise(self, tmp_path, monkeypatch):
+        _write_order(tmp_path, monkeypatch, {"domains": {}})
+        jina_calls: list[str] = []
+        monkeypatch.setattr(extract_preview, "_fetch_page", lambda url: "<html></html>")
+        monkeypatch.setattr(extract_preview, "_extract_with_jina", lambda url: jina_calls.append(url) or ARTICLE)
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "trafilatura", lambda html: "Subscribe")
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "readability", lambda html: ARTICLE)
+        assert extract_preview.extract_preview("https://example.com/story") == {"preview": "", "preview_source": "none"}
+
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "trafilatura", lambda html: "")
+        monkeypatch.setitem(extract_preview.HTML_EXTRACTORS, "readability", lambda html: "  ")
+        assert extract_preview.extract_preview("https://example.com/story")["preview_source"] == "jina"
+        # Jina is only asked once both HTML extractors came back empty.
+        assert jina_calls == ["https://example.com/story"]
+
+    def test_returns_none_when_every_extractor_fails(self, tmp_path, monkeypatch):
+        _write_order(tmp_path, monkeypatch, {"domains": {}})
+
+        def boom(url):
+            raise OSError("offline")
+
+        monkeypatch.setattr(extract_preview, "_fetch_page", boom)
+        monkeypatch.setattr(extract_preview, "_extract_with_jina", boom)
+        assert extract_preview.extract_preview("https://example.com/story") == {"preview": "", "preview_source": "none"}
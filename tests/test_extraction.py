@@ -0,0 +1,53 @@
+"""
+Tests for benchmarks/extraction.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import extraction
+
+PAGE = (
+    "<html><body><nav>Home | News | Subscribe</nav><article>"
+    "<p>Venezuela's oil output rose to 900,000 barrels per day in May, according to OPEC secondary sources. "
+    "The increase follows new licences granted to foreign partners in the Orinoco belt.</p>"
+    "<p>Analysts expect further gains if sanctions relief holds through the rest of the year.</p>"
+    "</article></body></html>"
+)
+
+
+def _stats(pages: int, median_ms: float, acceptance: float) -> dict:
+    return {"pages": pages, "median_ms": median_ms, "peak_kb": 1.0, "acceptance": acceptance}
+
+
+class TestExtractionBenchmark:
+    def test_runs_every_extractor_over_a_directory_corpus(self, tmp_path):
+        (tmp_path / "example.com").mkdir()
+        (tmp_path / "example.com" / "story.html").write_text(PAGE, encoding="utf-8")
+        pages = extraction.load_corpus(str(tmp_path))
+        assert [(name, url) for name, url, _ in pages] == [("example.com/story.html", "https://example.com/story.html")]
+        results = extraction.run_benchmark(pages, list(extraction.EXTRACTORS))
+        assert set(results) == set(extraction.EXTRACTORS)
+        assert results["regex"]["domains"]["example.com"]["pages"] == 1
+        assert results["regex"]["overall"]["acceptance"] == 1.0
+
+    def test_learn_order_prefers_cheapest_working_extractor(self):
+        results = {
+            "trafilatura": {
+                "overall": _stats(10, 5.0, 0.9),
+                "domains": {"slow.com": _stats(5, 9.0, 1.0), "few.com": _stats(2, 1.0, 1.0)},
+            },
+            "readability": {
+                "overall": _stats(10, 3.0, 0.5),
+                "domains": {"slow.com": _stats(5, 2.0, 0.0), "few.com": _stats(2, 0.5, 1.0)},
+            },
+            "regex": {"overall": _stats(10, 0.1, 1.0), "domains": {}},
+        }
+        order = extraction.learn_order(results, min_pages=3)
+        # 5.0/0.9 = 5.6 per accepted preview beats 3.0/0.5 = 6.0; regex is not available to extract_preview.
+        assert order["default"] == ["trafilatura", "readability", "jina"]
+        # readability never succeeds on slow.com; few.com has too few pages for its own order.
+        assert order["domains"] == {}
+        results["readability"]["domains"]["slow.com"] = _stats(5, 2.0, 0.5)
+        assert extraction.learn_order(results)["domains"] == {"slow.com": ["readability", "trafilatura", "jina"]}
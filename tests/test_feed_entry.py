@@ -0,0 +1,41 @@
+"""
+Tests for scripts/feed_entry.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+from feed_entry import FeedEntry
+
+
+class TestFeedEntry:
+    def test_behaves_like_a_dict(self):
+        entry = FeedEntry(title="Venezuela oil", link="https://example.com/a")
+        assert entry["title"] == "Venezuela oil"
+        assert entry.get("summary", "") == ""
+        assert "summary" not in entry
+        entry["summary"] = "Text"
+        assert "summary" in entry
+        assert entry == {"title": "Venezuela oil", "link": "https://example.com/a", "summary": "Text"}
+        with pytest.raises(KeyError):
+            entry["article_text"]
+
+    def test_unknown_keys_are_kept(self):
+        entry = FeedEntry(title="t")
+        entry["feedburner:origLink"] = "https://example.com/b"
+        assert entry.get("feedburner:origLink") == "https://example.com/b"
+        assert entry.setdefault("title", "other") == "t"
+        assert entry.pop("feedburner:origLink") == "https://example.com/b"
+        assert entry.keys() == ["title"]
+
+    def test_repeated_source_strings_are_interned(self):
+        url = "".join(["https://example.com/", "rss"])
+        first = FeedEntry(source_url=url)
+        second = FeedEntry(source_url="".join(["https://example.com/", "rss"]))
+        assert first["source_url"] is second["source_url"]
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(FeedEntry(), "__dict__")
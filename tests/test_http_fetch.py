@@ -0,0 +1,75 @@
+"""
+Tests for scripts/http_fetch.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import http_fetch as hf
+
+
+class FakeResponse:
+    def __init__(self, chunks, content_type="text/html; charset=utf-8", status_code=200, url="https://example.com/a"):
+        self.chunks = chunks
+        self.headers = {"content-type": content_type}
+        self.status_code = status_code
+        self.url = url
+        self.encoding = "utf-8"
+        self.read_chunks = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for chunk in self.chunks:
+            self.read_chunks += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamText:
+    def test_caps_body_at_max_bytes(self, monkeypatch):
+        response = FakeResponse([b"a" * 100, b"b" * 100, b"c" * 100])
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        final_url, text = hf.stream_text("https://example.com/a", timeout=1, max_bytes=150)
+        assert final_url == "https://example.com/a"
+        assert text == "a" * 100 + "b" * 50
+        assert response.read_chunks == 2
+        assert response.closed
+
+    def test_rejects_content_type_before_reading(self, monkeypatch):
+        response = FakeResponse([b"%PDF-1.7"], content_type="application/pdf")
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        _, text = hf.stream_text("https://example.com/a", timeout=1)
+        assert text == ""
+        assert response.read_chunks == 0
+
+    def test_stop_callback_ends_download(self, monkeypatch):
+        chunk = b"x" * hf.CHUNK_SIZE
+        response = FakeResponse([chunk] * 10)
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        _, text = hf.stream_text("https://example.com/a", timeout=1, max_bytes=10 * hf.CHUNK_SIZE, stop=lambda t: True)
+        assert len(text) == hf.CHUNK_SIZE
+        assert response.read_chunks == 1
+
+    def test_multibyte_characters_split_across_chunks(self, monkeypatch):
+        encoded = "Bolívar".encode("utf-8")
+        response = FakeResponse([encoded[:4], encoded[4:]])
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        _, text = hf.stream_text("https://example.com/a", timeout=1)
+        assert text == "Bolívar"
+
+    def test_unknown_charset_decodes_as_utf8(self, monkeypatch):
+        response = FakeResponse(["Bolívar".encode("utf-8")], content_type="text/html; charset=utf8mb4")
+        response.encoding = "utf8mb4"
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        _, text = hf.stream_text("https://example.com/a", timeout=1)
+        assert text == "Bolívar"
+
+    def test_missing_content_type_can_be_rejected(self, monkeypatch):
+        response = FakeResponse([b"<html></html>"], content_type="")
+        monkeypatch.setattr(hf.requests, "get", lambda *a, **kw: response)
+        assert hf.stream_text("https://example.com/a", timeout=1)[1] == "<html></html>"
+        _, text = hf.stream_text("https://example.com/a", timeout=1, allow_missing_content_type=False)
+        assert text == ""
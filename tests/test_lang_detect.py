@@ -0,0 +1,27 @@
+"""
+Tests for scripts/lang_detect.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import lang_detect as ld
+
+
+class TestDetectLanguage:
+    def test_spanish_and_english(self):
+        assert ld.detect_language("El gobierno de Venezuela anunció una reforma para la economía") == "es"
+        assert ld.detect_language("The government of Venezuela announced a reform for the economy") == "en"
+
+    def test_empty_and_non_latin(self):
+        assert ld.detect_language("", "") == "other"
+        assert ld.detect_language("12345") == "other"
+
+    def test_markup_is_ignored(self):
+        assert ld.detect_language("<p>The oil market &amp; the sanctions</p>") == "en"
+
+    def test_entry_language_uses_title_summary_snippet(self):
+        entry = {"title": "Sanciones", "summary": "El mercado de petróleo en Venezuela", "snippet": ""}
+        assert ld.entry_language(entry) == "es"
+        assert ld.entry_language(entry) == ld.detect_language("Sanciones", "El mercado de petróleo en Venezuela", "")
@@ -0,0 +1,43 @@
+"""
+Tests for scripts/lazy_import.py
+"""
+
+import os
+import subprocess
+import sys
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+from lazy_import import LazyModule, lazy_import
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+
+class TestLazyImport:
+    def test_returns_already_imported_module(self):
+        assert lazy_import("json") is sys.modules["json"]
+
+    def test_imports_on_first_attribute_access(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        module = lazy_import("colorsys")
+        assert isinstance(module, LazyModule)
+        assert "colorsys" not in sys.modules
+        assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert isinstance(sys.modules["colorsys"], types.ModuleType)
+
+    def test_attribute_writes_reach_the_real_module(self, monkeypatch):
+        import colorsys
+
+        module = LazyModule("colorsys")
+        monkeypatch.setattr(module, "ONE_THIRD", 0.5)
+        assert colorsys.ONE_THIRD == 0.5
+
+
+class TestCollectorImports:
+    def test_collector_import_does_not_load_heavy_dependencies(self):
+        probe = (
+            "import sys; sys.path.insert(0, %r); import collect_rfps, build_pdf_publications, build_bd_opps; "
+            "print(','.join(m for m in ('feedparser', 'requests', 'yaml', 'dateutil', 'trafilatura', 'bs4') if m in sys.modules))"
+        ) % SCRIPTS_DIR
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
@@ -0,0 +1,35 @@
+"""
+Tests for benchmarks/microbench.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import microbench
+
+
+class TestCorpus:
+    def test_entries_are_deterministic(self):
+        first = microbench.make_entries(50, seed=3)
+        second = microbench.make_entries(50, seed=3)
+        assert [entry.to_dict() for entry in first] == [entry.to_dict() for entry in second]
+        assert any(entry["title"].endswith(" - update") for entry in first)
+
+
+class TestSuite:
+    def test_every_benchmark_runs_on_a_small_corpus(self):
+        payload = microbench.run_suite([40], list(microbench.BENCHMARKS), repeat=1)
+        assert set(payload["results"]) == set(microbench.BENCHMARKS)
+        assert all(result["40"]["median_s"] >= 0 for result in payload["results"].values())
+
+    def test_compare_flags_only_real_regressions(self):
+        baseline = {"results": {"a": {"1000": {"median_s": 0.100}}, "b": {"1000": {"median_s": 0.0001}}}}
+        current = {
+            "results": {
+                "a": {"1000": {"median_s": 0.130}, "10000": {"median_s": 1.0}},
+                "b": {"1000": {"median_s": 0.0005}},
+            }
+        }
+        assert microbench.compare(baseline, current, threshold=0.15) == ["a @ 1000: 100.00 ms -> 130.00 ms (+30%)"]
+        assert microbench.compare(baseline, current, threshold=0.5) == []
@@ -0,0 +1,117 @@
+"""
+Tests for scripts/opp_store.py and its use in scripts/build_bd_opps.py
+"""
+
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import build_bd_opps
+import opp_store
+
+
+def _opp(opp_id, published, deadline=""):
+    return {"id": opp_id, "publishedAt": published, "deadline": deadline, "score": 3}
+
+
+class TestOpportunityStore:
+    def test_expiry_windows_and_round_trip(self, tmp_path):
+        store = opp_store.OpportunityStore()
+        store.put("a", "fa", _opp("a", "2026-05-01"), "2026-05-20", "2026-06-01")
+        store.put("b", "fb", _opp("b", "2026-03-01"), "", "2026-06-01")
+        store.put("c", "fc", _opp("c", "2026-05-10"), "2026-07-01", "2026-06-01")
+        # Re-stored with new text: keeps its place, old index entries are skipped.
+        store.put("c", "fc2", _opp("c", "2026-05-15"), "2026-07-02", "2026-06-01")
+
+        path = str(tmp_path / "store.json")
+        store.save(path)
+        store = opp_store.OpportunityStore.load(path)
+
+        assert store.expire("2026-06-01") == ["a"]
+        assert store.known("a", "fa", "2026-06-02")
+        assert [opp["id"] for opp in store.published_since("2026-01-01")] == ["b", "c"]
+        assert store.prune_published_before("2026-04-01") == 1
+        assert [opp["id"] for opp in store.published_since("2026-01-01")] == ["c"]
+        assert store.expire("2026-07-02") == []
+        assert not store.known("c", "fc", "2026-06-02")
+        assert store.prune_rejected("2026-06-02") == 0
+        assert store.prune_rejected("2026-06-03") == 1
+
+
+class TestBuildBdOppsDates:
+    def test_partial_feed_dates_are_left_blank(self):
+        assert build_bd_opps._entry_date_iso({"published": "Fri, 06 Mar 2026 14:03:12 +0000"}) == "2026-03-06"
+        assert build_bd_opps._entry_date_iso({"updated": "2026-02-20T10:00:00-04:00"}) == "2026-02-20"
+        for partial in ("2025", "March", "Monday"):
+            assert build_bd_opps._entry_date_iso({"published": partial}) == ""
+            assert build_bd_opps._parse_iso_date(partial) == datetime.date.min
+
+
+class TestBuildBdOppsIncremental:
+    def test_only_new_or_changed_items_are_scored(self, tmp_path, monkeypatch):
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        items = [
+            {
+                "id": str(index),
+                "title": f"Venezuela tender notice {index}: request for proposal",
+                "url": f"https://ungm.org/notice/{index}",
+                "publishedAt": (today - datetime.timedelta(days=index)).isoformat(),
+                "preview": "UNDP invites bids for consultancy services in Caracas. Submit before the closing date.",
+            }
+            for index in range(1, 4)
+        ]
+        scored: list[str] = []
+        original_score = build_bd_opps.score_opp
+
+        def counting_score(text):
+            scored.append(text)
+            return original_score(text)
+
+        monkeypatch.setattr(build_bd_opps, "score_opp", counting_score)
+        monkeypatch.setattr(build_bd_opps, "_bd_feed_urls", lambda path: [])
+        monkeypatch.setattr(build_bd_opps, "_extract_feed_items", lambda urls: [])
+        monkeypatch.setattr(build_bd_opps, "OUT_JSON", str(tmp_path / "bd_opps.json"))
+        monkeypatch.setattr(build_bd_opps, "STORE_PATH", str(tmp_path / "store.json"))
+
+        first = build_bd_opps.main(latest={"items": items})
+        assert [opp["id"] for opp in first["opportunities"]] == ["1", "2", "3"]
+        assert len(scored) == 3
+
+        items[1] = {**items[1], "preview": items[1]["preview"] + " Deadline: 2099-01-01"}
+        second = build_bd_opps.main(latest={"items": items[1:]})
+        assert len(scored) == 4
+        # Item 1 dropped out of the feeds, so it is no longer published.
+        assert [opp["id"] for opp in second["opportunities"]] == ["2", "3"]
+        assert second["opportunities"][0]["deadline"] == "2099-01-01"
+
+        third = build_bd_opps.main(latest={"items": items})
+        assert len(scored) == 4
+        assert [opp["id"] for opp in third["opportunities"]] == ["1", "2", "3"]
+
+    def test_redated_items_are_rejudged_and_failing_copies_are_not_listed(self, tmp_path, monkeypatch):
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        item = {
+            "id": "1",
+            "title": "Venezuela tender notice: request for proposal",
+            "url": "https://ungm.org/notice/1",
+            "publishedAt": "",
+            "preview": "UNDP invites bids for consultancy services in Caracas. Submit before the closing date.",
+        }
+        monkeypatch.setattr(build_bd_opps, "_bd_feed_urls", lambda path: [])
+        monkeypatch.setattr(build_bd_opps, "_extract_feed_items", lambda urls: [])
+        monkeypatch.setattr(build_bd_opps, "OUT_JSON", str(tmp_path / "bd_opps.json"))
+        monkeypatch.setattr(build_bd_opps, "STORE_PATH", str(tmp_path / "store.json"))
+
+        assert build_bd_opps.main(latest={"items": [item]})["count"] == 0
+        dated = {**item, "publishedAt": today.isoformat()}
+        assert build_bd_opps.main(latest={"items": [dated]})["count"] == 1
+
+        # An undated copy under the same URL and title fails the filters on its own.
+        thin_copy = {**dated, "publishedAt": "", "preview": "Caracas."}
+        assert build_bd_opps.main(latest={"items": [thin_copy]})["count"] == 0
+        store = opp_store.OpportunityStore.load(str(tmp_path / "store.json"))
+        assert len(store.opportunities) == 1
+        # Ahead of the accepted copy it neither blocks nor replaces it.
+        output = build_bd_opps.main(latest={"items": [thin_copy, dated]})
+        assert [opp["id"] for opp in output["opportunities"]] == ["1"]
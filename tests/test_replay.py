@@ -0,0 +1,96 @@
+"""
+Tests for benchmarks/replay.py
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import feedparser
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import replay
+
+FEED_URL = "https://feeds.example.org/rss"
+ARTICLE_URL = "https://news.example.org/story?id=7"
+FEED_XML = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>Example</title>'
+    "<item><title>Caracas port reopens</title><link>https://news.example.org/story?id=7</link>"
+    "<pubDate>Mon, 01 Jun 2026 12:00:00 +0000</pubDate></item>"
+    "</channel></rss>"
+).encode("utf-8")
+
+
+def _archive() -> replay.Archive:
+    archive = replay.Archive(recorded_at="2026-06-01T12:00:00+00:00")
+    archive.add("GET", FEED_URL, 200, FEED_URL, {"Content-Type": "application/rss+xml"}, FEED_XML)
+    archive.add("GET", ARTICLE_URL, 200, "https://news.example.org/final", {"Content-Type": "text/html"}, b"<p>hi</p>")
+    return archive
+
+
+class TestArchive:
+    def test_round_trip_and_copy_lookup(self, tmp_path):
+        path = str(tmp_path / "archive.json.gz")
+        _archive().save(path)
+        loaded = replay.Archive.load(path)
+        record, copy = loaded.lookup("HEAD", replay.with_copy(ARTICLE_URL, 3))
+        assert copy == 3
+        assert record["url"] == "https://news.example.org/final"
+        assert replay.split_copy(replay.with_copy(ARTICLE_URL, 3)) == (ARTICLE_URL, 3)
+
+    def test_rewrite_feed_tags_copies_and_shifts_dates(self):
+        body = replay.rewrite_feed(FEED_XML, copy=2, shift=timedelta(days=10)).decode("utf-8")
+        assert "Caracas port reopens · 2</title>" in body
+        assert "<title>Example</title>" in body
+        assert "<link>https://news.example.org/story?id=7&amp;replay_copy=2</link>" in body
+        assert "11 Jun 2026 12:00:00" in body
+
+    def test_scale_feed_lines_keeps_names_and_comments(self):
+        lines = ["# comment", "Example - https://feeds.example.org/rss", "https://plain.example.org/rss"]
+        scaled = replay.scale_feed_lines(lines, 2)
+        assert scaled == [
+            "# comment",
+            "Example - https://feeds.example.org/rss",
+            "Example (copy 1) - https://feeds.example.org/rss?replay_copy=1",
+            "https://plain.example.org/rss",
+            "https://plain.example.org/rss?replay_copy=1",
+        ]
+
+
+class TestStandInServer:
+    def test_routes_requests_and_feedparser_to_archive(self):
+        shift = datetime(2026, 6, 11, 12, tzinfo=timezone.utc) - datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+        with replay.StandInServer(_archive(), shift=shift) as server, replay.routed_to(server):
+            response = requests.get(replay.with_copy(ARTICLE_URL, 1), timeout=5)
+            assert response.text == "<p>hi</p>"
+            assert response.url == "https://news.example.org/final?replay_copy=1"
+            assert requests.get("https://unknown.example.org/", timeout=5).status_code == 404
+            parsed = feedparser.parse(replay.with_copy(FEED_URL, 1))
+        assert parsed.entries[0].title == "Caracas port reopens · 1"
+        assert parsed.entries[0].published_parsed[:3] == (2026, 6, 11)
+        assert server.stats["requests"] == 3
+        assert server.stats["misses"] == 1
+
+    def test_injected_failures_are_deterministic(self):
+        archive = _archive()
+        with replay.StandInServer(archive, failure_rate=1.0, seed=4) as server, replay.routed_to(server):
+            outcomes = []
+            for _ in range(2):
+                try:
+                    outcomes.append(requests.get(ARTICLE_URL, timeout=5).status_code)
+                except requests.ConnectionError:
+                    outcomes.append("dropped")
+        assert outcomes[0] == outcomes[1]
+        assert outcomes[0] in (503, "dropped")
+        assert server.stats["failures"] == 2
+
+    def test_patches_are_removed_on_exit(self):
+        send = requests.adapters.HTTPAdapter.send
+        parse = feedparser.parse
+        with pytest.raises(RuntimeError):
+            with replay.StandInServer(_archive()) as server, replay.routed_to(server):
+                raise RuntimeError("boom")
+        assert requests.adapters.HTTPAdapter.send is send
+        assert feedparser.parse is parse
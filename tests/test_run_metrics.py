@@ -0,0 +1,48 @@
+"""
+Tests for scripts/run_metrics.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import run_metrics
+
+
+class TestSpans:
+    def setup_method(self):
+        run_metrics.reset()
+
+    def test_nested_span_time_is_excluded_from_self_time(self):
+        with run_metrics.span("outer"):
+            with run_metrics.span("inner"):
+                time.sleep(0.02)
+        stages = run_metrics.snapshot()["stages"]
+        assert list(stages) == ["outer", "inner"]
+        assert stages["outer"]["wall_s"] >= 0.02
+        assert stages["outer"]["self_s"] < 0.01
+        assert stages["inner"]["calls"] == 1
+
+    def test_counters_go_to_innermost_span_and_host(self):
+        run_metrics.count("loose")
+        with run_metrics.span("fetch"):
+            run_metrics.count("http_requests", host="example.com")
+            run_metrics.count("http_bytes", 512, host="example.com")
+        payload = run_metrics.snapshot()
+        assert payload["stages"]["fetch"]["counters"] == {"http_requests": 1, "http_bytes": 512}
+        assert payload["hosts"] == {"example.com": {"http_bytes": 512, "http_requests": 1}}
+        assert payload["counters"] == {"loose": 1}
+
+    def test_iter_span_times_each_pull(self):
+        assert list(run_metrics.iter_span(iter([1, 2, 3]), "stage")) == [1, 2, 3]
+        assert run_metrics.snapshot()["stages"]["stage"]["calls"] == 4
+
+    def test_profiles_written_per_outermost_span(self, tmp_path):
+        run_metrics.reset(str(tmp_path))
+        with run_metrics.span("collect"):
+            with run_metrics.span("filter"):
+                sum(range(1000))
+        written = run_metrics.dump_profiles()
+        assert sorted(os.path.basename(path) for path in written) == ["collect.prof", "collect.txt"]
+        run_metrics.reset()
@@ -0,0 +1,73 @@
+"""
+Tests for scripts/run_pipeline.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import run_pipeline
+
+
+class TestSelectStages:
+    def test_keeps_dependency_order(self):
+        assert run_pipeline.select_stages(["exec_brief", "collect"], []) == ["collect", "exec_brief"]
+        assert "collect" not in run_pipeline.select_stages([], ["collect", "imf"])
+
+    def test_rejects_unknown_stage(self):
+        with pytest.raises(ValueError):
+            run_pipeline.select_stages(["nope"], [])
+
+
+class TestRunPipeline:
+    def test_passes_outputs_in_memory_and_skips_dependents_of_failures(self, tmp_path, monkeypatch):
+        seen: dict[str, object] = {}
+
+        def collect(state):
+            return {"sectors": []}
+
+        def pdfs(state):
+            seen["pdf_latest"] = state.get("collect")
+            raise RuntimeError("boom")
+
+        def exec_brief(state):
+            seen["exec_ran"] = True
+
+        def bd(state):
+            seen["bd_latest"] = state.get("collect")
+
+        monkeypatch.setattr(
+            run_pipeline,
+            "STAGES",
+            {
+                "collect": ((), collect),
+                "pdf_publications": (("collect",), pdfs),
+                "bd_opps": (("collect",), bd),
+                "exec_brief": (("collect", "pdf_publications"), exec_brief),
+            },
+        )
+        monkeypatch.setattr(run_pipeline, "EXTERNAL_STAGES", {})
+        monkeypatch.setattr(run_pipeline.collect_rfps, "DATA_DIR", str(tmp_path))
+        outcomes = run_pipeline.run_pipeline(["collect", "pdf_publications", "bd_opps", "exec_brief"])
+        assert outcomes == {"collect": "ok", "pdf_publications": "failed", "bd_opps": "ok", "exec_brief": "skipped"}
+        assert seen == {"pdf_latest": {"sectors": []}, "bd_latest": {"sectors": []}}
+
+    def test_shared_feed_cache_parses_each_url_once(self, monkeypatch):
+        calls: list[str] = []
+
+        def fake_parse(source, *args, **kwargs):
+            calls.append(source)
+            return {"source": source}
+
+        monkeypatch.setattr(run_pipeline.feedparser, "parse", fake_parse)
+        with run_pipeline.shared_feed_cache() as cache:
+            first = run_pipeline.feedparser.parse("https://example.com/rss", request_headers={"User-Agent": "a"})
+            second = run_pipeline.feedparser.parse("https://example.com/rss")
+            run_pipeline.feedparser.parse("<rss></rss>")
+            run_pipeline.feedparser.parse("<rss></rss>")
+        assert first is second
+        assert calls == ["https://example.com/rss", "<rss></rss>", "<rss></rss>"]
+        assert list(cache) == ["https://example.com/rss"]
+        assert run_pipeline.feedparser.parse is fake_parse
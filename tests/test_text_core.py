@@ -0,0 +1,39 @@
+"""
+Tests for scripts/text_core.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import text_core as tc
+
+
+class TestNormalizeTextBlock:
+    def test_strips_tags_entities_and_whitespace(self):
+        assert tc.normalize_text_block("<p>Oil &amp; gas</p>\n\n  output") == "Oil & gas output"
+        assert tc.normalize_text_block("") == ""
+
+    def test_long_inputs_bypass_memo(self):
+        text = "word " * (tc.MEMO_MAX_CHARS // 5 + 10)
+        assert tc.normalize_text_block(text) == text.strip()
+
+
+class TestSplitSentences:
+    def test_default_boundary_needs_capital(self):
+        assert tc.split_sentences("Oil rose. Prices fell. 40% of output") == ["Oil rose.", "Prices fell. 40% of output"]
+
+    def test_digit_boundary(self):
+        parts = tc.split_sentences("Prices fell. 40% of output", tc.SENTENCE_BOUNDARY_WITH_DIGITS_RE)
+        assert parts == ["Prices fell.", "40% of output"]
+
+
+class TestMarkers:
+    def test_any_marker_matches_as_substring(self):
+        pattern = tc.compile_markers(["sign in", "a lock ( ) or https://", "then $"])
+        assert tc.has_marker(pattern, "please sign in to continue")
+        assert tc.has_marker(pattern, "trial then $5")
+        assert not tc.has_marker(pattern, "signing")
+
+    def test_empty_marker_list_never_matches(self):
+        assert not tc.has_marker(tc.compile_markers([]), "anything")
@@ -0,0 +1,41 @@
+"""
+Tests for scripts/url_analysis.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import url_analysis as ua
+
+
+class TestParseUrl:
+    def test_fields(self):
+        parsed = ua.parse_url("HTTPS://www.Example.com/News/2026/01/05/Port-Deal/?utm_source=x&id=3")
+        assert parsed.ok
+        assert parsed.host == "example.com"
+        assert parsed.segments == ("news", "2026", "01", "05", "port-deal")
+        assert parsed.canonical == "https://example.com/News/2026/01/05/Port-Deal?id=3"
+
+    def test_homepage_and_section_pages(self):
+        assert ua.parse_url("https://example.com/").is_homepage
+        assert ua.parse_url("https://example.com/news").is_homepage
+        assert not ua.parse_url("https://example.com/news?id=4").is_homepage
+
+    def test_unparsable_url(self):
+        parsed = ua.parse_url("http://[::1/a")
+        assert not parsed.ok
+        assert parsed.canonical == "http://[::1/a"
+        assert parsed.is_homepage
+
+    def test_is_cached(self):
+        assert ua.parse_url("https://example.com/a/b") is ua.parse_url("https://example.com/a/b")
+
+
+class TestDomainIn:
+    def test_exact_and_subdomain(self):
+        domains = frozenset({"ft.com", "reuters.com"})
+        assert ua.domain_in("ft.com", domains)
+        assert ua.domain_in("markets.ft.com", domains)
+        assert not ua.domain_in("aft.com", domains)
+        assert not ua.domain_in("", domains)